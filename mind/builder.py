@@ -8,7 +8,8 @@ and instances file (which describing real world problem).
 import logging
 import math
 
-from mind.gas import MembranesDesignGas
+from mind.datacache import model_key, model_keys, parsed_data
+from mind.gas import MembranesDesignGas, MembranesDesignGasComponentFlows
 
 # logging variable
 logger = logging.getLogger(__name__)
@@ -49,15 +50,44 @@ class Configuration():
             init_status (dict) : datastruct that manipulate informations about
             which varaibles are initialized initially by users
 
+            labels (`mind.snapshot.VariableLabels`) : `ComponentUID` labels
+            of model's variables, generated when looked up
+
+            layout (`mind.snapshot.VariableLayout`) : variables order of the
+            model's instance, used to store solutions (set with labels)
+
             pressure_ratio (`Float`) : Thresold value for model's variable
              relative to pressure (`default = 0.03`)
 
             epsilon (dict) : Default Thresolds values using in algorithms (`mind.solve`)
 
+            alias_cells (`Bool`) : `True` if inputs of cells (`Feed_cell`,
+            `XIN_cell`) are expressions of the previous cell's retentate (or
+            membrane's inputs) instead of variables linked by equality
+            constraints (`default = False`)
+
+            component_flows (`Bool`) : `True` if cells are modelled with
+            component flows instead of flows and fractions
+            (`mind.gas.MembranesDesignGasComponentFlows`, `default = False`)
+
+            binary_mixture (`Bool`) : `True` if the mixture has two components
+            and only one fraction variable by cell is kept (`default = False`)
+
+            collocation (`Int`) : number of Radau collocation points by finite
+            element of membranes (`default = 0`, membranes are splitted into
+            equal cells, see `mind.collocation`)
+
+            finite_elements (`Int`) : number of finite elements of membranes
+            with collocation (`default = 5`)
+
+            pickle_data (`Bool`) : `True` if parsed datafiles are also stored
+            in pickles next to them (`default = False`, see `mind.datacache`)
+
         Notes:
             - Membranes'area are splitted into small cells (method: `discretise_membrane`)
             - `self.discretisation` (`List[Int]`): datastruct manipulating
             information on membrane's area discretisation into small cells
+            (collocation points with `collocation`)
 
         """
 
@@ -80,7 +110,13 @@ class Configuration():
                      'perm_ref': 0.1,
                      'alpha': 0.1,
                      'delta': 0.1
-                 }):
+                 },
+                 alias_cells=False,
+                 component_flows=False,
+                 binary_mixture=False,
+                 collocation=0,
+                 finite_elements=5,
+                 pickle_data=False):
         # Initialization
         self.num_membranes = num_membranes
         self.lb_area, self.ub_area, self.ub_acell = Configuration.default_bounds(
@@ -108,9 +144,21 @@ class Configuration():
         self.fixing_var = fixing_var
         self.init_status = init_status
         self.labels = None
+        self.layout = None
 
         self.pressure_ratio = pressure_ratio
         self.epsilon = epsilon
+        self.alias_cells = alias_cells
+        self.component_flows = component_flows
+        if binary_mixture and component_flows:
+            logger.exception("Binary mixture formulation is not available "
+                             "with component flows")
+            raise ValueError("binary_mixture and component_flows can't be "
+                             "used together")
+        self.binary_mixture = binary_mixture
+        self.collocation = collocation
+        self.finite_elements = finite_elements
+        self.pickle_data = pickle_data
 
         # creation of discretisation table
         self.discretisation = []
@@ -154,6 +202,11 @@ class Configuration():
 
     def discretise_membrane(self):
         """Discretise each membranes's area surface into small cells."""
+        if self.collocation:
+            # collocation points of all finite elements
+            self.discretisation = [self.collocation * self.finite_elements
+                                  ] * self.num_membranes
+            return
         self.discretisation = [mem + 1 for mem in range(self.num_membranes)]
         # initialisation of discretisation with the formula below
         for mem in range(self.num_membranes):
@@ -195,7 +248,12 @@ def build_model(parameter, fname, perm_filename, fname_eco, log_dir: str, fname_
 
     # loading permeability parameter informations
     try:
-        permeability_data = parse_permeability_data(perm_filename, parameter)
+        permeability_data = parsed_data.load(
+            'permeability_variable'
+            if parameter.variable_perm else 'permeability_fixed',
+            perm_filename,
+            lambda filename: parse_permeability_data(filename, parameter),
+            parameter.pickle_data)
     except Exception:
         logger.exception('Error in Permeability datafile lecture : %s',
                          perm_filename)
@@ -207,7 +265,12 @@ def build_model(parameter, fname, perm_filename, fname_eco, log_dir: str, fname_
 
         # TODO: check if liquid or not
         try:
-            modelisation = MembranesDesignGas(parameter, permeability_data, fname_eco, log_dir)
+            if parameter.component_flows:
+                gas_model = MembranesDesignGasComponentFlows
+            else:
+                gas_model = MembranesDesignGas
+            modelisation = gas_model(parameter, permeability_data, fname_eco,
+                                     log_dir)
             assert modelisation.abstractModel is not None
         except Exception:
             logger.exception('Model object creation failed')
@@ -221,6 +284,8 @@ def build_model(parameter, fname, perm_filename, fname_eco, log_dir: str, fname_
             modelisation.create_process_model()
             logger.info("Instantiation  of the model object ...")
             modelisation.create_process_instance(fname)
+            model_keys[modelisation.instance] = model_key(
+                parameter, fname, perm_filename, fname_eco)
         return modelisation
 
 
@@ -0,0 +1,171 @@
+"""Orthogonal collocation discretisation of membranes.
+
+Instead of a chain of equal cells, the axial profile of a membrane
+(normalized area `z` in [0, 1]) is approximated on a few finite elements,
+by polynomials collocated at Radau points (`Configuration.collocation`
+points by element, `Configuration.finite_elements` elements).
+
+Cells variables of the model are kept : "cell" i is the collocation point
+i, `Flux_RET_cell` / `X_RET_cell` are the retentate at the point,
+`X_PERM_cell` the local permeate composition and `Flux_PERM_cell` the
+permeate flow of the quadrature weight of the point. Cells balances are
+replaced by collocation equations (derivative of retentate flows) and the
+area of a cell by the area of the point's weight. With one point by
+element, the scheme is the cells model.
+"""
+
+import logging
+
+import numpy as np
+from numpy.polynomial import legendre
+from numpy.polynomial import polynomial
+
+# logging variable
+logger = logging.getLogger(__name__)
+logger.setLevel(level=logging.DEBUG)
+handler = logging.StreamHandler()
+# handler = logging.FileHandler(filename)
+logger.addHandler(handler)
+formatter = logging.Formatter(fmt='[%(asctime)s] %(levelname)s : %(message)s',
+                              datefmt='%a, %d %b %Y %H:%M:%S')
+handler.setFormatter(formatter)
+
+
+def collocation_scheme(parameter):
+    """Collocation scheme of a design process configuration.
+
+    Args:
+        parameter (`mind.builder.Configuration`) : design process configuration
+
+    Returns:
+        `mind.collocation.RadauCollocation` (`None` for the cells model)
+    """
+    if not parameter.collocation:
+        return None
+    return RadauCollocation(parameter.collocation, parameter.finite_elements)
+
+
+class RadauCollocation:
+    """Radau collocation on equal finite elements of a membrane.
+
+    Attributes:
+
+        nb_points (`Int`) : number of collocation points by element
+
+        nb_elements (`Int`) : number of finite elements
+
+        points (`numpy.ndarray`) : Radau points in an element ([0, 1], the
+        last one is 1)
+
+        weights (`numpy.ndarray`) : quadrature weights of points in an
+        element (sum to 1)
+
+        coefficients (`numpy.ndarray`) : (points, points + 1) coefficients
+        of collocation equations, values at element's inlet then at points
+    """
+
+    def __init__(self, nb_points, nb_elements):
+        try:
+            assert nb_points >= 1 and nb_elements >= 1
+        except AssertionError:
+            logger.exception("Invalid collocation (%s points, %s elements)",
+                             nb_points, nb_elements)
+            raise ValueError("Collocation needs at least one point and one "
+                             "element")
+        self.nb_points = nb_points
+        self.nb_elements = nb_elements
+
+        # right Radau points : roots of P_{n-1} - P_n (on [-1, 1])
+        series = np.zeros(nb_points + 1)
+        series[nb_points - 1] = 1.
+        series[nb_points] = -1.
+        self.points = np.sort((legendre.legroots(series).real + 1) / 2)
+        self.points[-1] = 1.
+
+        # quadrature weights : integrals of Lagrange polynomials on points
+        self.weights = np.array([
+            polynomial.polyval(1., polynomial.polyint(basis))
+            for basis in self.lagrange_basis(self.points)
+        ])
+
+        # derivatives at points of Lagrange polynomials on (0, points)
+        nodes = np.concatenate(([0.], self.points))
+        derivatives = np.array([
+            polynomial.polyval(self.points, polynomial.polyder(basis))
+            for basis in self.lagrange_basis(nodes)
+        ]).T
+        # RET(inlet) - RET(point) like a cell : - weight * derivative
+        self.coefficients = -self.weights[:, None] * derivatives
+
+    @staticmethod
+    def lagrange_basis(nodes):
+        """Lagrange polynomials on nodes.
+
+        Args:
+            nodes (`numpy.ndarray`) : interpolation nodes
+
+        Returns:
+            `List` of polynomials coefficients (`numpy.polynomial`)
+        """
+        basis = []
+        for k, node in enumerate(nodes):
+            others = np.delete(nodes, k)
+            basis.append(
+                polynomial.polyfromroots(others) / np.prod(node - others))
+        return basis
+
+    def element_inlet(self, i):
+        """Index of the first point of the element of point `i` (its inlet
+        is the `Feed_cell` of this point).
+
+        Args:
+            i (`Int`) : point's index (from 1)
+
+        Returns:
+            `Int`
+        """
+        return (i - 1) // self.nb_points * self.nb_points + 1
+
+    def balance(self, i, inlet, outlet):
+        """Collocation equation's right hand side at point `i`.
+
+        Permeate flow of the point (flow of a component or total flow) is
+        `weight * -(derivative of retentate flow)`.
+
+        Args:
+
+            i (`Int`) : point's index (from 1)
+
+            inlet (`Callable`) : value at the inlet of an element, given
+            the index of its first point
+
+            outlet (`Callable`) : retentate value at a point, given its index
+
+        Returns:
+            `Pyomo` expression
+        """
+        first = self.element_inlet(i)
+        coefficients = self.coefficients[i - first].tolist()
+        return coefficients[0] * inlet(first) + sum(
+            coefficient * outlet(first + k)
+            for k, coefficient in enumerate(coefficients[1:]))
+
+    def weight(self, i):
+        """Fraction of membrane's area of point `i`.
+
+        Args:
+            i (`Int`) : point's index (from 1)
+
+        Returns:
+            `Float`
+        """
+        return float(self.weights[(i - 1) % self.nb_points] / self.nb_elements)
+
+    def positions(self):
+        """Positions of points along the membrane (normalized area).
+
+        Returns:
+            `numpy.ndarray`
+        """
+        elements = np.arange(self.nb_elements)[:, None]
+        return ((elements + self.points[None, :]) / self.nb_elements).ravel()
@@ -0,0 +1,215 @@
+"""Cache of parsed input datafiles.
+
+Instance (`DataPortal` data), permeability and economic datafiles are
+parsed once by process and kept in memory (`parsed_data`), for every model
+built on them (`mind.builder.build_model` calls of populations, coarse
+models, workers ...). An entry is keyed by file path and checked with the
+file's modification time, then with its content hash (a touched but
+unchanged file is not parsed again).
+
+Parsed data can also be kept on disk (`Configuration.pickle_data`), in a
+pickle next to the datafile, so that next runs skip text parsing too.
+
+Models' instances are keyed by their configuration and the hashes of their
+datafiles (`model_key`, kept in `model_keys` by `mind.builder.build_model`) :
+identical instances built by different runs or processes have the same key
+(see `mind.nl_template.NLStore`).
+"""
+
+import copy
+import hashlib
+import json
+import logging
+import os
+import pickle
+import weakref
+
+# logging variable
+logger = logging.getLogger(__name__)
+logger.setLevel(level=logging.DEBUG)
+handler = logging.StreamHandler()
+# handler = logging.FileHandler(filename)
+logger.addHandler(handler)
+formatter = logging.Formatter(fmt='[%(asctime)s] %(levelname)s : %(message)s',
+                              datefmt='%a, %d %b %Y %H:%M:%S')
+handler.setFormatter(formatter)
+
+# suffix of parsed data stored next to datafiles
+PICKLE_SUFFIX = '.pickle'
+
+# attributes of a configuration not changing the model's instance
+STATE_ATTRIBUTES = ('init_status', 'labels', 'layout', 'pickle_data')
+
+
+def file_hash(filename):
+    """Hash of a file's content.
+
+    Args:
+        filename (`str`) : path to the file
+
+    Returns:
+        `str` (sha1 hexadecimal digest)
+    """
+    with open(filename, 'rb') as file:
+        return hashlib.sha1(file.read()).hexdigest()
+
+
+class ParsedDataCache:
+    """Parsed datafiles by kind of data and path.
+
+    Attributes:
+
+        entries (`dict`) : (modification time, content hash, parsed data)
+        by (kind, absolute path)
+
+        nb_parsed (`Int`) : number of datafiles parsed (cache misses)
+    """
+
+    def __init__(self):
+        self.entries = {}
+        self.nb_parsed = 0
+
+    def load(self, kind, filename, parser, persistent=False):
+        """Parsed data of a datafile.
+
+        Args:
+
+            kind (`str`) : kind of data (the same file can be parsed by
+            several parsers)
+
+            filename (`str`) : path to the datafile
+
+            parser (`Callable`) : parser of the datafile, given its path
+
+            persistent (`Bool`) : `True` if parsed data are also read from
+            and stored to a pickle next to the datafile (`default = False`)
+
+        Returns:
+            copy of parsed data (can be modified by the caller)
+        """
+        path = os.path.abspath(filename)
+        key = (kind, path)
+        mtime = os.path.getmtime(path)
+        entry = self.entries.get(key)
+        if entry is None or entry[0] != mtime:
+            digest = file_hash(path)
+            if entry is not None and entry[1] == digest:
+                data = entry[2]
+            else:
+                data = None
+                if persistent:
+                    data = self.load_pickle(kind, path, digest)
+                if data is None:
+                    data = parser(filename)
+                    self.nb_parsed += 1
+                    if persistent:
+                        self.store_pickle(kind, path, digest, data)
+            entry = (mtime, digest, data)
+            self.entries[key] = entry
+        return copy.deepcopy(entry[2])
+
+    @staticmethod
+    def pickle_filename(kind, path):
+        """Path to the pickle of parsed data of a datafile.
+
+        Args:
+
+            kind (`str`) : kind of data
+
+            path (`str`) : path to the datafile
+
+        Returns:
+            `str`
+        """
+        return path + '.' + kind + PICKLE_SUFFIX
+
+    def load_pickle(self, kind, path, digest):
+        """Parsed data stored on disk, if stored for the same content.
+
+        Args:
+
+            kind (`str`) : kind of data
+
+            path (`str`) : path to the datafile
+
+            digest (`str`) : hash of datafile's content
+
+        Returns:
+            parsed data (`None` if not stored or outdated)
+        """
+        filename = self.pickle_filename(kind, path)
+        if not os.path.exists(filename):
+            return None
+        try:
+            with open(filename, 'rb') as file:
+                stored = pickle.load(file)
+        except Exception:
+            logger.warning("Invalid parsed data %s : ignored", filename)
+            return None
+        if stored.get('hash') != digest:
+            return None
+        return stored['data']
+
+    def store_pickle(self, kind, path, digest, data):
+        """Store parsed data on disk (ignored if not writable).
+
+        Args:
+
+            kind (`str`) : kind of data
+
+            path (`str`) : path to the datafile
+
+            digest (`str`) : hash of datafile's content
+
+            data : parsed data
+        """
+        filename = self.pickle_filename(kind, path)
+        # written then renamed : other processes never read a partial file
+        temporary = filename + '.' + str(os.getpid())
+        try:
+            with open(temporary, 'wb') as file:
+                pickle.dump({'hash': digest, 'data': data}, file)
+            os.replace(temporary, filename)
+        except OSError:
+            logger.warning("Parsed data can't be stored in %s", filename)
+
+    def clear(self):
+        """Remove all parsed data kept in memory."""
+        self.entries = {}
+
+
+def model_key(parameter, fname, perm_filename, fname_eco):
+    """Key of a model's instance built on a configuration and datafiles.
+
+    Args:
+
+        parameter (`mind.builder.Configuration`) : design process configuration
+
+        fname (`str`) : instance's datafile
+
+        perm_filename (`str`) : permeability datafile
+
+        fname_eco (`str`) : economic datafile
+
+    Returns:
+        `str` (sha1 hexadecimal digest)
+    """
+    configuration = {
+        attribute: value
+        for attribute, value in vars(parameter).items()
+        if attribute not in STATE_ATTRIBUTES
+    }
+    hashes = [
+        file_hash(filename) for filename in (fname, perm_filename, fname_eco)
+    ]
+    description = json.dumps([configuration, hashes],
+                             sort_keys=True,
+                             default=repr)
+    return hashlib.sha1(description.encode()).hexdigest()
+
+
+# parsed data shared by all models of the process
+parsed_data = ParsedDataCache()
+
+# keys (`model_key`) of models' instances built by the process
+model_keys = weakref.WeakKeyDictionary()
@@ -6,6 +6,9 @@ import pyomo.environ as pe
 
 from mind.membranes import MembranesTypes
 from mind.system import MembranesDesignModel
+from mind.simplified import SimplifiedModel
+from mind.collocation import collocation_scheme
+from mind.optmodel_utilities import bulk_rule
 from mind import obj
 
 # logging variable
@@ -35,6 +38,12 @@ class MembranesDesignGas(MembranesDesignModel):
 
         membrane_behavior (`mind.membranes.MembranesTypes`): membrane representation object
 
+        compact_model (`mind.simplified.SimplifiedModel`): compact simplified
+        model of `instance` (built at first simplified solve)
+
+        collocation (`mind.collocation.RadauCollocation`): collocation scheme
+        of membranes (`None` for equal cells)
+
     """
 
     def __init__(self, conf_param, perm_data, eco_file, log_dir: str):
@@ -51,6 +60,8 @@ class MembranesDesignGas(MembranesDesignModel):
 
         self.abstractModel = pe.AbstractModel()
         self.instance = None
+        self.compact_model = None
+        self.collocation = collocation_scheme(self.parameter)
         super().init_model()
 
     def __membranes_stages_levels(self):
@@ -76,140 +87,255 @@ class MembranesDesignGas(MembranesDesignModel):
         """Defining variables keeping flows quantity in cells stages levels."""
         # Variables related to single cell in each membrane
         # flow rate of the feed at the entrance of the cell i of a membrane s
-        self.abstractModel.Feed_cell = pe.Var(
-            self.abstractModel.states,
-            self.abstractModel.N,
-            bounds=(0.0, self.abstractModel.ub_feed_tot))
+        # (expression when aliased, see `__aliased_cells_inputs`)
+        if not self.parameter.alias_cells:
+            self.abstractModel.Feed_cell = pe.Var(
+                self.abstractModel.cells,
+                bounds=(0.0, self.abstractModel.ub_feed_tot))
         # flow rate of the ret flux at the outlet of the cell i of a membrane s
         self.abstractModel.Flux_RET_cell = pe.Var(
-            self.abstractModel.states,
-            self.abstractModel.N,
+            self.abstractModel.cells,
             bounds=(0.0, self.abstractModel.ub_feed_tot))
         # flow rate of the perm flux at the outlet of the cell i
         # of a membrane s
         self.abstractModel.Flux_PERM_cell = pe.Var(
-            self.abstractModel.states,
-            self.abstractModel.N,
+            self.abstractModel.cells,
             bounds=(0.0, self.abstractModel.ub_feed_tot))
 
     def __component_flow_rate_cells_variables(self):
         """Defining variables keeping component percentage of
         flows quantity in cells stages levels.
         """
+        if self.parameter.binary_mixture:
+            self.__binary_fractions_cells_variables()
+            return
 
         # fract. of a component at the inlet of the cell i of a membrane s
-        self.abstractModel.XIN_cell = pe.Var(self.abstractModel.states,
-                                             self.abstractModel.components,
-                                             self.abstractModel.N,
-                                             bounds=(0.0, 1.0))
+        # (expression when aliased, see `__aliased_cells_inputs`)
+        if not self.parameter.alias_cells:
+            self.abstractModel.XIN_cell = pe.Var(
+                self.abstractModel.component_cells, bounds=(0.0, 1.0))
         # fract. of a component for the ret flux at the outlet of
         # cell i of membrane s
-        self.abstractModel.X_RET_cell = pe.Var(self.abstractModel.states,
-                                               self.abstractModel.components,
-                                               self.abstractModel.N,
+        self.abstractModel.X_RET_cell = pe.Var(self.abstractModel.component_cells,
                                                bounds=(0.0, 1.0))
         # fract. of a component for the perm flux at the outlet of cell i
         # of membrane s
-        self.abstractModel.X_PERM_cell = pe.Var(self.abstractModel.states,
-                                                self.abstractModel.components,
-                                                self.abstractModel.N,
+        self.abstractModel.X_PERM_cell = pe.Var(self.abstractModel.component_cells,
                                                 bounds=(0.0, 1.0))
 
+    def __binary_fractions_cells_variables(self):
+        """Defining fractions of cells of a binary mixture.
+
+        Only the fraction of the first component is a variable
+        (`XIN_cell_ref`, `X_RET_cell_ref`, `X_PERM_cell_ref`), the
+        fraction of the other one is its complement to 1 (`XIN_cell`,
+        `X_RET_cell`, `X_PERM_cell` are expressions).
+        """
+
+        def fraction_rule(name):
+
+            def rule(model, s, j, i):
+                if j == model.components.first():
+                    return getattr(model, name)[s, i]
+                return 1 - getattr(model, name)[s, i]
+
+            return rule
+
+        names = ['X_RET_cell', 'X_PERM_cell']
+        # (inputs of cells defined later when aliased)
+        if not self.parameter.alias_cells:
+            names.insert(0, 'XIN_cell')
+        for name in names:
+            setattr(self.abstractModel, name + '_ref',
+                    pe.Var(self.abstractModel.cells, bounds=(0.0, 1.0)))
+            setattr(
+                self.abstractModel, name,
+                pe.Expression(self.abstractModel.component_cells,
+                              rule=fraction_rule(name + '_ref')))
+
+    def __aliased_cells_inputs(self):
+        """Defining inputs of cells as expressions (reduced formulation).
+
+        Input of the first cell is the membrane's input, input of cell i+1
+        is the RET of cell i. Connection constraints between cells and with
+        membranes inputs are then useless.
+        """
+
+        def Feed_cell_rule(model, s, i):
+            if i == 1:
+                return model.Feed_mem[s]
+            return model.Flux_RET_cell[s, i - 1]
+
+        self.abstractModel.Feed_cell = pe.Expression(
+            self.abstractModel.cells, rule=Feed_cell_rule)
+
+        def XIN_cell_rule(model, s, j, i):
+            if i == 1:
+                return model.XIN_mem[s, j]
+            return model.X_RET_cell[s, j, i - 1]
+
+        self.abstractModel.XIN_cell = pe.Expression(
+            self.abstractModel.component_cells, rule=XIN_cell_rule)
+
     def set_variables(self):
         """Setting all necessary variables to build optimization model. """
         super().set_variables()
-        # cells levels variables
+        self.set_cells_variables()
+
+    def set_cells_variables(self):
+        """Setting cells levels variables (flows and fractions)."""
         self.__flow_rate_cells_variables()
         self.__component_flow_rate_cells_variables()
+        if self.parameter.alias_cells:
+            self.__aliased_cells_inputs()
 
     def create_process_instance(self, fname):
         """Creation of the instance of the design process model object
         (`pyomo construction`). """
         super().create_process_instance(fname)
-        self.fixing_unused_cells_var()
+        if self.parameter.binary_mixture and len(self.instance.components) != 2:
+            logger.exception("Binary mixture formulation with %d components",
+                             len(self.instance.components))
+            raise ValueError("Binary mixture formulation needs 2 components")
 
     def __flow_conservation_cells_levels_constraint(self):
         """Constraint relative to system flow conservation.
 
-        FEED in cell equals cell output (RET+PERM). """
-
-        def balanceCellMem_rule(model, s, i):
-            return (model.Feed_cell[s, i] == model.Flux_RET_cell[s, i] +
-                    model.Flux_PERM_cell[s, i])
+        FEED in cell equals cell output (RET+PERM), or collocation
+        equations (see `mind.collocation`). """
+        discretisation = self.parameter.discretisation
+
+        def balanceCellMem_builder(model):
+            expressions = {}
+            for s in model.states:
+                cells = range(1, discretisation[s - 1] + 1)
+                feed = [model.Feed_cell[s, i] for i in cells]
+                flux_ret = [model.Flux_RET_cell[s, i] for i in cells]
+                flux_perm = [model.Flux_PERM_cell[s, i] for i in cells]
+                for i in cells:
+                    if self.collocation is not None:
+                        expressions[s, i] = (
+                            flux_perm[i - 1] == self.collocation.balance(
+                                i, lambda k: feed[k - 1],
+                                lambda k: flux_ret[k - 1]))
+                    else:
+                        expressions[s, i] = (feed[i - 1] == flux_ret[i - 1] +
+                                             flux_perm[i - 1])
+            return expressions
 
         self.abstractModel.balanceCellMem = pe.Constraint(
-            self.abstractModel.states,
-            self.abstractModel.N,
-            rule=balanceCellMem_rule)
+            self.abstractModel.cells, rule=bulk_rule(balanceCellMem_builder))
 
         # FEED_component = out_component (RET+PERM)
-        def BalanceComponentCellMem_rule(model, s, j, i):
-            return (model.Feed_cell[s, i] * model.XIN_cell[s, j, i] == (
-                model.Flux_RET_cell[s, i] * model.X_RET_cell[s, j, i] +
-                model.Flux_PERM_cell[s, i] * model.X_PERM_cell[s, j, i]))
+        # (implied by FEED balance for the second component of a binary
+        # mixture)
+        def BalanceComponentCellMem_builder(model):
+            expressions = {}
+            for s in model.states:
+                cells = range(1, discretisation[s - 1] + 1)
+                feed = [model.Feed_cell[s, i] for i in cells]
+                flux_ret = [model.Flux_RET_cell[s, i] for i in cells]
+                flux_perm = [model.Flux_PERM_cell[s, i] for i in cells]
+                for j in model.components:
+                    if self.__implied_binary_component(model, j):
+                        continue
+                    xin = [model.XIN_cell[s, j, i] for i in cells]
+                    x_ret = [model.X_RET_cell[s, j, i] for i in cells]
+                    x_perm = [model.X_PERM_cell[s, j, i] for i in cells]
+                    for i in cells:
+                        if self.collocation is not None:
+                            expressions[s, j, i] = (
+                                flux_perm[i - 1] * x_perm[i - 1] ==
+                                self.collocation.balance(
+                                    i, lambda k: feed[k - 1] * xin[k - 1],
+                                    lambda k: flux_ret[k - 1] * x_ret[k - 1]))
+                        else:
+                            expressions[s, j, i] = (
+                                feed[i - 1] * xin[i - 1] ==
+                                (flux_ret[i - 1] * x_ret[i - 1] +
+                                 flux_perm[i - 1] * x_perm[i - 1]))
+            return expressions
 
         self.abstractModel.BalanceComponentCellMem = pe.Constraint(
-            self.abstractModel.states,
-            self.abstractModel.components,
-            self.abstractModel.N,
-            rule=BalanceComponentCellMem_rule)
+            self.abstractModel.component_cells,
+            rule=bulk_rule(BalanceComponentCellMem_builder))
 
     def __correlation_between_cell_contraint(self):
         """Constraint relative to the connection between cells.
 
         RET cell i is the Feed of cell i+1 and Composition of RET cell i
-        is the composition in input at cell i+1. """
-
-        # Flow
-        def ConnectionFeeds_cellMem_rule(model, s, i):
-            mem = s - 1
-            if i + 1 <= self.parameter.discretisation[mem]:
-                # if not last cell of mem discretisation
-                return model.Feed_cell[s, i + 1] == model.Flux_RET_cell[s, i]
-            else:
-                return pe.Constraint.Skip
+        is the composition in input at cell i+1 (implicit when cells inputs
+        are aliased, see `Configuration.alias_cells`). """
+        if self.parameter.alias_cells:
+            return
+        discretisation = self.parameter.discretisation
+
+        # Flow (all cells except last cell of mem discretisation)
+        def ConnectionFeeds_cellMem_builder(model):
+            expressions = {}
+            for s in model.states:
+                cells = range(1, discretisation[s - 1] + 1)
+                feed = [model.Feed_cell[s, i] for i in cells]
+                flux_ret = [model.Flux_RET_cell[s, i] for i in cells]
+                for i in cells[:-1]:
+                    expressions[s, i] = feed[i] == flux_ret[i - 1]
+            return expressions
 
         self.abstractModel.ConnectionFeeds_cellMem = pe.Constraint(
-            self.abstractModel.states,
-            self.abstractModel.N_minuslast,
-            rule=ConnectionFeeds_cellMem_rule)
+            self.abstractModel.cells_minuslast,
+            rule=bulk_rule(ConnectionFeeds_cellMem_builder))
 
         # components
-        def ConnectionPercinsMem_rule(model, s, j, i):
-            mem = s - 1
-            if i + 1 <= self.parameter.discretisation[mem]:
-                return model.XIN_cell[s, j, i + 1] == model.X_RET_cell[s, j, i]
-            else:
-                return pe.Constraint.Skip
+        def ConnectionPercinsMem_builder(model):
+            expressions = {}
+            for s in model.states:
+                cells = range(1, discretisation[s - 1] + 1)
+                for j in model.components:
+                    if self.__implied_binary_component(model, j):
+                        continue
+                    xin = [model.XIN_cell[s, j, i] for i in cells]
+                    x_ret = [model.X_RET_cell[s, j, i] for i in cells]
+                    for i in cells[:-1]:
+                        expressions[s, j, i] = xin[i] == x_ret[i - 1]
+            return expressions
 
         self.abstractModel.ConnectionPercinsMem = pe.Constraint(
-            self.abstractModel.states,
-            self.abstractModel.components,
-            self.abstractModel.N_minuslast,
-            rule=ConnectionPercinsMem_rule)
+            self.abstractModel.component_cells_minuslast,
+            rule=bulk_rule(ConnectionPercinsMem_builder))
 
     def __cell_fractions_components_constraint(self):
         """Constraint relative to the satisfaction of the coherence of components.
 
-        Composition coherence (total fractions==1)."""
+        Composition coherence (total fractions==1), implied for a binary
+        mixture."""
+        if self.parameter.binary_mixture:
+            return
+        discretisation = self.parameter.discretisation
 
-        # State-Cell
-        def balanceXRetCellMem_rule(model, s, i):
-            return sum(model.X_RET_cell[s, j, i] for j in model.components) == 1
+        def fractions_builder(name):
 
-        self.abstractModel.balanceXRetCellMem = pe.Constraint(
-            self.abstractModel.states,
-            self.abstractModel.N,
-            rule=balanceXRetCellMem_rule)
+            def builder(model):
+                expressions = {}
+                for s in model.states:
+                    cells = range(1, discretisation[s - 1] + 1)
+                    fractions = [[
+                        getattr(model, name)[s, j, i] for j in model.components
+                    ] for i in cells]
+                    for i in cells:
+                        expressions[s, i] = sum(fractions[i - 1]) == 1
+                return expressions
 
-        def balanceXPermCellMem_rule(model, s, i):
-            return sum(
-                model.X_PERM_cell[s, j, i] for j in model.components) == 1
+            return builder
+
+        # State-Cell
+        self.abstractModel.balanceXRetCellMem = pe.Constraint(
+            self.abstractModel.cells,
+            rule=bulk_rule(fractions_builder('X_RET_cell')))
 
         self.abstractModel.balanceXPermCellMem = pe.Constraint(
-            self.abstractModel.states,
-            self.abstractModel.N,
-            rule=balanceXPermCellMem_rule)
+            self.abstractModel.cells,
+            rule=bulk_rule(fractions_builder('X_PERM_cell')))
 
     # interconnection
     def __correlation_membrane_cell_contraint(self):
@@ -221,17 +347,19 @@ class MembranesDesignGas(MembranesDesignModel):
         def connetionFeed_FeedCell_rule(model, s):
             return model.Feed_mem[s] == model.Feed_cell[s, 1]
 
-        self.abstractModel.connetionFeed_FeedCell = pe.Constraint(
-            self.abstractModel.states, rule=connetionFeed_FeedCell_rule)
-
         # Same for percentages of each components
         def xinPercin_rule(model, s, j):
             return model.XIN_mem[s, j] == model.XIN_cell[s, j, 1]
 
-        self.abstractModel.xinPercin = pe.Constraint(
-            self.abstractModel.states,
-            self.abstractModel.components,
-            rule=xinPercin_rule)
+        # (implicit when cells inputs are aliased)
+        if not self.parameter.alias_cells:
+            self.abstractModel.connetionFeed_FeedCell = pe.Constraint(
+                self.abstractModel.states, rule=connetionFeed_FeedCell_rule)
+
+            self.abstractModel.xinPercin = pe.Constraint(
+                self.abstractModel.states,
+                self.abstractModel.components,
+                rule=xinPercin_rule)
 
         # Retentated membrane flow is the last cell retentated flow
         def FluxRETMem_rule(model, s):
@@ -248,6 +376,8 @@ class MembranesDesignGas(MembranesDesignModel):
         # Retentated membrane composition is
         # the last cell retentated composition
         def XoutRETMem_rule(model, s, j):
+            if self.__implied_binary_component(model, j):
+                return pe.Constraint.Skip
             mem = s - 1
             # last_cell_index = model.n.value
             last_cell_index = self.parameter.discretisation[mem]
@@ -262,27 +392,36 @@ class MembranesDesignGas(MembranesDesignModel):
         # Permeated membrane flow of a membrane is the sum
         # of all permeated flows in the cells Flow
         def FluxPERMMem_rule(model, s):
+            last_cell_index = self.parameter.discretisation[s - 1]
             return model.Flux_PERM_mem[s] == sum(
-                model.Flux_PERM_cell[s, i] for i in model.N)
+                model.Flux_PERM_cell[s, i]
+                for i in range(1, last_cell_index + 1))
 
         self.abstractModel.FluxPERMMem = pe.Constraint(
             self.abstractModel.states, rule=FluxPERMMem_rule)
 
         # Composition (components fractions)
         def XoutPERMMem_rule(model, s, j):
+            if self.__implied_binary_component(model, j):
+                return pe.Constraint.Skip
+            last_cell_index = self.parameter.discretisation[s - 1]
             return (model.X_PERM_mem[s, j] * model.Flux_PERM_mem[s] == sum(
                 model.Flux_PERM_cell[s, i] * model.X_PERM_cell[s, j, i]
-                for i in model.N))
+                for i in range(1, last_cell_index + 1)))
 
         self.abstractModel.XoutPERMMem = pe.Constraint(
             self.abstractModel.states,
             self.abstractModel.components,
             rule=XoutPERMMem_rule)
 
-    def define_process_contraints(self):
-        """Wrapper which generate contraints of the optimization model """
-        super().define_process_contraints()
+    def __implied_binary_component(self, model, j):
+        """`True` if constraints of component `j` are implied by the ones
+        of the first component (binary mixture formulation)."""
+        return (self.parameter.binary_mixture and
+                j != model.components.first())
 
+    def set_cells_contraints(self):
+        """Contraints of cells levels (flows and fractions)."""
         self.__flow_conservation_cells_levels_constraint()
         self.__correlation_between_cell_contraint()
 
@@ -292,6 +431,44 @@ class MembranesDesignGas(MembranesDesignModel):
         self.__cell_fractions_components_constraint()
         self.__correlation_membrane_cell_contraint()
 
+    def cells_contraints(self):
+        """Contraints of the instance removed in simplified model.
+
+        Returns:
+            `List` of `pyomo.environ.Constraint`
+        """
+        names = ['balanceCellMem', 'BalanceComponentCellMem', 'mainEquationMem']
+        if not self.parameter.alias_cells:
+            names += [
+                'ConnectionFeeds_cellMem', 'ConnectionPercinsMem',
+                'connetionFeed_FeedCell', 'xinPercin'
+            ]
+        names += ['FluxRETMem', 'XoutRETMem', 'FluxPERMMem', 'XoutPERMMem']
+        if not self.parameter.binary_mixture:
+            names += ['balanceXRetCellMem', 'balanceXPermCellMem']
+        return [getattr(self.instance, name) for name in names]
+
+    def cells_variables(self):
+        """Variables of the instance fixed in simplified model.
+
+        Returns:
+            `List` of `pyomo.environ.Var`
+        """
+        fractions = ['X_RET_cell', 'X_PERM_cell']
+        names = ['Flux_RET_cell', 'Flux_PERM_cell']
+        if not self.parameter.alias_cells:
+            names.append('Feed_cell')
+            fractions.append('XIN_cell')
+        if self.parameter.binary_mixture:
+            fractions = [name + '_ref' for name in fractions]
+        return [getattr(self.instance, name) for name in names + fractions]
+
+    def define_process_contraints(self):
+        """Wrapper which generate contraints of the optimization model """
+        super().define_process_contraints()
+
+        self.set_cells_contraints()
+
         # Membrane Permeability Equation
         self.membrane_behavior.simplified_mem_behavior_contraint(self.parameter)
 
@@ -337,6 +514,33 @@ class MembranesDesignGas(MembranesDesignModel):
                            tmpA)
                 self.instance.ub_splitPERM_frac[s, s1] = tmpA
 
+    def reset_split_flows_bound(self):
+        """Reset split_flows variables bounds to their full model values."""
+        for s in self.instance.states:
+            for s1 in self.instance.states:
+                self.instance.lb_splitRET_frac[s, s1] = (
+                    self.instance.lb_splitRET_frac_full[s, s1].value)
+
+                self.instance.lb_splitPERM_frac[s, s1] = (
+                    self.instance.lb_splitPERM_frac_full[s, s1].value)
+
+                self.instance.ub_splitRET_frac[s, s1] = (
+                    self.instance.ub_splitRET_frac_full[s, s1].value)
+
+                self.instance.ub_splitPERM_frac[s, s1] = (
+                    self.instance.ub_splitPERM_frac_full[s, s1].value)
+
+    def simplified_instance(self):
+        """Compact simplified model of the model's instance (built once).
+
+        Returns:
+            `mind.simplified.SimplifiedModel`
+        """
+        if (self.compact_model is None or
+                self.compact_model.instance is not self.instance):
+            self.compact_model = SimplifiedModel(self)
+        return self.compact_model
+
     def simplified_model(self):
         """Set simplified model.
 
@@ -361,19 +565,8 @@ class MembranesDesignGas(MembranesDesignModel):
 
         # setting up the constraints
         # removing constraints related to cells
-        self.instance.balanceCellMem.deactivate()
-        self.instance.BalanceComponentCellMem.deactivate()
-        self.instance.ConnectionFeeds_cellMem.deactivate()
-        self.instance.ConnectionPercinsMem.deactivate()
-        self.instance.mainEquationMem.deactivate()
-        self.instance.connetionFeed_FeedCell.deactivate()
-        self.instance.xinPercin.deactivate()
-        self.instance.FluxRETMem.deactivate()
-        self.instance.XoutRETMem.deactivate()
-        self.instance.FluxPERMMem.deactivate()
-        self.instance.XoutPERMMem.deactivate()
-        self.instance.balanceXRetCellMem.deactivate()
-        self.instance.balanceXPermCellMem.deactivate()
+        for constraint in self.cells_contraints():
+            constraint.deactivate()
 
         # removing performance constraints
         self.instance.additionalMaxPercProd.deactivate()
@@ -386,12 +579,8 @@ class MembranesDesignGas(MembranesDesignModel):
         self.instance.simplified_obj.activate()
 
         # fixing unused variables
-        self.instance.Feed_cell.fix()
-        self.instance.Flux_RET_cell.fix()
-        self.instance.Flux_PERM_cell.fix()
-        self.instance.XIN_cell.fix()
-        self.instance.X_RET_cell.fix()
-        self.instance.X_PERM_cell.fix()
+        for var in self.cells_variables():
+            var.fix()
 
         # activate simplified model constraints
         self.instance.BalanceComponentMem_simplified.activate()
@@ -401,23 +590,6 @@ class MembranesDesignGas(MembranesDesignModel):
 
         self.instance.preprocess()
 
-    def fixing_unused_cells_var(self):
-        """Fixing unused cells variables before simplied model solving."""
-        for mem in self.instance.states:
-            # Pyomo index begin with 1 and python list with 0
-            if self.instance.n.value != self.parameter.discretisation[mem - 1]:
-                begin_index = self.parameter.discretisation[mem - 1] + 1
-                for cell_index in range(begin_index, self.instance.n.value + 1):
-                    self.instance.Feed_cell[mem, cell_index].fix(0)
-                    self.instance.Flux_RET_cell[mem, cell_index].fix(0)
-                    self.instance.Flux_PERM_cell[mem, cell_index].fix(0)
-                    # for j in self.instance.components:
-                    #     self.instance.XIN_cell[mem, j, cell_index].fix(0)
-                    #     self.instance.X_RET_cell[mem, j, cell_index].fix(0)
-                    #     self.instance.X_PERM_cell[mem, j, cell_index].fix(0)
-
-        self.instance.preprocess()
-
     # back to the  original model
     def restore_original_model(self):
         """ Retore the model object.
@@ -427,37 +599,14 @@ class MembranesDesignGas(MembranesDesignModel):
         """
         assert self.instance is not None and self.instance.is_constructed()
         # reset bounds
-        for s in self.instance.states:
-            for s1 in self.instance.states:
-                self.instance.lb_splitRET_frac[s, s1] = (
-                    self.instance.lb_splitRET_frac_full[s, s1].value)
-
-                self.instance.lb_splitPERM_frac[s, s1] = (
-                    self.instance.lb_splitPERM_frac_full[s, s1].value)
-
-                self.instance.ub_splitRET_frac[s, s1] = (
-                    self.instance.ub_splitRET_frac_full[s, s1].value)
-
-                self.instance.ub_splitPERM_frac[s, s1] = (
-                    self.instance.ub_splitPERM_frac_full[s, s1].value)
+        self.reset_split_flows_bound()
 
         if self.parameter.variable_perm:
             self.instance.Permeability.unfix()
 
         # restore constraints related to cells
-        self.instance.balanceCellMem.activate()
-        self.instance.BalanceComponentCellMem.activate()
-        self.instance.ConnectionFeeds_cellMem.activate()
-        self.instance.ConnectionPercinsMem.activate()
-        self.instance.mainEquationMem.activate()
-        self.instance.connetionFeed_FeedCell.activate()
-        self.instance.xinPercin.activate()
-        self.instance.FluxRETMem.activate()
-        self.instance.XoutRETMem.activate()
-        self.instance.FluxPERMMem.activate()
-        self.instance.XoutPERMMem.activate()
-        self.instance.balanceXRetCellMem.activate()
-        self.instance.balanceXPermCellMem.activate()
+        for constraint in self.cells_contraints():
+            constraint.activate()
 
         # restore performance constraints
         self.instance.additionalMaxPercProd.activate()
@@ -471,14 +620,9 @@ class MembranesDesignGas(MembranesDesignModel):
         self.instance.simplified_obj.deactivate()
 
         # unfixing unused variables
-        self.instance.Feed_cell.unfix()
-        self.instance.Flux_RET_cell.unfix()
-        self.instance.Flux_PERM_cell.unfix()
-        self.instance.XIN_cell.unfix()
-        self.instance.X_RET_cell.unfix()
-        self.instance.X_PERM_cell.unfix()
-
-        self.fixing_unused_cells_var()
+        for var in self.cells_variables():
+            var.unfix()
+
         # remove simplified model constraints
         self.instance.BalanceComponentMem_simplified.deactivate()
         self.instance.mainEquationMem_simplified.deactivate()
@@ -487,3 +631,254 @@ class MembranesDesignGas(MembranesDesignModel):
             self.instance.noIsolated.activate()
 
         self.instance.preprocess()
+
+
+class MembranesDesignGasComponentFlows(MembranesDesignGas):
+    """Component flows formulation of `MembranesDesignGas`.
+
+    Primary variables of cells are molar flows of each component
+    (`Feed_comp_cell`, `Flux_RET_comp_cell`, `Flux_PERM_comp_cell`) instead
+    of total flows and fractions. Cells balances and connections are then
+    linear, the nonlinearity is in the membrane permeability equation
+    (`mainEquationMem`), in permeated fractions of cells (`X_PERM_cell`,
+    kept as variables so the permeability equation is only multiplied by
+    the retentate flow) and in membranes levels links. Total flows and
+    others fractions of cells (`Feed_cell`, `X_RET_cell`, ...) are
+    expressions.
+
+    Selected with `Configuration.component_flows`.
+    """
+
+    def set_cells_variables(self):
+        """Setting cells levels variables (component flows)."""
+        # component flow of the ret flux at the outlet of the cell i
+        # of a membrane s
+        self.abstractModel.Flux_RET_comp_cell = pe.Var(
+            self.abstractModel.component_cells,
+            bounds=(0.0, self.abstractModel.ub_feed_tot))
+        # component flow of the perm flux at the outlet of the cell i
+        # of a membrane s
+        self.abstractModel.Flux_PERM_comp_cell = pe.Var(
+            self.abstractModel.component_cells,
+            bounds=(0.0, self.abstractModel.ub_feed_tot))
+
+        # component flow of the feed at the entrance of the cell i
+        # of a membrane s
+        if self.parameter.alias_cells:
+            # membrane input (first cell) or RET of previous cell
+            def Feed_comp_cell_rule(model, s, j, i):
+                if i == 1:
+                    return model.Feed_mem[s] * model.XIN_mem[s, j]
+                return model.Flux_RET_comp_cell[s, j, i - 1]
+
+            self.abstractModel.Feed_comp_cell = pe.Expression(
+                self.abstractModel.component_cells, rule=Feed_comp_cell_rule)
+        else:
+            self.abstractModel.Feed_comp_cell = pe.Var(
+                self.abstractModel.component_cells,
+                bounds=(0.0, self.abstractModel.ub_feed_tot))
+
+        # total flows and fractions of cells
+        def total_rule(comp_flow):
+
+            def rule(model, s, i):
+                return sum(
+                    getattr(model, comp_flow)[s, j, i]
+                    for j in model.components)
+
+            return rule
+
+        def fraction_rule(comp_flow, flow):
+
+            def rule(model, s, j, i):
+                return (getattr(model, comp_flow)[s, j, i] /
+                        getattr(model, flow)[s, i])
+
+            return rule
+
+        self.abstractModel.Feed_cell = pe.Expression(
+            self.abstractModel.cells, rule=total_rule('Feed_comp_cell'))
+        self.abstractModel.Flux_RET_cell = pe.Expression(
+            self.abstractModel.cells, rule=total_rule('Flux_RET_comp_cell'))
+        self.abstractModel.Flux_PERM_cell = pe.Expression(
+            self.abstractModel.cells, rule=total_rule('Flux_PERM_comp_cell'))
+        self.abstractModel.XIN_cell = pe.Expression(
+            self.abstractModel.component_cells,
+            rule=fraction_rule('Feed_comp_cell', 'Feed_cell'))
+        self.abstractModel.X_RET_cell = pe.Expression(
+            self.abstractModel.component_cells,
+            rule=fraction_rule('Flux_RET_comp_cell', 'Flux_RET_cell'))
+        # fract. of a component for the perm flux at the outlet of cell i
+        # of membrane s
+        self.abstractModel.X_PERM_cell = pe.Var(
+            self.abstractModel.component_cells, bounds=(0.0, 1.0))
+
+    def set_cells_contraints(self):
+        """Contraints of cells levels (component flows).
+
+        Total flows balances and retentate fractions coherence of cells are
+        implied by components balances.
+        """
+
+        discretisation = self.parameter.discretisation
+
+        # FEED_component = out_component (RET+PERM)
+        def BalanceComponentCellMem_builder(model):
+            expressions = {}
+            for s in model.states:
+                cells = range(1, discretisation[s - 1] + 1)
+                for j in model.components:
+                    feed = [model.Feed_comp_cell[s, j, i] for i in cells]
+                    flux_ret = [
+                        model.Flux_RET_comp_cell[s, j, i] for i in cells
+                    ]
+                    flux_perm = [
+                        model.Flux_PERM_comp_cell[s, j, i] for i in cells
+                    ]
+                    for i in cells:
+                        if self.collocation is not None:
+                            expressions[s, j, i] = (
+                                flux_perm[i - 1] == self.collocation.balance(
+                                    i, lambda k: feed[k - 1],
+                                    lambda k: flux_ret[k - 1]))
+                        else:
+                            expressions[s, j, i] = (
+                                feed[i - 1] == flux_ret[i - 1] +
+                                flux_perm[i - 1])
+            return expressions
+
+        self.abstractModel.BalanceComponentCellMem = pe.Constraint(
+            self.abstractModel.component_cells,
+            rule=bulk_rule(BalanceComponentCellMem_builder))
+
+        if not self.parameter.alias_cells:
+            # RET cell i is the Feed of cell i+1
+            def ConnectionPercinsMem_builder(model):
+                expressions = {}
+                for s in model.states:
+                    cells = range(1, discretisation[s - 1] + 1)
+                    for j in model.components:
+                        feed = [model.Feed_comp_cell[s, j, i] for i in cells]
+                        flux_ret = [
+                            model.Flux_RET_comp_cell[s, j, i] for i in cells
+                        ]
+                        for i in cells[:-1]:
+                            expressions[s, j, i] = feed[i] == flux_ret[i - 1]
+                return expressions
+
+            self.abstractModel.ConnectionPercinsMem = pe.Constraint(
+                self.abstractModel.component_cells_minuslast,
+                rule=bulk_rule(ConnectionPercinsMem_builder))
+
+            # Input Feed in a membrane == Input Feed in first cell
+            def connetionFeed_FeedCell_rule(model, s, j):
+                return (model.Feed_mem[s] * model.XIN_mem[s, j] ==
+                        model.Feed_comp_cell[s, j, 1])
+
+            self.abstractModel.connetionFeed_FeedCell = pe.Constraint(
+                self.abstractModel.states,
+                self.abstractModel.components,
+                rule=connetionFeed_FeedCell_rule)
+
+        # contraint depending of the type of membrane
+        self.membrane_behavior.set_component_flows_behavior_contraint(
+            self.parameter)
+
+        # permeated fractions of cells
+        def PermFractionCellMem_builder(model):
+            expressions = {}
+            for s in model.states:
+                for i in range(1, discretisation[s - 1] + 1):
+                    for j in model.components:
+                        expressions[s, j, i] = (
+                            model.Flux_PERM_comp_cell[s, j, i] ==
+                            model.X_PERM_cell[s, j, i] *
+                            model.Flux_PERM_cell[s, i])
+            return expressions
+
+        self.abstractModel.PermFractionCellMem = pe.Constraint(
+            self.abstractModel.component_cells,
+            rule=bulk_rule(PermFractionCellMem_builder))
+
+        def balanceXPermCellMem_builder(model):
+            expressions = {}
+            for s in model.states:
+                for i in range(1, discretisation[s - 1] + 1):
+                    expressions[s, i] = sum(
+                        model.X_PERM_cell[s, j, i]
+                        for j in model.components) == 1
+            return expressions
+
+        self.abstractModel.balanceXPermCellMem = pe.Constraint(
+            self.abstractModel.cells,
+            rule=bulk_rule(balanceXPermCellMem_builder))
+
+        # Retentated membrane flow is the last cell retentated flow
+        def FluxRETMem_rule(model, s):
+            last_cell_index = self.parameter.discretisation[s - 1]
+            return model.Flux_RET_mem[s] == sum(
+                model.Flux_RET_comp_cell[s, j, last_cell_index]
+                for j in model.components)
+
+        self.abstractModel.FluxRETMem = pe.Constraint(self.abstractModel.states,
+                                                      rule=FluxRETMem_rule)
+
+        def XoutRETMem_rule(model, s, j):
+            last_cell_index = self.parameter.discretisation[s - 1]
+            return (model.X_RET_mem[s, j] * model.Flux_RET_mem[s] ==
+                    model.Flux_RET_comp_cell[s, j, last_cell_index])
+
+        self.abstractModel.XoutRETMem = pe.Constraint(
+            self.abstractModel.states,
+            self.abstractModel.components,
+            rule=XoutRETMem_rule)
+
+        # Permeated membrane flow of a membrane is the sum
+        # of all permeated flows in the cells Flow
+        def FluxPERMMem_rule(model, s):
+            last_cell_index = self.parameter.discretisation[s - 1]
+            return model.Flux_PERM_mem[s] == sum(
+                model.Flux_PERM_comp_cell[s, j, i]
+                for i in range(1, last_cell_index + 1)
+                for j in model.components)
+
+        self.abstractModel.FluxPERMMem = pe.Constraint(
+            self.abstractModel.states, rule=FluxPERMMem_rule)
+
+        def XoutPERMMem_rule(model, s, j):
+            last_cell_index = self.parameter.discretisation[s - 1]
+            return (model.X_PERM_mem[s, j] * model.Flux_PERM_mem[s] == sum(
+                model.Flux_PERM_comp_cell[s, j, i]
+                for i in range(1, last_cell_index + 1)))
+
+        self.abstractModel.XoutPERMMem = pe.Constraint(
+            self.abstractModel.states,
+            self.abstractModel.components,
+            rule=XoutPERMMem_rule)
+
+    def cells_contraints(self):
+        """Contraints of the instance removed in simplified model.
+
+        Returns:
+            `List` of `pyomo.environ.Constraint`
+        """
+        names = [
+            'BalanceComponentCellMem', 'mainEquationMem',
+            'PermFractionCellMem', 'balanceXPermCellMem'
+        ]
+        if not self.parameter.alias_cells:
+            names += ['ConnectionPercinsMem', 'connetionFeed_FeedCell']
+        names += ['FluxRETMem', 'XoutRETMem', 'FluxPERMMem', 'XoutPERMMem']
+        return [getattr(self.instance, name) for name in names]
+
+    def cells_variables(self):
+        """Variables of the instance fixed in simplified model.
+
+        Returns:
+            `List` of `pyomo.environ.Var`
+        """
+        names = []
+        if not self.parameter.alias_cells:
+            names += ['Feed_comp_cell']
+        names += ['Flux_RET_comp_cell', 'Flux_PERM_comp_cell', 'X_PERM_cell']
+        return [getattr(self.instance, name) for name in names]
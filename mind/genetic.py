@@ -4,7 +4,7 @@ import os
 import logging
 
 from mind.fixing import fixing_method
-from mind.genetic_pop_ranking import population_ranking
+from mind.parallel import create_pool, current_worker
 from mind.printing import print_model_solution
 # import mind.solve
 from mind.util import store_object_to_file
@@ -24,7 +24,7 @@ class Individual:
     """Description of genetic population's individual.
         Attributes:
 
-            model(`Pyomo's model instance`) : constructed model of membrane design model.
+            model(`mind.snapshot.Point`) : variables values of membrane design model.
 
             obj (`DICT`) : associative data structure containing
             pair of models' variables and it's values
@@ -75,6 +75,9 @@ class Population:
         fixed_pop_size (`Int`) : Size of population list
 
         best_individu (`mind.genetic.Individual`) : pointer to the best individual in population
+
+        executor (`concurrent.futures.ProcessPoolExecutor`) : pool of worker
+        processes evaluating individuals (`None` when executed sequentially)
     """
 
     def __init__(self, my_solver, modelisation, population=[]):
@@ -89,6 +92,7 @@ class Population:
         self.population = population
         self.fixed_pop_size = None
         self.best_individu = None
+        self.executor = None
 
     def storing_model(self):
         """Store optimization model's instance to the `Pyomo` 's model object."""
@@ -133,11 +137,15 @@ class Population:
         #  store solver.modelisation.instance  to Z_point
         self.solver.store_model_to_point(self.modelisation.instance,
                                          self.modelisation.parameter)
+        if self.executor is not None:
+            self.parallel_initiate_population(pop_size)
+            return
+
         # copying solver.modelisation.instance pop_size time [dict format]
         for individu in range(pop_size):
             # original_point
             self.population.append(
-                Individual(dict(self.solver.Z_point), None, False))
+                Individual(self.solver.Z_point.copy(), None, False))
 
             # Evaluation
             print()
@@ -163,6 +171,45 @@ class Population:
             # recovery the state of the model
             self.population[individu].model = self.storing_model()
 
+    def parallel_initiate_population(self, pop_size):
+        """Initialization of population list, individuals being evaluated by
+        worker processes.
+
+        Args:
+            pop_size (`Int`) : size used to fix the number of elements in population.
+        """
+        seeds = [
+            self.solver.random_generationMulti.randrange(2**31)
+            for _ in range(pop_size)
+        ]
+        futures = [
+            self.executor.submit(initiate_individual_task,
+                                 self.solver.Z_point.values, seed)
+            for seed in seeds
+        ]
+        layout = self.modelisation.parameter.layout
+        for individu, future in enumerate(futures):
+            feasible, obj_value, point, stats = future.result()
+            self.solver.add_statistics(stats)
+            logger.info("Individual_{}'s evaluation".format(individu + 1))
+            self.population.append(
+                Individual(layout.point(point), None, False))
+
+            if feasible:
+                # save solution as done by `find_starting_solution`
+                self.solver.Z_point = self.population[individu].model.copy()
+                self.solver.restore_model_from_point(self.modelisation.instance)
+                self.solver.save_solution(self.modelisation,
+                                          algo_identifier_str="Starting point")
+
+                self.population[individu].active = True
+                self.population[individu].obj = obj_value
+                self.index = individu
+                self.population[individu].fixed_value = False
+                self.population[individu].init_file = (
+                    self.solver.log_dir + 'population' + os.path.sep +
+                    'individu_{}.dat'.format(individu + 1))
+
     def select_individual(self):
         """Genetic method 's selection operations.
 
@@ -180,7 +227,7 @@ class Population:
 
         self.fixed_pop_size = len(self.population)
 
-    def perturb_optimize_operation(self, individu):
+    def perturb_optimize_operation(self, individu, save=True):
         """Part of evolution operation of genetic's algorithm.
 
         Perturb a given model's solution and do localSearch around the perturbed solution.
@@ -188,6 +235,9 @@ class Population:
         Args:
             individu (`mind.genetic.Individual`) : individual to be evoluated
 
+            save (`Bool`) : `True` if the solution is saved in stationaryfile
+            (`False` in worker processes, see `parallel_reproduction`)
+
         Returns:
             return `True` if a new generated individual (`child`) is active
 
@@ -214,24 +264,37 @@ class Population:
 
         if feasible:
             f_current = my_model.obj()
-            # save solution in file
-            self.solver.stationaryfile.write("pert_optimize : " + "obj " +
-                                             str(f_current) + "\n")
-            print_model_solution(my_model, self.solver.stationaryfile, my_param,
-                                 self.modelisation.membrane_behavior, True)
-            logger.info("obtain solution and saved in stationaryfile")
+            if save:
+                self.save_child(f_current)
             logger.info("f_obj = {}".format(f_current))
         else:
             logger.info("model infeasible")
             None
         return feasible
 
-    def reproduction_operation(self, individu):
+    def save_child(self, f_current):
+        """Save the model's solution (a perturbed and optimized individual)
+        in stationaryfile.
+
+        Args:
+            f_current (`Float`) : objective's function value of the solution
+        """
+        self.solver.stationaryfile.write("pert_optimize : " + "obj " +
+                                         str(f_current) + "\n")
+        print_model_solution(self.modelisation.instance,
+                             self.solver.stationaryfile,
+                             self.modelisation.parameter,
+                             self.modelisation.membrane_behavior, True)
+        logger.info("obtain solution and saved in stationaryfile")
+
+    def reproduction_operation(self, individu, save=True):
         """Evolution operation of genetic's algorithm.
 
         Args:
             individu (`mind.genetic.Individual`) : individual to be evoluated
 
+            save (`Bool`) : `True` if the child is saved in stationaryfile
+
         Returns:
             generate a new individual (`child`)
 
@@ -244,11 +307,11 @@ class Population:
                 individu + 1))
 
         # change context of solver model
-        self.solver.Z_point = dict(self.population[individu].model)
+        self.solver.Z_point = self.population[individu].model.copy()
         self.solver.restore_model_from_point(self.modelisation.instance)
 
         # perturb and optimize model solution
-        feasible = self.perturb_optimize_operation(individu)
+        feasible = self.perturb_optimize_operation(individu, save)
 
         # Recovery child
         # child individual is generated
@@ -260,7 +323,7 @@ class Population:
             logger.warning('model infeasible and getting ZeroDivisionError')
             obj_value = 1e6
 
-        child_individual = Individual(dict(self.storing_model()), obj_value,
+        child_individual = Individual(self.storing_model().copy(), obj_value,
                                       feasible)
 
         child_individual.index = individu
@@ -268,6 +331,43 @@ class Population:
         # TODO: init_file for child
         return child_individual
 
+    def parallel_reproduction(self):
+        """Evolution operation of genetic's algorithm, childs of all
+        individuals being generated by worker processes.
+
+        Feasible childs are saved in stationaryfile by the coordinator.
+
+        Returns:
+            list of generated individuals (`childs`)
+        """
+        futures = []
+        for individu in range(len(self.population)):
+            logger.info(
+                "Evolutionary reproduction method Operations individu_{}".
+                format(individu + 1))
+            futures.append(
+                self.executor.submit(
+                    reproduction_task, self.population[individu].model.values,
+                    self.population[individu].fixed_value,
+                    self.population[individu].init_file,
+                    self.solver.random_generationPert.randrange(2**31)))
+
+        layout = self.modelisation.parameter.layout
+        new_population = []
+        for individu, future in enumerate(futures):
+            point, obj_value, feasible, stats = future.result()
+            self.solver.add_statistics(stats)
+            child_individual = Individual(layout.point(point), obj_value,
+                                          feasible)
+            child_individual.index = individu
+            new_population.append(child_individual)
+
+            if feasible:
+                child_individual.model.restore(self.modelisation.instance)
+                self.save_child(obj_value)
+
+        return new_population
+
     def exchange_individual(self, new_population, individu, child):
         """Swap individual in population list.
 
@@ -416,6 +516,9 @@ class Population:
 
         # ranking populations
         if closest == "kmeans":
+            # clustering (scikit-learn, pandas) loaded only when used
+            from mind.genetic_pop_ranking import population_ranking
+
             try:
                 population_ranking(self, new_population)
             except Exception:
@@ -452,7 +555,7 @@ class Population:
         obj_val = self.solver.fputative + 1
         for individu in range(len(self.population)):
             if self.population[individu].obj < obj_val:
-                self.solver.Z_point = dict(self.population[individu].model)
+                self.solver.Z_point = self.population[individu].model.copy()
                 self.solver.restore_model_from_point(self.modelisation.instance)
                 self.best_individu = individu
                 obj_val = self.population[individu].obj
@@ -467,6 +570,32 @@ class Population:
 
         """
         logger.info("Running evolutionary algorithm ...")
+        if self.solver.nb_workers > 1:
+            with create_pool(self.solver, self.modelisation,
+                             self.solver.nb_workers) as executor:
+                self.executor = executor
+                try:
+                    self.evolve(pop_size, generations)
+                finally:
+                    self.executor = None
+        else:
+            self.evolve(pop_size, generations)
+
+        # At this step model contain last resolution model
+        # return individual with best obj found
+        self.recovery_best_individual()
+        # plus one, because of index
+        logger.info("Best individu = {}".format(self.best_individu + 1))
+
+    def evolve(self, pop_size, generations):
+        """Generations of the genetic's algorithm.
+
+        Args:
+            pop_size (`Int`) : size of individuals population list
+
+            generations (`Int`) : genetic's algorithm number of generations
+
+        """
         # initialiser population pool (also evaluate it)
         self.initiate_population(pop_size)
         # Selection of candidates
@@ -476,18 +605,78 @@ class Population:
             print()
             logger.info("Generation {}".format(generation + 1))
             # Defining new population structure (list)
-            new_population = []
-            for individu in range(len(self.population)):
-                # reproduction operation
-                child = self.reproduction_operation(individu)
-                new_population.append(child)
+            if self.executor is not None:
+                new_population = self.parallel_reproduction()
+            else:
+                new_population = []
+                for individu in range(len(self.population)):
+                    # reproduction operation
+                    child = self.reproduction_operation(individu)
+                    new_population.append(child)
 
             # updating populations
             self.update_population(new_population, closest="kmeans")
             self.printing_population()
 
-        # At this step model contain last resolution model
-        # return individual with best obj found
-        self.recovery_best_individual()
-        # plus one, because of index
-        logger.info("Best individu = {}".format(self.best_individu + 1))
+
+def initiate_individual_task(point, seed):
+    """Evaluation of an initial individual in a worker process.
+
+    Args:
+        point (`numpy.ndarray`) : model's values from which individual is
+        generated (`mind.snapshot.VariableLayout` order)
+
+        seed (`Int`) : seed of the worker's `random_generationMulti`
+
+    Returns:
+        tuple (feasible, objective, point, statistics)
+    """
+    worker = current_worker()
+    solver = worker.solver
+    modelisation = worker.modelisation
+    stats = solver.statistics()
+
+    solver.random_generationMulti.seed(seed)
+    solver.active_generationMulti = True
+    solver.Z_point = modelisation.parameter.layout.point(point)
+    solver.restore_model_from_point(modelisation.instance)
+
+    feasible = solver.find_starting_solution(modelisation,
+                                             max_trials_starting_points=1)
+    obj_value = modelisation.instance.obj() if feasible else None
+    solver.store_model_to_point(modelisation.instance, modelisation.parameter)
+
+    return (feasible, obj_value, solver.Z_point.values,
+            solver.statistics(stats))
+
+
+def reproduction_task(point, fixed_value, init_file, seed):
+    """Generation of an individual's child in a worker process.
+
+    Args:
+        point (`numpy.ndarray`) : model's values of the individual
+        (`mind.snapshot.VariableLayout` order)
+
+        fixed_value (`Bool`) : `True` if some variables must be fixed for individual
+
+        init_file (`str`) : filename containing information on variables to be fixed
+
+        seed (`Int`) : seed of the worker's `random_generationPert`
+
+    Returns:
+        tuple (point, objective, feasible, statistics) of the child
+    """
+    worker = current_worker()
+    solver = worker.solver
+    stats = solver.statistics()
+
+    solver.random_generationPert.seed(seed)
+    solver.active_generationPert = True
+    layout = worker.modelisation.parameter.layout
+    population = Population(
+        solver, worker.modelisation,
+        [Individual(layout.point(point), None, True, fixed_value, init_file)])
+    child = population.reproduction_operation(0, save=False)
+
+    return (child.model.values, child.obj, child.active,
+            solver.statistics(stats))
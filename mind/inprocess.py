@@ -0,0 +1,314 @@
+"""In-process local searches with Ipopt.
+
+The `NL` based solvers write the model's instance in a file, spawn the
+solver's executable and read back its `.sol` file at each local search.
+Here the compiled problem (`PYNUMERO`'s `PyomoNLP`, evaluated by the `ASL`
+library) of each state of the model's instance (active constraints and
+objectives, fixed variables) is kept alive in the process, and `Ipopt` is
+called through `cyipopt` : only the starting point and the variables bounds
+are exchanged (as `numpy` arrays) between two local searches.
+
+`cyipopt` and `PYNUMERO`'s `ASL` library are optional dependencies
+(see `inprocess_available`). `PYNUMERO` (and `scipy`) are only imported
+when in-process local searches are requested.
+"""
+
+import logging
+from collections import OrderedDict
+
+import numpy as np
+from pyomo.opt import SolverResults, SolverStatus, TerminationCondition
+from pyomo.opt import SolutionStatus
+from pyomo.core.expr.symbol_map import SymbolMap
+
+from mind.nl_template import model_state, model_constants, \
+    constants_unchanged
+
+# logging variable
+logger = logging.getLogger(__name__)
+logger.setLevel(level=logging.DEBUG)
+handler = logging.StreamHandler()
+# handler = logging.FileHandler(filename)
+logger.addHandler(handler)
+formatter = logging.Formatter(fmt='[%(asctime)s] %(levelname)s : %(message)s',
+                              datefmt='%a, %d %b %Y %H:%M:%S')
+handler.setFormatter(formatter)
+
+try:
+    import cyipopt
+    IpoptProblem = cyipopt.Problem
+    IpoptEvaluationError = getattr(cyipopt, 'CyIpoptEvaluationError', None)
+except ImportError:
+    try:
+        # cyipopt releases older than 1.0
+        import ipopt as cyipopt
+        IpoptProblem = cyipopt.problem
+        IpoptEvaluationError = None
+    except ImportError:
+        cyipopt = None
+        IpoptProblem = None
+        IpoptEvaluationError = None
+
+# Ipopt's return status : (solver status, termination condition)
+IPOPT_STATUS = {
+    0: (SolverStatus.ok, TerminationCondition.optimal),
+    # solved to acceptable level : optimal, as for the AMPL sol file's
+    # status of the external solver
+    1: (SolverStatus.ok, TerminationCondition.optimal),
+    2: (SolverStatus.warning, TerminationCondition.infeasible),
+    3: (SolverStatus.warning, TerminationCondition.minStepLength),
+    4: (SolverStatus.warning, TerminationCondition.unbounded),
+    5: (SolverStatus.aborted, TerminationCondition.userInterrupt),
+    6: (SolverStatus.ok, TerminationCondition.feasible),
+    -1: (SolverStatus.warning, TerminationCondition.maxIterations),
+    -2: (SolverStatus.warning, TerminationCondition.noSolution),
+    -3: (SolverStatus.error, TerminationCondition.solverFailure),
+    -4: (SolverStatus.warning, TerminationCondition.maxTimeLimit),
+    -5: (SolverStatus.warning, TerminationCondition.maxTimeLimit),
+    -10: (SolverStatus.error, TerminationCondition.invalidProblem),
+    -11: (SolverStatus.error, TerminationCondition.invalidProblem),
+    -12: (SolverStatus.error, TerminationCondition.error),
+    -13: (SolverStatus.error, TerminationCondition.internalSolverError),
+}
+
+
+def inprocess_available():
+    """Check if in-process local searches can be used.
+
+    Returns:
+        `True` if `cyipopt` and `PYNUMERO`'s `ASL` library are available
+    """
+    if IpoptProblem is None:
+        return False
+    try:
+        from pyomo.contrib.pynumero.asl import AmplInterface
+    except ImportError:
+        return False
+    return AmplInterface.available()
+
+
+class NLPStructure:
+    """Compiled problem of a given state of a model's instance.
+
+    It is also the callback object given to `cyipopt`.
+
+    Attributes:
+
+        nlp (`PyomoNLP`) : `PYNUMERO`'s problem
+
+        variables (`List`) : variables of the problem (`nlp` order)
+
+        symbol_map (`pyomo.core.expr.symbol_map.SymbolMap`) : map of
+        `variables` to their symbol in results objects
+
+        constants (`List`) : pairs of fixed variables or mutable
+        parameters used by the problem, with their value when compiled
+
+        constraints_lb (`numpy.ndarray`) : lower bounds of constraints
+
+        constraints_ub (`numpy.ndarray`) : upper bounds of constraints
+
+        evaluation_error (`type`) : `PYNUMERO`'s evaluation exception
+    """
+
+    def __init__(self, model):
+        from pyomo.contrib.pynumero.interfaces.pyomo_nlp import PyomoNLP
+        try:
+            from pyomo.contrib.pynumero.exceptions import \
+                PyNumeroEvaluationError
+        except ImportError:
+            PyNumeroEvaluationError = ArithmeticError
+        self.evaluation_error = PyNumeroEvaluationError
+
+        self.nlp = PyomoNLP(model)
+        self.variables = self.nlp.get_pyomo_variables()
+        self.symbol_map = SymbolMap()
+        self.symbol_map.addSymbols(
+            (var, 'v' + str(i)) for i, var in enumerate(self.variables))
+        self.constants = model_constants(model)
+        self.constraints_lb = self.nlp.constraints_lb().copy()
+        self.constraints_ub = self.nlp.constraints_ub().copy()
+
+        # sparsity structures are evaluated once
+        self.nlp.set_primals(self.nlp.init_primals())
+        self.nlp.set_duals(np.ones(self.nlp.n_constraints()))
+        jacobian = self.nlp.evaluate_jacobian()
+        self.jacobian_structure = (jacobian.row.copy(), jacobian.col.copy())
+        hessian = self.nlp.evaluate_hessian_lag()
+        self.hessian_mask = hessian.row >= hessian.col
+        self.hessian_structure = (hessian.row[self.hessian_mask].copy(),
+                                  hessian.col[self.hessian_mask].copy())
+
+    def is_valid(self):
+        """Check that values compiled as constants are unchanged.
+
+        Returns:
+            `True` if the compiled problem can be reused
+        """
+        return constants_unchanged(self.constants)
+
+    def current_point(self):
+        """Starting point and variables bounds of the model's instance.
+
+        Returns:
+            tuple of `numpy.ndarray` (point, lower bounds, upper bounds)
+        """
+        nb_vars = len(self.variables)
+        lower = np.full(nb_vars, -np.inf)
+        upper = np.full(nb_vars, np.inf)
+        point = np.zeros(nb_vars)
+        for i, var in enumerate(self.variables):
+            if var.lb is not None:
+                lower[i] = var.lb
+            if var.ub is not None:
+                upper[i] = var.ub
+            if var.value is not None:
+                point[i] = var.value
+            else:
+                point[i] = np.clip(0, lower[i], upper[i])
+        return point, lower, upper
+
+    def evaluate(self, function, *args):
+        """Call one `nlp`'s evaluation while `Ipopt` is running.
+
+        Evaluation errors (ex: log of a negative number) are given back to
+        `Ipopt` (which reduces its step) when `cyipopt` supports it.
+        """
+        try:
+            return function(*args)
+        except self.evaluation_error:
+            if IpoptEvaluationError is None:
+                raise
+            raise IpoptEvaluationError()
+
+    # callbacks of cyipopt
+    def objective(self, x):
+        self.nlp.set_primals(x)
+        return self.evaluate(self.nlp.evaluate_objective)
+
+    def gradient(self, x):
+        self.nlp.set_primals(x)
+        return self.evaluate(self.nlp.evaluate_grad_objective)
+
+    def constraints(self, x):
+        self.nlp.set_primals(x)
+        return self.evaluate(self.nlp.evaluate_constraints)
+
+    def jacobianstructure(self):
+        return self.jacobian_structure
+
+    def jacobian(self, x):
+        self.nlp.set_primals(x)
+        return self.evaluate(self.nlp.evaluate_jacobian).data
+
+    def hessianstructure(self):
+        return self.hessian_structure
+
+    def hessian(self, x, lagrange, obj_factor):
+        self.nlp.set_primals(x)
+        self.nlp.set_duals(lagrange)
+        self.nlp.set_obj_factor(obj_factor)
+        hessian = self.evaluate(self.nlp.evaluate_hessian_lag)
+        return hessian.data[self.hessian_mask]
+
+
+class InProcessIpopt:
+    """Ipopt solver keeping compiled problems alive between local searches.
+
+    Attributes:
+
+        options (`DICT`) : Ipopt's options
+
+        structures (`OrderedDict`) : compiled problems by (model, state) keys
+
+        max_size (`Int`) : maximal number of compiled problems kept (`default = 8`)
+    """
+
+    def __init__(self, maxtime=180, max_size=8):
+        self.options = {'max_cpu_time': float(maxtime)}
+        self.structures = OrderedDict()
+        self.max_size = max_size
+
+    def structure(self, model):
+        """Compiled problem of the current state of `model` (created if needed).
+
+        Args:
+            model (`pyomo.environ.ConcreteModel`) : model's instance
+
+        Returns:
+            `mind.inprocess.NLPStructure`
+        """
+        key = (id(model), model_state(model))
+        structure = self.structures.get(key)
+        if structure is not None and structure.is_valid():
+            self.structures.move_to_end(key)
+            return structure
+
+        logger.info("Compiling in-process problem (%d problems kept)",
+                    len(self.structures))
+        structure = NLPStructure(model)
+        self.structures[key] = structure
+        self.structures.move_to_end(key)
+        while len(self.structures) > self.max_size:
+            self.structures.popitem(last=False)
+        return structure
+
+    def solve(self, model, tee=False, load_solutions=True):
+        """Solve `model` from its current point.
+
+        Args:
+
+            model (`pyomo.environ.ConcreteModel`) : model's instance
+
+            tee (`Bool`) : `True` if Ipopt's output is printed (`default = False`)
+
+            load_solutions (`Bool`) : `True` if solution is loaded in model
+
+        Returns:
+            `PYOMO`'s results object, loadable with `model.solutions.load_from`
+        """
+        structure = self.structure(model)
+        point, lower, upper = structure.current_point()
+
+        problem = IpoptProblem(n=len(point),
+                               m=len(structure.constraints_lb),
+                               problem_obj=structure,
+                               lb=lower,
+                               ub=upper,
+                               cl=structure.constraints_lb,
+                               cu=structure.constraints_ub)
+        add_option = getattr(problem, 'add_option', None) or problem.addOption
+        add_option('print_level', 5 if tee else 0)
+        for name, value in self.options.items():
+            add_option(name, value)
+
+        results = SolverResults()
+        results.solver.name = 'ipopt (in-process)'
+        try:
+            x, info = problem.solve(point)
+        except Exception:
+            logger.exception("In-process Ipopt failed")
+            results.solver.status = SolverStatus.error
+            results.solver.termination_condition = TerminationCondition.error
+            return results
+
+        status, condition = IPOPT_STATUS.get(
+            info['status'], (SolverStatus.error, TerminationCondition.error))
+        results.solver.status = status
+        results.solver.termination_condition = condition
+        results.solver.message = info.get('status_msg')
+
+        solution = results.solution.add()
+        if condition == TerminationCondition.optimal:
+            solution.status = SolutionStatus.optimal
+        elif condition == TerminationCondition.infeasible:
+            solution.status = SolutionStatus.infeasible
+        else:
+            solution.status = SolutionStatus.other
+        for i, value in enumerate(x):
+            solution.variable['v' + str(i)] = {'Value': float(value)}
+        results._smap = structure.symbol_map
+
+        if load_solutions:
+            model.solutions.load_from(results)
+        return results
@@ -6,9 +6,13 @@ import logging
 
 import pyomo.environ as pe
 from pyomo.opt import SolverStatus, TerminationCondition
+from pyomo.opt import SolverResults, ProblemFormat, ReaderFactory, \
+    ResultsFormat
 from pyomo.common.errors import ApplicationError
 import shutil
 
+from mind.nl_template import NLCache, NLStore
+from mind.inprocess import InProcessIpopt, inprocess_available
 from mind.util import generate_absolute_path
 
 # logging variable
@@ -36,21 +40,46 @@ class SolverObject:
 
         solver_name (`str`) : name of solver
 
+        solver_path (`str`) : path to solver executable (`''` if default one)
+
         is_gams_model (`Bool`) : `True` if `GAMS` 's modelizer is available
 
         tmp (`str`) : path to temporary directory
 
         options (`DICT`) : list of options to `PYOMO`'s solver when `GAMS`'s available
+
+        nl_cache (`mind.nl_template.NLCache`) : `NL` files reused between
+        solves (`None` if each solve writes its own `NL` file)
+
+        model_cache (`str`) : directory of `NL` files kept for next runs,
+        implies `NL` files reuse (`None` if not kept)
+
+        inprocess (`Bool`) : `True` if in-process local searches are requested
+
+        inprocess_solver (`mind.inprocess.InProcessIpopt`) : in-process
+        Ipopt solver (`None` if solver's executable is used)
     """
 
-    def __init__(self, maxtime=180):
+    def __init__(self,
+                 maxtime=180,
+                 reuse_nl=False,
+                 inprocess=False,
+                 model_cache=None):
         self.the_solver = None
         self.solver_name = None
+        self.solver_path = ''
         self.is_gams_model = False
         # self.results = None
         self.tmp = generate_absolute_path() + "tmp" + os.path.sep
         self.options = []
         self.maxtime = maxtime
+        self.model_cache = model_cache
+        if model_cache:
+            self.nl_cache = NLCache(store=NLStore(model_cache))
+        else:
+            self.nl_cache = NLCache() if reuse_nl else None
+        self.inprocess = inprocess
+        self.inprocess_solver = None
 
     def solver_factory(self, solver_name='knitroampl', solver_path='', gams=False):
         """Construction of `PYOMO`'s solver instance.
@@ -86,9 +115,19 @@ class SolverObject:
             raise
         else:
             self.solver_name = solver_name
+            self.solver_path = solver_path
             self.is_gams_model = (
                 gams and self.the_solver.available(exception_flag=False))
             logger.info('Configuring solver options')
+            if self.inprocess and not self.is_gams_model:
+                if inprocess_available():
+                    logger.info('Local searches solved in-process by Ipopt')
+                    self.inprocess_solver = InProcessIpopt(self.maxtime)
+                else:
+                    logger.warning("In-process Ipopt unavailable (cyipopt "
+                                   "or PYNUMERO's ASL library missing), "
+                                   "%s's executable is used", solver_name)
+
             if self.is_gams_model:
                 self.options.append(f'option ResLim={self.maxtime};')
                 self.options.append('option SysOut = On;')
@@ -152,6 +191,20 @@ class SolverObject:
                     add_options=self.options,
                     warmstart=True,
                     solver=self.solver_name)
+            elif self.inprocess_solver is not None:
+                return self.inprocess_solver.solve(
+                    model,
+                    tee=local_tee,
+                    load_solutions=local_load_solutions)
+            elif self.nl_cache is not None:
+                return self.nl_cache.solve(
+                    self.the_solver,
+                    model,
+                    tee=local_tee,
+                    logfile=local_logfile,
+                    load_solutions=local_load_solutions,
+                    keepfiles=local_keepfiles,
+                    report_timing=local_report_timing)
             else:
                 return self.the_solver.solve(
                     model,
@@ -172,6 +225,89 @@ class SolverObject:
                 sys.exit(1)
             raise
 
+    def pipeline_available(self):
+        """Check if local searches can be run as separate processes of the
+        solver's executable (see `write_problem` and `solver_command`).
+
+        Returns:
+            `True` if solver's executable (`NL` interface) is available
+        """
+        return (not self.is_gams_model and self.inprocess_solver is None
+                and self.the_solver.executable() is not None)
+
+    def write_problem(self, model, filename):
+        """Write the model's instance (with its current point) in a `NL` file.
+
+        Args:
+
+            model (`mind.system.MembranesDesignModel`) : model's instance
+
+            filename (`str`) : path to `NL` file
+
+        Returns:
+            `PYOMO`'s symbol map of the `NL` file
+        """
+        if self.nl_cache is not None:
+            template = self.nl_cache.template(model)
+            shutil.copyfile(template.filename, filename)
+            return template.symbol_map
+
+        _, smap_id = model.write(
+            filename,
+            format=ProblemFormat.nl,
+            io_options={'symbolic_solver_labels': False})
+        symbol_map = model.solutions.symbol_map[smap_id]
+        model.solutions.delete_symbol_map(smap_id)
+        return symbol_map
+
+    def solver_command(self, nl_file, log_file):
+        """Command line (and environment) solving `nl_file` with solver's
+        executable and its options.
+
+        Solution is written by solver's executable in a `.sol` file next to
+        `nl_file`.
+
+        Args:
+
+            nl_file (`str`) : path to `NL` file
+
+            log_file (`str`) : path to solver's log file
+
+        Returns:
+            tuple (command, environment variables)
+        """
+        self.the_solver._log_file = log_file
+        try:
+            command = self.the_solver.create_command_line(
+                self.the_solver.executable(), [nl_file])
+        finally:
+            self.the_solver._log_file = None
+        return command.cmd, command.env
+
+    def read_solution(self, sol_file, symbol_map):
+        """Read solution written by solver's executable.
+
+        Args:
+
+            sol_file (`str`) : path to `.sol` file
+
+            symbol_map (`pyomo.core.expr.symbol_map.SymbolMap`) : symbol
+            map of the solved `NL` file
+
+        Returns:
+            `PYOMO`'s results object, loadable with `model.solutions.load_from`
+        """
+        results = SolverResults()
+        if os.path.exists(sol_file):
+            reader = ReaderFactory(ResultsFormat.sol)
+            results = reader(sol_file, res=results, suffixes=[])
+        else:
+            logger.warning("No solution file %s", sol_file)
+            results.solver.status = SolverStatus.error
+            results.solver.termination_condition = TerminationCondition.error
+        results._smap = symbol_map
+        return results
+
     def check_solve_status(self, results):
         """Checking solver's resolution status.
 
@@ -198,6 +334,9 @@ class SolverObject:
             file_path (`str`) : path to file to deverse logging information of solve's resolution
 
         """
+        if self.inprocess_solver is not None:
+            # no solver's log file with in-process local searches
+            return
         try:
             solver_log_file = 'knitro.log'
             if self.is_gams_model:
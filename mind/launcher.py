@@ -36,6 +36,7 @@ import pprint
 import pyomo.environ as pe
 # Own modules
 from mind.builder import Configuration, build_model
+from mind.multiresolution import select_discretisation
 from mind.solve import GlobalOptimisation
 from mind.post_process import PostProcess
 # from mind.analyse_sol import generate_datafiles
@@ -80,6 +81,42 @@ def parse_args():
 
         --solver SOLVER_NAME : solver name
 
+        --workers WORKERS : number of worker processes
+
+        --reuse_nl : reuse NL files between local searches
+
+        --model_cache MODEL_CACHE : directory of NL files kept for next runs
+        on the same model (implies --reuse_nl)
+
+        --inprocess : solve local searches in-process (Ipopt with cyipopt)
+
+        --solver_processes SOLVER_PROCESSES : number of solver's processes
+        of the multistart pipeline
+
+        --coarse_cells COARSE_CELLS : number of cells of membranes during
+        exploration (coarse-to-fine discretisation)
+
+        --refined_candidates REFINED_CANDIDATES : number of coarse solutions
+        refined at target discretisation
+
+        --alias_cells : inputs of cells are aliased to previous cells outputs
+        (reduced formulation without cells connection constraints)
+
+        --component_flows : cells are modelled with component flows
+
+        --binary_mixture : one fraction variable by cell (two components)
+
+        --collocation COLLOCATION : number of Radau collocation points by
+        finite element of membranes (instead of equal cells)
+
+        --finite_elements FINITE_ELEMENTS : number of finite elements of
+        membranes with collocation
+
+        --auto_discretisation TOLERANCE : select the smallest discretisation
+        of membranes accurate to tolerance (cached by instance's datafile)
+
+        --pickle_data : store parsed datafiles in pickles next to them
+
         --version : print software version
 
         Note: Further documentation is available by contacting <bernardetta.addis@loria.fr>.
@@ -143,6 +180,38 @@ def parse_args():
                         dest='maxtime',
                         type=int,
                         help="""time limit execution of algorithms""")
+
+    parser.add_argument("--workers",
+                        action='store',
+                        dest='workers',
+                        type=int,
+                        default=1,
+                        help="""number of worker processes used by algorithms (multistart)""")
+
+    parser.add_argument("--reuse_nl",
+                        action='store_true',
+                        help=("Reuse solver's NL file between local searches "
+                              "(only initial point and bounds are rewritten)"))
+
+    parser.add_argument("--model_cache",
+                        type=str,
+                        default=None,
+                        help=("Directory of NL files kept for next runs on "
+                              "the same configuration and datafiles "
+                              "(implies --reuse_nl)"))
+
+    parser.add_argument("--inprocess",
+                        action='store_true',
+                        help=("Solve local searches in-process with Ipopt "
+                              "(requires cyipopt and PYNUMERO's ASL library)"))
+
+    parser.add_argument("--solver_processes",
+                        action='store',
+                        dest='solver_processes',
+                        type=int,
+                        default=1,
+                        help=("number of solver's processes running at the "
+                              "same time in multistart (asyncio pipeline)"))
     
     parser.add_argument("--algorithm",
                         action='store',
@@ -152,6 +221,70 @@ def parse_args():
                         help="""Choice of algorithms in ({})""".format(", ".join(algorithms))
                         )
 
+    parser.add_argument("--coarse_cells",
+                        action='store',
+                        dest='coarse_cells',
+                        type=int,
+                        default=0,
+                        help=("maximal number of cells of each membrane "
+                              "during exploration, best solutions are then "
+                              "refined at target discretisation"))
+
+    parser.add_argument("--refined_candidates",
+                        action='store',
+                        dest='refined_candidates',
+                        type=int,
+                        default=3,
+                        help=("number of best coarse solutions refined at "
+                              "target discretisation (with --coarse_cells)"))
+
+    parser.add_argument("--alias_cells",
+                        action='store_true',
+                        help=("Reduced formulation : inputs of cells are "
+                              "expressions of previous cells retentate "
+                              "instead of variables"))
+
+    parser.add_argument("--component_flows",
+                        action='store_true',
+                        help=("Cells formulation with component flows "
+                              "instead of flows and fractions"))
+
+    parser.add_argument("--binary_mixture",
+                        action='store_true',
+                        help=("Binary mixture formulation : only one fraction "
+                              "variable by cell (two components instances)"))
+
+    parser.add_argument("--collocation",
+                        action='store',
+                        dest='collocation',
+                        type=int,
+                        default=0,
+                        help=("number of Radau collocation points by finite "
+                              "element of membranes (0 : equal cells)"))
+
+    parser.add_argument("--finite_elements",
+                        action='store',
+                        dest='finite_elements',
+                        type=int,
+                        default=5,
+                        help=("number of finite elements of membranes "
+                              "(with --collocation)"))
+
+    parser.add_argument("--auto_discretisation",
+                        action='store',
+                        dest='auto_discretisation',
+                        type=float,
+                        default=0.,
+                        help=("select the smallest number of cells of "
+                              "membranes whose objective and purities are "
+                              "within this tolerance of a finer "
+                              "discretisation (0 : ub_area / ub_acell)"))
+
+    parser.add_argument("--pickle_data",
+                        action='store_true',
+                        help=("store parsed datafiles in pickles next to "
+                              "them (next runs skip parsing)"))
+
     parser.add_argument("--instance",
                         action='store',
                         dest='instance_name',
@@ -468,14 +601,16 @@ def load_configuration(config_path: str = 'config.ini'):
 
 def execute(tuning, instance, my_solver, modelisation):
     if tuning['algo'] == 'multistart':
-        my_solver.multistart(
+        my_solver.run_algorithm(
+            my_solver.multistart,
             modelisation,
             int(tuning.get('iteration')),
             int(tuning.get('seed1'))
             )
 
     elif tuning['algo'] == 'mbh':
-        my_solver.mbh(
+        my_solver.run_algorithm(
+            my_solver.mbh,
             modelisation,
             int(tuning.get('max_trials')),
             int(tuning.get('max_no_improve')),
@@ -484,7 +619,8 @@ def execute(tuning, instance, my_solver, modelisation):
             )
 
     elif tuning['algo'] == 'global_opt':
-        my_solver.global_optimisation_algorithm(
+        my_solver.run_algorithm(
+            my_solver.global_optimisation_algorithm,
             modelisation,
             int(tuning.get('max_trials')),
             int(tuning.get('max_no_improve')),
@@ -532,7 +668,8 @@ def main():
 
         # Chosing the solver
         maxtime = args.maxtime or 180
-        optsolver = SolverObject(maxtime)
+        optsolver = SolverObject(maxtime, args.reuse_nl, args.inprocess,
+                                 args.model_cache)
         choice_of_solver = args.solver_name or 'knitroampl'
         optsolver.solver_factory(solver_name=choice_of_solver, gams=args.gams)
 
@@ -564,27 +701,48 @@ def main():
             variable_perm=instance['variable_perm'],
             fixing_var=instance['fixing_var'],
             pressure_ratio=float(tuning['pressure_ratio']),
-            epsilon=tuning['epsilon'])
+            epsilon=tuning['epsilon'],
+            alias_cells=args.alias_cells,
+            component_flows=args.component_flows,
+            binary_mixture=args.binary_mixture,
+            collocation=args.collocation,
+            finite_elements=args.finite_elements,
+            pickle_data=args.pickle_data)
 
         logger.debug(f"instance datafile {instance['fname']} loaded")
 
-        # Creation of the model and it's instance
-        # TODO: change the creation of the model here
-        modelisation = build_model(
-            parameter,
-            instance['fname'],
-            instance['fname_perm'],
-            instance['fname_eco'],
-            instance['log_dir'],
-            instance.setdefault('fname_mask', ''),
-        )
-
-        # pp.pprint(modelisation)
         # Instance of the solver which will execute the model
         my_solver = GlobalOptimisation(optsolver, instance['log_dir'],
                                        args.debug,
                                        not args.no_starting_point,
-                                       not args.no_simplified_model)
+                                       not args.no_simplified_model,
+                                       args.workers,
+                                       args.solver_processes,
+                                       args.coarse_cells,
+                                       args.refined_candidates)
+
+        # Creation of the model and it's instance
+        # TODO: change the creation of the model here
+        if args.auto_discretisation:
+            modelisation = select_discretisation(
+                my_solver,
+                parameter,
+                instance['fname'],
+                instance['fname_perm'],
+                instance['fname_eco'],
+                instance['log_dir'],
+                instance.setdefault('fname_mask', ''),
+                tolerance=args.auto_discretisation,
+            )
+        else:
+            modelisation = build_model(
+                parameter,
+                instance['fname'],
+                instance['fname_perm'],
+                instance['fname_eco'],
+                instance['log_dir'],
+                instance.setdefault('fname_mask', ''),
+            )
 
         tuning['algo'] = "multistart" if args.algorithm_choice not in algorithms else args.algorithm_choice
 
@@ -8,6 +8,9 @@ import logging
 
 import pyomo.environ as pe
 
+from mind.collocation import collocation_scheme
+from mind.optmodel_utilities import bulk_rule
+
 # logging variable
 logger = logging.getLogger(__name__)
 logger.setLevel(level=logging.DEBUG)
@@ -76,31 +79,106 @@ class MembranesTypes():
                                               self._model.states,
                                               bounds=perm_bounds_rule)
 
+    @staticmethod
+    def permeance_areas(parameter):
+        """Coefficients (area of a cell * permeance) of the permeability
+        equation of cells.
+
+        Args:
+            parameter (`mind.builder.Configuration`) : design process configuration
+
+        Returns:
+            `Callable` (model, s, j, type_mem, cells) returning the
+            coefficients of cells of membrane `s` for component `j`
+        """
+        scheme = collocation_scheme(parameter)
+
+        def coefficients(model, s, j, type_mem, cells):
+            if scheme is not None:
+                # area of the collocation point's weight
+                return [
+                    model.area[s] * scheme.weight(i) *
+                    model.Permeability[j, s] / model.thickness[type_mem]
+                    for i in cells
+                ]
+            # equal cells : same coefficient
+            return [
+                (model.area[s] / len(cells)) * model.Permeability[j, s] /
+                model.thickness[type_mem]
+            ] * len(cells)
+
+        return coefficients
+
     def set_mem_behavior_contraint(self, parameter):
         # Membrane Permeability Equation
         # TODO: redundant contraint appear in this function
         # (doublon for the same j)
-        def mainEquationMem_rule(model, s, j, i):
-            type_mem = model.mem_type[s].value
-            mem = s - 1
-            tmp = ((model.area[s] / parameter.discretisation[mem]) *
-                   model.Permeability[j, s] / model.thickness[type_mem])
-
-            if parameter.uniform_pup:
-                return (model.Flux_PERM_cell[s, i] *
-                        model.X_PERM_cell[s, j, i] == tmp *
-                        (model.pressure_up * model.X_RET_cell[s, j, i] -
-                         model.pressure_down[s] * model.X_PERM_cell[s, j, i]))
-            else:
-                return (model.Flux_PERM_cell[s, i] *
-                        model.X_PERM_cell[s, j, i] == tmp *
-                        (model.pressure_up[s] * model.X_RET_cell[s, j, i] -
-                         model.pressure_down[s] * model.X_PERM_cell[s, j, i]))
-
-        self._model.mainEquationMem = pe.Constraint(self._model.states,
-                                                    self._model.components,
-                                                    self._model.N,
-                                                    rule=mainEquationMem_rule)
+        permeance_areas = self.permeance_areas(parameter)
+
+        def mainEquationMem_builder(model):
+            expressions = {}
+            for s in model.states:
+                type_mem = model.mem_type[s].value
+                nb_cells = parameter.discretisation[s - 1]
+                cells = range(1, nb_cells + 1)
+                if parameter.uniform_pup:
+                    pressure_up = model.pressure_up
+                else:
+                    pressure_up = model.pressure_up[s]
+                pressure_down = model.pressure_down[s]
+                flux_perm = [model.Flux_PERM_cell[s, i] for i in cells]
+                for j in model.components:
+                    tmp = permeance_areas(model, s, j, type_mem, cells)
+                    for i in cells:
+                        x_perm = model.X_PERM_cell[s, j, i]
+                        expressions[s, j, i] = (
+                            flux_perm[i - 1] * x_perm == tmp[i - 1] *
+                            (pressure_up * model.X_RET_cell[s, j, i] -
+                             pressure_down * x_perm))
+            return expressions
+
+        self._model.mainEquationMem = pe.Constraint(
+            self._model.component_cells,
+            rule=bulk_rule(mainEquationMem_builder))
+
+    def set_component_flows_behavior_contraint(self, parameter):
+        # Membrane Permeability Equation with component flows
+        # (`mind.gas.MembranesDesignGasComponentFlows`) : retentate
+        # fraction is replaced by component flow over total flow, multiplied
+        # by the retentate total flow of the cell only (permeated fraction
+        # `X_PERM_cell` is kept as a variable)
+        permeance_areas = self.permeance_areas(parameter)
+
+        def mainEquationMem_builder(model):
+            expressions = {}
+            for s in model.states:
+                type_mem = model.mem_type[s].value
+                nb_cells = parameter.discretisation[s - 1]
+                cells = range(1, nb_cells + 1)
+                if parameter.uniform_pup:
+                    pressure_up = model.pressure_up
+                else:
+                    pressure_up = model.pressure_up[s]
+                pressure_down = model.pressure_down[s]
+                # retentate total flows of cells (shared by components)
+                flux_ret = [
+                    sum(model.Flux_RET_comp_cell[s, k, i]
+                        for k in model.components) for i in cells
+                ]
+                for j in model.components:
+                    tmp = permeance_areas(model, s, j, type_mem, cells)
+                    for i in cells:
+                        expressions[s, j, i] = (
+                            model.Flux_PERM_comp_cell[s, j, i] *
+                            flux_ret[i - 1] == tmp[i - 1] *
+                            (pressure_up * model.Flux_RET_comp_cell[s, j, i] -
+                             pressure_down * model.X_PERM_cell[s, j, i] *
+                             flux_ret[i - 1]))
+            return expressions
+
+        self._model.mainEquationMem = pe.Constraint(
+            self._model.component_cells,
+            rule=bulk_rule(mainEquationMem_builder))
 
     def simplified_mem_behavior_contraint(self, parameter):
         # Membrane Permeability Equation
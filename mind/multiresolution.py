@@ -0,0 +1,436 @@
+"""Coarse-to-fine discretisation of membranes.
+
+The number of cells of each membrane (`Configuration.discretise_membrane`)
+is often large, so exploration algorithms (multistart, mbh) can be executed
+on a coarse model (same datafiles, a few cells per membrane) and only the
+best solutions found are refined : their membranes level values are copied
+to the full model, cells profiles are interpolated on the target
+discretisation, then a local search is done at the target resolution
+(see `mind.solve.GlobalOptimisation.coarse_to_fine`).
+
+The discretisation itself can be selected automatically
+(`select_discretisation`) : solutions with n and 2n cells are compared and
+the smallest n whose objective and product purities are within a tolerance
+of the finer solution (Richardson estimate) is kept, and cached by
+instance's datafiles (`DiscretisationCache`).
+"""
+
+import contextlib
+import copy
+import json
+import logging
+import os
+
+import numpy as np
+import pyomo.environ as pe
+
+from mind.builder import build_model
+from mind.random_initialisation import cell_profile
+
+# logging variable
+logger = logging.getLogger(__name__)
+logger.setLevel(level=logging.DEBUG)
+handler = logging.StreamHandler()
+# handler = logging.FileHandler(filename)
+logger.addHandler(handler)
+formatter = logging.Formatter(fmt='[%(asctime)s] %(levelname)s : %(message)s',
+                              datefmt='%a, %d %b %Y %H:%M:%S')
+handler.setFormatter(formatter)
+
+# variables indexed by cells (interpolated instead of copied)
+CELLS_VARIABLES = ('Feed_cell', 'Flux_RET_cell', 'Flux_PERM_cell', 'XIN_cell',
+                   'X_RET_cell', 'X_PERM_cell', 'Feed_comp_cell',
+                   'Flux_RET_comp_cell', 'Flux_PERM_comp_cell', 'XIN_cell_ref',
+                   'X_RET_cell_ref', 'X_PERM_cell_ref')
+
+# default cache of selected discretisations (in log directory)
+DISCRETISATION_CACHE = 'discretisation.json'
+
+
+def coarse_configuration(parameter, nb_cells):
+    """Copy of a configuration with at most `nb_cells` cells by membrane
+    (or collocation points, by whole finite elements).
+
+    Args:
+
+        parameter (`mind.builder.Configuration`) : design process configuration
+
+        nb_cells (`Int`) : maximal number of cells of each membrane
+
+    Returns:
+        `mind.builder.Configuration`
+    """
+    coarse = copy.copy(parameter)
+    # labels and layout refer to the full model's instance
+    coarse.labels = None
+    coarse.layout = None
+    coarse.init_status = {}
+    coarse = copy.deepcopy(coarse)
+    if parameter.collocation:
+        # whole finite elements
+        coarse.finite_elements = max(
+            1, min(nb_cells // parameter.collocation,
+                   parameter.finite_elements))
+        coarse.discretise_membrane()
+        return coarse
+    coarse.discretisation = [
+        min(nb_cells, cells) for cells in parameter.discretisation
+    ]
+    return coarse
+
+
+def build_coarse_model(modelisation, nb_cells):
+    """Build the coarse model of a design process model.
+
+    Args:
+
+        modelisation (`mind.system.MembranesDesignModel`) : desing process model
+
+        nb_cells (`Int`) : maximal number of cells of each membrane
+
+    Returns:
+        `mind.system.MembranesDesignModel` (`None` if the discretisation of
+        `modelisation` is not finer)
+    """
+    try:
+        assert nb_cells >= 1
+    except AssertionError:
+        logger.exception("Invalid number of cells of coarse model (%s)",
+                         nb_cells)
+        raise ValueError("Number of cells of coarse model must be >= 1")
+
+    parameter = coarse_configuration(modelisation.parameter, nb_cells)
+    if parameter.discretisation == modelisation.parameter.discretisation:
+        return None
+    logger.info("Building coarse model (discretisation %s instead of %s)",
+                parameter.discretisation,
+                modelisation.parameter.discretisation)
+    return build_model(parameter, modelisation.filename,
+                       modelisation.perm_filename, modelisation.eco_filename,
+                       modelisation.log_dir, modelisation.mask_filename)
+
+
+class ResolutionTransfer:
+    """Transfer of solutions from a coarse model to a finer one.
+
+    Attributes:
+
+        coarse (`mind.system.MembranesDesignModel`) : coarse model
+
+        fine (`mind.system.MembranesDesignModel`) : fine model
+
+        coarse_index (`numpy.ndarray`) : positions of membranes level
+        variables in coarse model's layout
+
+        variables (`List`) : corresponding variables of the fine model
+    """
+
+    def __init__(self, coarse, fine):
+        self.coarse = coarse
+        self.fine = fine
+        coarse_layout = coarse.parameter.layout
+        fine_layout = fine.parameter.layout
+
+        coarse_index = []
+        self.variables = []
+        for var in fine_layout.variables:
+            if var.parent_component().local_name in CELLS_VARIABLES:
+                continue
+            position = coarse_layout.position(fine_layout.variable_labels[var])
+            if position is not None:
+                coarse_index.append(position)
+                self.variables.append(var)
+        self.coarse_index = np.array(coarse_index, dtype=int)
+
+    def apply(self):
+        """Set the fine model to the current point of the coarse model.
+
+        Membranes level variables (free ones) are copied, cells variables
+        are interpolated.
+        """
+        values = self.coarse.parameter.layout.capture().values
+        for var, value in zip(self.variables,
+                              values[self.coarse_index].tolist()):
+            if not var.fixed:
+                var.set_value(None if value != value else value, True)
+
+        source = cell_profile(self.coarse.instance, self.coarse.parameter)
+        target = cell_profile(self.fine.instance, self.fine.parameter)
+        target.interpolate(source)
+
+
+def refinement_order(parameter):
+    """Convergence order of the membranes discretisation of a configuration
+    (cells model is first order, Radau collocation with K points is of
+    order 2K - 1).
+
+    Args:
+        parameter (`mind.builder.Configuration`) : design process configuration
+
+    Returns:
+        `Int`
+    """
+    if parameter.collocation:
+        return 2 * parameter.collocation - 1
+    return 1
+
+
+def discretisation_error(coarse, fine, order):
+    """Richardson estimate of the discretisation error of a coarse model's
+    solution, compared to the solution of a finer model.
+
+    Args:
+
+        coarse (`mind.system.MembranesDesignModel`) : coarse model (solved)
+
+        fine (`mind.system.MembranesDesignModel`) : finer model (solved)
+
+        order (`Int`) : convergence order of the discretisation
+
+    Returns:
+        `Float` : maximum of the relative error of the objective and of
+        absolute errors of product's purities
+    """
+    ratio = (max(fine.parameter.discretisation) /
+             max(coarse.parameter.discretisation))**order
+    factor = ratio / (ratio - 1)
+    f_coarse = coarse.instance.obj()
+    f_fine = fine.instance.obj()
+    errors = [factor * abs(f_coarse - f_fine) / max(abs(f_fine), 1e-12)]
+    for j in fine.instance.components:
+        errors.append(factor * abs(
+            pe.value(coarse.instance.XOUT_prod[j]) -
+            pe.value(fine.instance.XOUT_prod[j])))
+    return max(errors)
+
+
+# solver's caller attributes changed by the local searches of a selection
+SOLVER_STATE = ('nloc', 'nloc_simpl', 'n_unfeas', 'n_unfeas_simpl',
+                'solver_result', 'solver_result_simpl')
+
+
+@contextlib.contextmanager
+def preserved_state(optimisation):
+    """Restore counters and random generators of a solver's caller on exit.
+
+    Local searches done to select a discretisation are not part of the
+    optimisation : they must change neither its statistics nor its random
+    sequences of starting points and perturbations.
+
+    Args:
+
+        optimisation (`mind.solve.GlobalOptimisation`) : solver's caller
+    """
+    state = {name: getattr(optimisation, name) for name in SOLVER_STATE}
+    random_states = (optimisation.random_generationMulti.getstate(),
+                     optimisation.random_generationPert.getstate())
+    try:
+        yield optimisation
+    finally:
+        for name, value in state.items():
+            setattr(optimisation, name, value)
+        optimisation.random_generationMulti.setstate(random_states[0])
+        optimisation.random_generationPert.setstate(random_states[1])
+
+
+class DiscretisationCache:
+    """Selected discretisations by instance's datafiles (`JSON` file).
+
+    An entry is dropped when one of its datafiles (instance, permeability
+    and economic datafiles) is modified.
+
+    Attributes:
+
+        filename (`str`) : path to the cache file
+
+        entries (`dict`) : cached entries by key
+    """
+
+    def __init__(self, filename):
+        self.filename = filename
+        self.entries = {}
+        if os.path.exists(filename):
+            try:
+                with open(filename) as file:
+                    self.entries = json.load(file)
+            except ValueError:
+                logger.warning("Invalid discretisation cache %s : ignored",
+                               filename)
+
+    @staticmethod
+    def key(parameter, datafiles, tolerance):
+        """Key of instance's datafiles and configuration.
+
+        Args:
+
+            parameter (`mind.builder.Configuration`) : design process
+            configuration (target discretisation)
+
+            datafiles (`List[str]`) : instance, permeability and economic
+            datafiles
+
+            tolerance (`Float`) : tolerance of the selection
+
+        Returns:
+            `str`
+        """
+        return json.dumps([[os.path.abspath(fname) for fname in datafiles],
+                           parameter.discretisation, parameter.collocation,
+                           tolerance])
+
+    @staticmethod
+    def mtimes(datafiles):
+        """Modification times of datafiles (`None` for a missing one)."""
+        return [
+            os.path.getmtime(fname) if os.path.exists(fname) else None
+            for fname in datafiles
+        ]
+
+    def get(self, parameter, datafiles, tolerance):
+        """Cached number of cells of each membrane.
+
+        Args:
+
+            parameter (`mind.builder.Configuration`) : design process
+            configuration
+
+            datafiles (`List[str]`) : instance, permeability and economic
+            datafiles
+
+            tolerance (`Float`) : tolerance of the selection
+
+        Returns:
+            `Int` (`None` if not cached or a datafile modified)
+        """
+        entry = self.entries.get(self.key(parameter, datafiles, tolerance))
+        if entry is None or entry['mtimes'] != self.mtimes(datafiles):
+            return None
+        return entry['nb_cells']
+
+    def store(self, parameter, datafiles, tolerance, nb_cells):
+        """Cache a selected number of cells of each membrane.
+
+        Args:
+
+            parameter (`mind.builder.Configuration`) : design process
+            configuration
+
+            datafiles (`List[str]`) : instance, permeability and economic
+            datafiles
+
+            tolerance (`Float`) : tolerance of the selection
+
+            nb_cells (`Int`) : selected number of cells of each membrane
+        """
+        self.entries[self.key(parameter, datafiles, tolerance)] = {
+            'mtimes': self.mtimes(datafiles),
+            'nb_cells': nb_cells
+        }
+        with open(self.filename, 'w') as file:
+            json.dump(self.entries, file, indent=1)
+
+
+def select_discretisation(optimisation,
+                          parameter,
+                          fname,
+                          perm_filename,
+                          fname_eco,
+                          log_dir,
+                          fname_mask='',
+                          tolerance=1e-3,
+                          first_cells=10,
+                          max_trials=5,
+                          cache_filename=None):
+    """Build the model with the smallest discretisation of membranes whose
+    solution is accurate enough.
+
+    Starting from `first_cells` cells by membrane (at most the discretisation
+    of `parameter`, the finest one), a solution is found then interpolated
+    and solved on twice as many cells, until the Richardson estimate of the
+    error (`discretisation_error`) is below `tolerance`. The selected number
+    of cells is cached by instance's datafiles. Counters and random
+    generators of `optimisation` are left unchanged (`preserved_state`).
+
+    Args:
+
+        optimisation (`mind.solve.GlobalOptimisation`) : solver's caller
+
+        parameter (`mind.builder.Configuration`) : design process configuration
+
+        fname, perm_filename, fname_eco, log_dir, fname_mask : see
+        `mind.builder.build_model`
+
+        tolerance (`Float`) : tolerance on the objective (relative) and on
+        product's purities (`default = 1e-3`)
+
+        first_cells (`Int`) : number of cells by membrane of the first
+        model (`default = 10`)
+
+        max_trials (`Int`) : number of starting points tried to find a
+        first solution (`default = 5`)
+
+        cache_filename (`str`) : cache file (`default = None`,
+        `DISCRETISATION_CACHE` in `log_dir`)
+
+    Returns:
+        `mind.system.MembranesDesignModel`
+    """
+    try:
+        assert tolerance > 0 and first_cells >= 1
+    except AssertionError:
+        logger.exception("Invalid discretisation selection (tolerance %s, "
+                         "first cells %s)", tolerance, first_cells)
+        raise ValueError("Tolerance must be > 0 and first cells >= 1")
+
+    cache = DiscretisationCache(cache_filename or
+                                os.path.join(log_dir, DISCRETISATION_CACHE))
+    target = max(parameter.discretisation)
+    datafiles = [fname, perm_filename, fname_eco]
+    nb_cells = cache.get(parameter, datafiles, tolerance)
+    if nb_cells is not None:
+        logger.info("Cached discretisation : %d cells by membrane", nb_cells)
+        return build_model(coarse_configuration(parameter, nb_cells), fname,
+                           perm_filename, fname_eco, log_dir, fname_mask)
+
+    def build(cells):
+        return build_model(coarse_configuration(parameter, cells), fname,
+                           perm_filename, fname_eco, log_dir, fname_mask)
+
+    def solve(modelisation):
+        for trial in range(1, max_trials + 1):
+            logger.info("Discretisation %s : starting point %d",
+                        modelisation.parameter.discretisation, trial)
+            optimisation.construct_starting_point(modelisation)
+            if optimisation.run_local_search(modelisation.instance):
+                return True
+        return False
+
+    order = refinement_order(parameter)
+    with preserved_state(optimisation):
+        coarse = build(min(first_cells, target))
+        feasible = solve(coarse)
+        while feasible and max(coarse.parameter.discretisation) < target:
+            fine = build(2 * max(coarse.parameter.discretisation))
+            ResolutionTransfer(coarse, fine).apply()
+            if not (optimisation.run_local_search(fine.instance)
+                    or solve(fine)):
+                feasible = False
+                break
+            error = discretisation_error(coarse, fine, order)
+            logger.info("Discretisation %s : estimated error %g",
+                        coarse.parameter.discretisation, error)
+            if error <= tolerance:
+                break
+            coarse = fine
+
+    if not feasible:
+        logger.warning("No solution to compare discretisations : target "
+                       "discretisation %s kept", parameter.discretisation)
+        return build_model(parameter, fname, perm_filename, fname_eco,
+                           log_dir, fname_mask)
+
+    nb_cells = max(coarse.parameter.discretisation)
+    logger.info("Selected discretisation : %s",
+                coarse.parameter.discretisation)
+    cache.store(parameter, datafiles, tolerance, nb_cells)
+    return coarse
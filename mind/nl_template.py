@@ -0,0 +1,543 @@
+"""Reusable `NL` files of model's instances.
+
+Between two local searches of the global optimisation algorithms only the
+starting point (and sometimes some bounds) of the model change. An
+`NLTemplate` keeps the `NL` file written once by `PYOMO` for a given state
+of the model (active constraints and objectives, fixed variables) and only
+regenerates its initial point (`x`) and variables bounds (`b`) sections.
+
+Writing the `NL` file of a large instance takes longer than building it, so
+templates can also be kept on disk (`NLStore`) by key of the model's instance
+(configuration and datafiles hashes, `mind.datacache.model_key`) and state :
+next runs on the same model skip the first writing of each state.
+"""
+
+import os
+import json
+import shutil
+import hashlib
+import logging
+import pickle
+import tempfile
+import weakref
+from array import array
+from collections import OrderedDict
+
+import pyomo.environ as pe
+from pyomo.opt import ProblemFormat
+from pyomo.core.base.symbol_map import SymbolMap
+from pyomo.core.expr.visitor import identify_variables, \
+    identify_mutable_parameters
+from pyomo.version import version as pyomo_version
+
+from mind.datacache import model_keys
+
+# logging variable
+logger = logging.getLogger(__name__)
+logger.setLevel(level=logging.DEBUG)
+handler = logging.StreamHandler()
+# handler = logging.FileHandler(filename)
+logger.addHandler(handler)
+formatter = logging.Formatter(fmt='[%(asctime)s] %(levelname)s : %(message)s',
+                              datefmt='%a, %d %b %Y %H:%M:%S')
+handler.setFormatter(formatter)
+
+# first character of lines starting a segment of an (ascii) NL file
+NL_SEGMENTS = 'CLOVFSGJdxrbk'
+
+# components of NL files by first character of their symbols
+NL_COMPONENTS = (('v', pe.Var), ('c', pe.Constraint), ('o', pe.Objective))
+
+
+def nl_number(value):
+    """Text of a number in `NL` file (as written by `PYOMO`).
+
+    Args:
+        value (`Float`) : number
+
+    Returns:
+        `str`
+    """
+    if type(value) not in (int, float):
+        value = float(value)
+    return repr(value)
+
+
+def model_state(model):
+    """Signature of the structure of a model's instance.
+
+    It changes when constraints or objectives are activated / deactivated
+    or when variables are fixed / unfixed.
+
+    Args:
+        model (`pyomo.environ.ConcreteModel`) : model's instance
+
+    Returns:
+        hashable signature
+    """
+    return (tuple(
+        id(ctr)
+        for ctr in model.component_data_objects(pe.Constraint, active=True)),
+            tuple(id(obj) for obj in model.component_data_objects(
+                pe.Objective, active=True)),
+            tuple(
+                id(var)
+                for var in model.component_data_objects(pe.Var)
+                if var.fixed))
+
+
+def model_structure(model):
+    """Signature of the state of a model's instance by positions of its
+    components (the same for identical instances of different processes,
+    unlike `model_state`).
+
+    Args:
+        model (`pyomo.environ.ConcreteModel`) : model's instance
+
+    Returns:
+        `List` of positions of inactive constraints, inactive objectives and
+        fixed variables
+    """
+    structure = []
+    for component in (pe.Constraint, pe.Objective):
+        active = {
+            id(data)
+            for data in model.component_data_objects(component, active=True)
+        }
+        structure.append([
+            k for k, data in enumerate(model.component_data_objects(component))
+            if id(data) not in active
+        ])
+    structure.append([
+        k for k, var in enumerate(model.component_data_objects(pe.Var))
+        if var.fixed
+    ])
+    return structure
+
+
+def model_constants(model):
+    """Fixed variables and mutable parameters used by active constraints and
+    objectives of a model's instance (written as constants by solvers'
+    interfaces).
+
+    Args:
+        model (`pyomo.environ.ConcreteModel`) : model's instance
+
+    Returns:
+        `List` of pairs (component's data, current value)
+    """
+    constants = []
+    seen = set()
+    for component in (pe.Constraint, pe.Objective):
+        for data in model.component_data_objects(component, active=True):
+            for var in identify_variables(data.expr, include_fixed=True):
+                if var.fixed and id(var) not in seen:
+                    seen.add(id(var))
+                    constants.append((var, var.value))
+            for param in identify_mutable_parameters(data.expr):
+                if id(param) not in seen:
+                    seen.add(id(param))
+                    constants.append((param, param.value))
+    return constants
+
+
+def constants_unchanged(constants):
+    """Check that values of `model_constants` are unchanged.
+
+    Args:
+        constants (`List`) : pairs returned by `model_constants`
+
+    Returns:
+        `True` if all values are unchanged
+    """
+    return all(data.value == value for data, value in constants)
+
+
+class NLTemplate:
+    """`NL` file of a given state of a model's instance.
+
+    Attributes:
+
+        filename (`str`) : path to the `NL` file
+
+        symbol_map (`pyomo.core.base.symbol_map.SymbolMap`) : `PYOMO`'s
+        symbol map of the `NL` file
+
+        variables (`List`) : variables of the `NL` file (`NL` order)
+
+        segments (`List`) : list of (segment's key, segment's lines) of the file
+
+        dependencies (`List`) : pairs of fixed variables or mutable
+        parameters used by active constraints and objectives, with the
+        value written in the file
+    """
+
+    def __init__(self, model, filename, io_options=None):
+        self.filename = filename
+        _, smap_id = model.write(filename,
+                                 format=ProblemFormat.nl,
+                                 io_options=io_options or {})
+        self.symbol_map = model.solutions.symbol_map[smap_id]
+        model.solutions.delete_symbol_map(smap_id)
+        self.read_segments()
+        self.dependencies = model_constants(model)
+
+    @classmethod
+    def restore(cls, filename, symbol_map, segments, dependencies):
+        """Template of an `NL` file written by another run (see `NLStore`),
+        the file is written by `NLTemplate.write`.
+
+        Args:
+
+            filename (`str`) : path to the `NL` file
+
+            symbol_map (`pyomo.core.base.symbol_map.SymbolMap`) : symbol map
+            of the file, on the current model's instance
+
+            segments (`List`) : see `NLTemplate.segments`
+
+            dependencies (`List`) : see `NLTemplate.dependencies`
+
+        Returns:
+            `mind.nl_template.NLTemplate`
+        """
+        template = cls.__new__(cls)
+        template.filename = filename
+        template.symbol_map = symbol_map
+        nb_vars = sum(1 for symbol in symbol_map.bySymbol if symbol[0] == 'v')
+        template.variables = [
+            symbol_map.getObject('v' + str(i)) for i in range(nb_vars)
+        ]
+        template.segments = segments
+        template.dependencies = dependencies
+        return template
+
+    def read_segments(self):
+        """Split the file into segments and find its variables."""
+        with open(self.filename, 'r') as nl_file:
+            lines = nl_file.readlines()
+        # second line of header : number of variables first
+        nb_vars = int(lines[1].split()[0])
+        self.variables = [
+            self.symbol_map.getObject('v' + str(i)) for i in range(nb_vars)
+        ]
+        self.segments = [('header', [])]
+        for line in lines:
+            if line[0] in NL_SEGMENTS:
+                self.segments.append((line[0], [line]))
+            else:
+                self.segments[-1][1].append(line)
+
+        keys = [key for key, _ in self.segments]
+        if 'x' not in keys:
+            position = keys.index('r') if 'r' in keys else keys.index('b')
+            self.segments.insert(position, ('x', []))
+
+    def is_valid(self):
+        """Check that values written as constants in the file are unchanged.
+
+        Returns:
+            `True` if the file can be reused
+        """
+        return constants_unchanged(self.dependencies)
+
+    def write(self):
+        """Rewrite the file with the current point and variables bounds."""
+        initial_point = [
+            "{} {}\n".format(i, nl_number(var.value))
+            for i, var in enumerate(self.variables) if var.value is not None
+        ]
+        bounds = ["b\n"]
+        for var in self.variables:
+            lower = var.lb
+            upper = var.ub
+            if lower is not None:
+                if upper is not None:
+                    if lower == upper:
+                        bounds.append("4 {}\n".format(nl_number(lower)))
+                    else:
+                        bounds.append("0 {} {}\n".format(
+                            nl_number(lower), nl_number(upper)))
+                else:
+                    bounds.append("2 {}\n".format(nl_number(lower)))
+            elif upper is not None:
+                bounds.append("1 {}\n".format(nl_number(upper)))
+            else:
+                bounds.append("3\n")
+
+        with open(self.filename, 'w') as nl_file:
+            for key, lines in self.segments:
+                if key == 'x':
+                    if initial_point:
+                        nl_file.write("x{}\n".format(len(initial_point)))
+                        nl_file.writelines(initial_point)
+                elif key == 'b':
+                    nl_file.writelines(bounds)
+                else:
+                    nl_file.writelines(lines)
+
+
+class NLStore:
+    """`NL` templates kept on disk by key of model's instance and state.
+
+    A stored template holds the `NL` file's segments, its symbols and
+    dependencies by positions of components in the model's instance
+    (identical instances have the same key, see `mind.datacache.model_key`).
+    Only instances built by `mind.builder.build_model` (registered in
+    `mind.datacache.model_keys`) are stored.
+
+    Attributes:
+        directory (`str`) : directory of stored templates
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def key(self, model, io_options):
+        """Key of the current state of a model's instance.
+
+        Args:
+
+            model (`pyomo.environ.ConcreteModel`) : model's instance
+
+            io_options (`DICT`) : `PYOMO`'s NL writer options
+
+        Returns:
+            `str` (`None` if the instance isn't registered)
+        """
+        instance_key = model_keys.get(model)
+        if instance_key is None:
+            return None
+        description = json.dumps(
+            [instance_key,
+             model_structure(model), io_options, pyomo_version],
+            sort_keys=True,
+            default=repr)
+        return hashlib.sha1(description.encode()).hexdigest()
+
+    def filename(self, key):
+        """Path to a stored template.
+
+        Args:
+            key (`str`) : key of model's state
+
+        Returns:
+            `str`
+        """
+        return os.path.join(self.directory, key + '.nl.pickle')
+
+    @staticmethod
+    def components(model):
+        """Components of a model's instance which can be in `NL` files.
+
+        Args:
+            model (`pyomo.environ.ConcreteModel`) : model's instance
+
+        Returns:
+            `DICT` of `List` of components' data by first character of
+            their symbols
+        """
+        return {
+            kind: list(model.component_data_objects(component))
+            for kind, component in NL_COMPONENTS
+        }
+
+    def load(self, key, model, filename):
+        """Template stored for the current state of a model's instance.
+
+        Args:
+
+            key (`str`) : key of model's state (see `NLStore.key`)
+
+            model (`pyomo.environ.ConcreteModel`) : model's instance
+
+            filename (`str`) : path to the `NL` file of the template
+
+        Returns:
+            `mind.nl_template.NLTemplate` (`None` if not stored)
+        """
+        if not os.path.exists(self.filename(key)):
+            return None
+        try:
+            with open(self.filename(key), 'rb') as file:
+                stored = pickle.load(file)
+        except Exception:
+            logger.warning("Invalid stored NL template %s : ignored",
+                           self.filename(key))
+            return None
+
+        components = self.components(model)
+        if stored['counts'] != {
+                kind: len(data) for kind, data in components.items()
+        }:
+            return None
+        symbol_map = SymbolMap()
+        for kind, symbols in stored['symbols'].items():
+            data = components[kind]
+            symbol_map.addSymbols((data[position], kind + str(k))
+                                  for k, position in enumerate(symbols))
+        params = list(model.component_data_objects(pe.Param))
+        dependencies = [
+            (components['v'][position] if kind == 'v' else params[position],
+             value) for kind, position, value in stored['dependencies']
+        ]
+        logger.info("Stored NL template %s loaded", self.filename(key))
+        return NLTemplate.restore(filename, symbol_map, stored['segments'],
+                                  dependencies)
+
+    def save(self, key, model, template):
+        """Store the template of the current state of a model's instance
+        (ignored if directory not writable).
+
+        Args:
+
+            key (`str`) : key of model's state (see `NLStore.key`)
+
+            model (`pyomo.environ.ConcreteModel`) : model's instance
+
+            template (`mind.nl_template.NLTemplate`) : template just written
+        """
+        components = self.components(model)
+        positions = {
+            kind: {id(obj): k for k, obj in enumerate(data)}
+            for kind, data in components.items()
+        }
+        positions['p'] = {
+            id(param): k
+            for k, param in enumerate(model.component_data_objects(pe.Param))
+        }
+        # positions of components by kind, in order of symbols' numbers
+        symbols = {kind: {} for kind, _ in NL_COMPONENTS}
+        for symbol, obj in template.symbol_map.bySymbol.items():
+            symbols[symbol[0]][int(symbol[1:])] = positions[symbol[0]][id(obj)]
+        symbols = {
+            kind: array('l', (numbers[k] for k in range(len(numbers))))
+            for kind, numbers in symbols.items()
+        }
+        dependencies = []
+        for data, value in template.dependencies:
+            kind = 'v' if id(data) in positions['v'] else 'p'
+            dependencies.append((kind, positions[kind][id(data)], value))
+        # texts between rewritten segments (pickled faster than lines)
+        segments = []
+        for segment, lines in template.segments:
+            if segment in 'xb' or not segments or segments[-1][0] in 'xb':
+                segments.append((segment, []))
+            segments[-1][1].extend(lines)
+        stored = {
+            'segments': [(segment, [''.join(lines)])
+                         for segment, lines in segments],
+            'counts': {kind: len(data) for kind, data in components.items()},
+            'symbols': symbols,
+            'dependencies': dependencies
+        }
+
+        filename = self.filename(key)
+        # written then renamed : other processes never read a partial file
+        temporary = filename + '.' + str(os.getpid())
+        try:
+            with open(temporary, 'wb') as file:
+                pickle.dump(stored, file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temporary, filename)
+        except OSError:
+            logger.warning("NL template can't be stored in %s", filename)
+
+
+class NLCache:
+    """Cache of `NL` templates, one for each state of each model's instance
+    (ex: full and simplified design process model).
+
+    Attributes:
+
+        directory (`str`) : temporary directory of `NL` files
+
+        templates (`OrderedDict`) : templates by (model, state) keys
+
+        max_size (`Int`) : maximal number of templates kept (`default = 8`)
+
+        io_options (`DICT`) : `PYOMO`'s NL writer options
+
+        store (`mind.nl_template.NLStore`) : templates kept on disk for next
+        runs (`None` if not kept)
+    """
+
+    def __init__(self, max_size=8, io_options=None, store=None):
+        self.directory = tempfile.mkdtemp(prefix='mind_nl_')
+        self.templates = OrderedDict()
+        self.max_size = max_size
+        self.io_options = io_options or {'symbolic_solver_labels': False}
+        self.store = store
+        self.counter = 0
+        weakref.finalize(self, shutil.rmtree, self.directory, True)
+
+    def template(self, model):
+        """`NL` template of the current state of `model` (created if needed).
+
+        Args:
+            model (`pyomo.environ.ConcreteModel`) : model's instance
+
+        Returns:
+            `mind.nl_template.NLTemplate` whose file holds the current point
+        """
+        key = (id(model), model_state(model))
+        template = self.templates.get(key)
+        if template is not None and template.is_valid():
+            self.templates.move_to_end(key)
+            template.write()
+            return template
+
+        store_key = None
+        if self.store is not None:
+            store_key = self.store.key(model, self.io_options)
+        if template is not None:
+            logger.info("NL template outdated (modified constant values)")
+            filename = template.filename
+            template = None
+        else:
+            self.counter += 1
+            filename = (self.directory + os.path.sep + "template_" +
+                        str(self.counter) + ".nl")
+            if store_key is not None:
+                template = self.store.load(store_key, model, filename)
+            if template is not None and template.is_valid():
+                template.write()
+            else:
+                template = None
+        if template is None:
+            logger.info("Writing NL template %s", filename)
+            template = NLTemplate(model, filename, self.io_options)
+            if store_key is not None:
+                self.store.save(store_key, model, template)
+        self.templates[key] = template
+        self.templates.move_to_end(key)
+        while len(self.templates) > self.max_size:
+            _, old_template = self.templates.popitem(last=False)
+            if os.path.exists(old_template.filename):
+                os.remove(old_template.filename)
+        return template
+
+    def solve(self, the_solver, model, load_solutions=True, **kwds):
+        """Solve `model` from its `NL` template.
+
+        Args:
+
+            the_solver (`Solver`) : `PYOMO`'s solver object (`NL` based)
+
+            model (`pyomo.environ.ConcreteModel`) : model's instance
+
+            load_solutions (`Bool`) : `True` if solution is loaded in model
+
+            kwds : others `PYOMO`'s solve parameters
+
+        Returns:
+            `PYOMO`'s results object, loadable with `model.solutions.load_from`
+        """
+        template = self.template(model)
+        results = the_solver.solve(template.filename,
+                                   load_solutions=False,
+                                   **kwds)
+        results._smap = template.symbol_map
+        if load_solutions:
+            model.solutions.load_from(results)
+        return results
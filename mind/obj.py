@@ -6,6 +6,7 @@ import os
 
 import pyomo.environ as pe
 
+from mind.datacache import parsed_data
 from mind.util import generate_absolute_path
 
 # logging variable
@@ -93,7 +94,8 @@ class ObjFunction():
 
         """
         self.parameter = parameter
-        economic = self.load_coef(fname_eco)
+        economic = parsed_data.load('economic', fname_eco, self.load_coef,
+                                    parameter.pickle_data)
         # Parameters data
         self.nu = economic['nu'] if 'nu' in economic.keys() else None
         self.kmr = economic['K_mr'] if 'K_mr' in economic.keys() else None
@@ -11,11 +11,37 @@ def initZero(model_instance):
         model_instance (`mind.system.MembranesDesignModel`) : design process model's instance
     """
     out_var = ["OUT_prod", "OUT_waste", "XOUT_prod", "XOUT_waste"]
-    for v in model_instance.component_objects(pe.Var, active=True):
-        varobject = getattr(model_instance, str(v))
-        for index in varobject:
-            if not varobject[index].fixed:
-                varobject[index] = varobject[index].lb or 0.0
+    for var in model_instance.component_data_objects(pe.Var, active=True):
+        if not var.fixed:
+            var.set_value(var.lb or 0.0)
+
+
+def bulk_rule(builder):
+    """Rule of an indexed constraint whose expressions are built in bulk.
+
+    `builder(model)` returns the expressions of all indexes at once
+    (`dict`, a missing index is skipped). It is called once by instance, at
+    the construction of the first index, so loop invariants (coefficients,
+    variables shared by several constraints) are computed once by membrane
+    instead of once by index.
+
+    Args:
+        builder (`Callable`) : function of the model's instance returning
+        expressions by index
+
+    Returns:
+        `Callable` rule of `pyomo.environ.Constraint`
+    """
+    built = {}
+
+    def rule(model, *index):
+        if built.get('model') is not model:
+            built['model'] = model
+            built['expressions'] = builder(model)
+        return built['expressions'].pop(
+            index if len(index) > 1 else index[0], pe.Constraint.Skip)
+
+    return rule
 
 
 def printDifferences(difflist, outfile=None):
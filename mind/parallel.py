@@ -0,0 +1,311 @@
+"""Process-pool helpers to run design process searches concurrently.
+
+Each worker process owns its own model's instance (built from the same
+configuration and datafiles than the coordinator) and its own solver
+object. Only plain values (objective, variables values, status, counters)
+travel between the worker processes and the coordinator, which keep
+ownership of `fputative`, `keep_sols` and the best/stationary files.
+"""
+
+import os
+import copy
+import logging
+from concurrent.futures import ProcessPoolExecutor
+
+from mind.builder import build_model
+from mind.interfaceSolver import SolverObject
+
+# logging variable
+logger = logging.getLogger(__name__)
+logger.setLevel(level=logging.DEBUG)
+handler = logging.StreamHandler()
+# handler = logging.FileHandler(filename)
+logger.addHandler(handler)
+formatter = logging.Formatter(fmt='[%(asctime)s] %(levelname)s : %(message)s',
+                              datefmt='%a, %d %b %Y %H:%M:%S')
+handler.setFormatter(formatter)
+
+# state of the current worker process (see `init_worker`)
+_worker = None
+
+
+class WorkerSpec:
+    """Picklable description of what a worker process needs to rebuild
+    the coordinator's model and solver.
+
+    Attributes:
+
+        parameter (`mind.builder.Configuration`) : design process configuration
+        (without labels of the coordinator's instance)
+
+        filename (`str`) : absolute path to instance datafile
+
+        perm_filename (`str`) : absolute path to permeability datafile
+
+        eco_filename (`str`) : absolute path to economic datafile
+
+        mask_filename (`str`) : absolute path to fixing datafile (or `''`)
+
+        log_dir (`str`) : coordinator's log directory
+
+        solver_class (`type`) : class of the coordinator's global optimisation solver
+
+        solver_name (`str`) : name of `PYOMO`'s solver
+
+        solver_path (`str`) : path to solver executable
+
+        gams (`Bool`) : `True` if `GAMS` 's modelizer is used
+
+        maxtime (`Int`) : solver time limit
+
+        reuse_nl (`Bool`) : `True` if solver reuses `NL` files between solves
+
+        inprocess (`Bool`) : `True` if local searches are solved in-process
+
+        model_cache (`str`) : directory of `NL` files kept for next runs
+
+        debug (`Bool`) : solver debug flag
+
+        starting_point (`Bool`) : solver starting point flag
+
+        simplified_model (`Bool`) : solver simplified model flag
+    """
+
+    def __init__(self, my_solver, modelisation):
+        self.parameter = copy.copy(modelisation.parameter)
+        self.parameter.labels = None
+        self.parameter.layout = None
+        self.parameter.init_status = {}
+
+        self.filename = os.path.abspath(modelisation.filename)
+        self.perm_filename = os.path.abspath(modelisation.perm_filename)
+        self.eco_filename = os.path.abspath(modelisation.eco_filename)
+        self.mask_filename = (os.path.abspath(modelisation.mask_filename)
+                              if modelisation.mask_filename else '')
+        self.log_dir = os.path.abspath(my_solver.log_dir) + os.path.sep
+
+        optsolver = my_solver.optsolver
+        self.solver_class = type(my_solver)
+        self.solver_name = optsolver.solver_name
+        self.solver_path = optsolver.solver_path
+        self.gams = optsolver.is_gams_model
+        self.maxtime = optsolver.maxtime
+        self.reuse_nl = optsolver.nl_cache is not None
+        self.inprocess = optsolver.inprocess
+        self.model_cache = optsolver.model_cache
+
+        self.debug = my_solver.debug_mode
+        self.starting_point = my_solver.start_point_flag
+        self.simplified_model = my_solver.simplified_flag
+
+    def worker_directory(self):
+        """Create (if needed) the private log directory of the current process.
+
+        Returns:
+            path to the worker directory
+        """
+        workdir = (self.log_dir + "workers" + os.path.sep + "worker_" +
+                   str(os.getpid()) + os.path.sep)
+        os.makedirs(workdir + "solver", exist_ok=True)
+        return workdir
+
+    def build_modelisation(self, workdir):
+        """Build design process model in the worker directory.
+
+        Args:
+            workdir (`str`) : worker directory
+
+        Returns:
+            `mind.system.MembranesDesignModel`
+        """
+        return build_model(copy.deepcopy(self.parameter), self.filename,
+                           self.perm_filename, self.eco_filename, workdir,
+                           self.mask_filename)
+
+    def build_solver(self, workdir):
+        """Build global optimisation solver logging in `workdir`.
+
+        Args:
+            workdir (`str`) : worker directory
+
+        Returns:
+            `mind.solve.GlobalOptimisation`
+        """
+        optsolver = SolverObject(self.maxtime, self.reuse_nl,
+                                 self.inprocess, self.model_cache)
+        optsolver.solver_factory(solver_name=self.solver_name,
+                                 solver_path=self.solver_path,
+                                 gams=self.gams)
+        return self.solver_class(optsolver, workdir, self.debug,
+                                 self.starting_point, self.simplified_model)
+
+
+class WorkerContext:
+    """Objects owned by a worker process.
+
+    Attributes:
+
+        spec (`mind.parallel.WorkerSpec`) : description of the worker
+
+        workdir (`str`) : private log directory of the worker
+
+        solver (`mind.solve.GlobalOptimisation`) : worker's solver
+
+        modelisation (`mind.system.MembranesDesignModel`) : worker's model
+
+        cache (`DICT`) : objects kept by tasks from one call to another
+    """
+
+    def __init__(self, spec, incumbent=None):
+        self.spec = spec
+        self.workdir = spec.worker_directory()
+        # solvers write their logs (ex: knitro.log) in current directory
+        os.chdir(self.workdir)
+        self.solver = spec.build_solver(self.workdir)
+        self.solver.incumbent = incumbent
+        self.modelisation = spec.build_modelisation(self.workdir)
+        self.cache = {}
+
+
+def init_worker(spec, incumbent=None):
+    """Worker process initializer : build its own model and solver.
+
+    Args:
+        spec (`mind.parallel.WorkerSpec`) : description of the worker
+
+        incumbent (`multiprocessing.Value`) : best objective function value
+        shared by all processes (`default = None`)
+    """
+    global _worker
+    try:
+        _worker = WorkerContext(spec, incumbent)
+    except Exception:
+        logger.exception("Worker process %s failed to build its model",
+                         os.getpid())
+        raise
+
+
+def current_worker():
+    """Context of the current worker process.
+
+    Returns:
+        `mind.parallel.WorkerContext`
+
+    Raises:
+        ValueError: If called outside a worker process
+    """
+    if _worker is None:
+        raise ValueError("No worker context : process not started by "
+                         "`mind.parallel.create_pool`")
+    return _worker
+
+
+def create_pool(my_solver, modelisation, nb_workers, incumbent=None):
+    """Create a pool of worker processes mirroring the coordinator's objects.
+
+    Tasks are handed to processes as soon as they are free, so tasks of
+    uneven length keep every worker busy.
+
+    Args:
+
+        my_solver (`mind.solve.GlobalOptimisation`) : coordinator's solver
+
+        modelisation (`mind.system.MembranesDesignModel`) : coordinator's model
+
+        nb_workers (`Int`) : number of worker processes
+
+        incumbent (`multiprocessing.Value`) : best objective function value
+        shared by all processes (`default = None`)
+
+    Returns:
+        `concurrent.futures.ProcessPoolExecutor`
+    """
+    spec = WorkerSpec(my_solver, modelisation)
+    logger.info("Starting %d worker processes (logs in %sworkers)",
+                nb_workers, spec.log_dir)
+    return ProcessPoolExecutor(max_workers=nb_workers,
+                               initializer=init_worker,
+                               initargs=(spec, incumbent))
+
+
+def multistart_task(seed):
+    """One multistart iteration executed in a worker process.
+
+    Args:
+        seed (`Int`) : seed of the worker's `random_generationMulti`
+
+    Returns:
+        tuple (feasible, objective, point, statistics) where `point` is the
+        array of variables values (`mind.snapshot.VariableLayout` order)
+    """
+    worker = current_worker()
+    solver = worker.solver
+    modelisation = worker.modelisation
+
+    solver.random_generationMulti.seed(seed)
+    solver.active_generationMulti = True
+    stats = solver.statistics()
+
+    solver.construct_starting_point(modelisation)
+    feasible = solver.run_local_search(modelisation.instance)
+
+    objective = None
+    point = None
+    if feasible:
+        objective = modelisation.instance.obj()
+        solver.store_model_to_point(modelisation.instance,
+                                    modelisation.parameter)
+        point = solver.Z_point.values
+
+    return (feasible, objective, point, solver.statistics(stats))
+
+
+def mbh_chain_task(seed1, seed2, max_trials_starting_points, max_no_improve):
+    """One `find_starting_solution` + `mbh` chain executed in a worker process.
+
+    Improvements are compared to the incumbent shared by all processes.
+
+    Args:
+
+        seed1 (`Int`) : seed of the worker's `random_generationMulti`
+
+        seed2 (`Int`) : seed of the worker's `random_generationPert`
+
+        max_trials_starting_points (`Int`): maximal number of trials
+
+        max_no_improve (`Int`): Terminaison condition of `mbh`
+
+    Returns:
+        tuple (feasible, objective, point, objectives, statistics) where
+        `point` is the best point of the chain improving the incumbent
+        (array of variables values, `None` otherwise) and `objectives` the
+        new feasible objective values found by the chain
+    """
+    worker = current_worker()
+    solver = worker.solver
+    modelisation = worker.modelisation
+
+    solver.random_generationMulti.seed(seed1)
+    solver.random_generationPert.seed(seed2)
+    solver.active_generationMulti = True
+    solver.active_generationPert = True
+    stats = solver.statistics()
+    nb_sols = len(solver.keep_sols)
+    solver.putative_solution = {}
+
+    feasible = solver.find_starting_solution(modelisation,
+                                             max_trials_starting_points)
+    if feasible:
+        solver.mbh(modelisation,
+                   max_trials_starting_points,
+                   max_no_improve,
+                   given_starting_point=True)
+
+    objective = None
+    point = None
+    if solver.putative_solution:
+        objective = solver.fputative
+        point = solver.putative_solution.values
+
+    return (feasible, objective, point, solver.keep_sols[nb_sols:],
+            solver.statistics(stats))
@@ -10,6 +10,7 @@ import pyomo.environ as pe
 
 from mind.builder import Configuration, build_model
 from mind.fixing import fixing_method
+from mind.parallel import create_pool, current_worker
 from mind.util import generate_absolute_path
 
 # logging variable
@@ -47,8 +48,8 @@ class Individu:
             period (`Int`) : number of period passed without upgrading
             solution of this `family_index`
 
-            model_value (`DICT`) : associative data structure containing
-            pair of models' variables and it's values
+            model_value (`mind.snapshot.Point`) : associative data structure
+            containing pair of models' variables and it's values
 
             obj (`Float`) : objective's function value of current individual
     """
@@ -99,7 +100,7 @@ class Individu:
         """
         solver.store_model_to_point(self.modelisation.instance,
                                     self.modelisation.parameter)
-        self.model_value = dict(solver.Z_point)
+        self.model_value = solver.Z_point.copy()
 
     def restoring_model_values(self, solver):
         """Restoring optimization model's instance status to `Pyomo` 's model object.
@@ -108,7 +109,7 @@ class Individu:
 
             solver (`mind.solve.GlobalOptimisation`) : design process's solver
         """
-        solver.Z_point = dict(self.model_value)
+        solver.Z_point = self.model_value.copy()
         solver.restore_model_from_point(self.modelisation.instance)
 
 
@@ -161,9 +162,16 @@ class PopAlgortihm:
 
         marker_in_list (`Int`) : cursor for visiting each element in `individual_list`
 
+        instance_file (`str`) : absolute path to prototype datafile
+
+        nb_workers (`Int`) : number of worker processes evolving individuals
+
+        executor (`concurrent.futures.ProcessPoolExecutor`) : pool of worker
+        processes (`None` when executed sequentially)
+
     """
 
-    def __init__(self, my_solver, instance_file):
+    def __init__(self, my_solver, instance_file, workers=None):
         self.solver = my_solver
         self.population = []
         self.population_altered = []
@@ -174,6 +182,9 @@ class PopAlgortihm:
         self.best_individu = None
         self.individual_list = parse_list_prototype(instance_file)
         self.marker_in_list = 0
+        self.instance_file = os.path.abspath(instance_file)
+        self.nb_workers = workers or my_solver.nb_workers
+        self.executor = None
 
     def create_individu(self, modelisation_template, individu_prototype,
                         identifier):
@@ -213,6 +224,7 @@ class PopAlgortihm:
                                        modelisation_template.filename,
                                        modelisation_template.perm_filename,
                                        modelisation_template.eco_filename,
+                                       self.solver.log_dir,
                                        modelisation_template.mask_filename)
 
             # modifing perm data and update model
@@ -368,6 +380,46 @@ class PopAlgortihm:
         derivated_individu.active = final_status
         self.population_altered.append(derivated_individu)
 
+    def parallel_evolve_population(self, k_iterations):
+        """Evolve operation of population's method, individuals being evolved
+        by worker processes.
+
+        Each worker creates (once) its own model of the individual from its
+        prototype and performs `evolve_population` on it. Derivated
+        individuals are appended to `population_altered` in population order.
+
+        Args:
+            k_iterations (`Int`) : number of iteration to perform for evolving
+        """
+        futures = [
+            self.executor.submit(
+                evolve_individu_task, self.instance_file,
+                individu.index_family, individu.model_value.values,
+                individu.obj, individu.active, k_iterations,
+                (self.solver.random_generationMulti.randrange(2**31),
+                 self.solver.random_generationPert.randrange(2**31)))
+            for individu in self.population
+        ]
+
+        for individu, future in zip(self.population, futures):
+            model_value, obj, active, stats = future.result()
+            self.solver.add_statistics(stats)
+            logger.info("Evolved population's individu_{}".format(
+                individu.index_family))
+
+            derivated_individu = copy.deepcopy(individu)
+            derivated_individu.model_value = (
+                derivated_individu.modelisation.parameter.layout.point(
+                    model_value))
+            derivated_individu.restoring_model_values(self.solver)
+            derivated_individu.obj = obj
+            derivated_individu.active = active
+            if active and obj is not None:
+                self.solver.save_solution(
+                    derivated_individu.modelisation,
+                    algo_identifier_str="Evolutionary method")
+            self.population_altered.append(derivated_individu)
+
     def update_population(self):
         """Update operation of population's method.
         """
@@ -491,8 +543,11 @@ class PopAlgortihm:
 
             k_iterations (`Int`) : $$\\k_{iteration}$$ coefficient
         """
-        for individu in self.population:
-            self.evolve_population(individu, k_iterations)
+        if self.executor is not None:
+            self.parallel_evolve_population(k_iterations)
+        else:
+            for individu in self.population:
+                self.evolve_population(individu, k_iterations)
 
         self.update_population()
         self.population_altered = []
@@ -515,6 +570,37 @@ class PopAlgortihm:
 
         """
         logger.info("Running modified evolutionary algorithm ...")
+        if self.nb_workers > 1:
+            with create_pool(self.solver, modelisation,
+                             self.nb_workers) as executor:
+                self.executor = executor
+                try:
+                    self.evolve(modelisation, nb_extracted, beta_one, beta_two)
+                finally:
+                    self.executor = None
+        else:
+            self.evolve(modelisation, nb_extracted, beta_one, beta_two)
+
+        # repace modelisation template by best individu (optionnal)
+        if self.best_individu:
+            modelisation = self.best_individu.modelisation
+
+        return True if self.best_individu else False
+
+    def evolve(self, modelisation, nb_extracted, beta_one, beta_two):
+        """Epoques of the population's algorithm method.
+
+        Args:
+
+            modelisation (`mind.system.MembranesDesignModel`) : design process model
+
+            nb_extracted (`Int`) : size of individual population list
+
+            beta_one (`Int`) : $$\\beta_1$$ coefficient
+
+            beta_two (`Int`) : $$\\beta_2$$ coefficient
+
+        """
         k_iterations = 3
         self.initiate_population(modelisation, nb_extracted)
 
@@ -529,8 +615,57 @@ class PopAlgortihm:
             # update marker
             marker = len(self.individual_list) + 1 if not marker else marker
 
-        # repace modelisation template by best individu (optionnal)
-        if self.best_individu:
-            modelisation = self.best_individu.modelisation
 
-        return True if self.best_individu else False
+def evolve_individu_task(instance_file, index_family, model_value, obj, active,
+                         k_iterations, seeds):
+    """Evolution of an individual in a worker process.
+
+    Args:
+
+        instance_file (`str`) : path to prototype datafile
+
+        index_family (`Int`) : identifier of individual in prototype list
+
+        model_value (`numpy.ndarray`) : model's values of the individual
+        (`mind.snapshot.VariableLayout` order)
+
+        obj (`Float`) : objective's function value of the individual
+
+        active (`Bool`) : `True` if individual is a feasible solution
+
+        k_iterations (`Int`) : number of iteration to perform for evolving
+
+        seeds (`Tuple[Int]`) : seeds of the worker's random objects
+
+    Returns:
+        tuple (model_value, obj, active, statistics) of derivated individual
+    """
+    worker = current_worker()
+    solver = worker.solver
+    stats = solver.statistics()
+    if 'population' not in worker.cache:
+        worker.cache['population'] = PopAlgortihm(solver, instance_file)
+        worker.cache['individus'] = {}
+    algorithm = worker.cache['population']
+    individus = worker.cache['individus']
+
+    if index_family not in individus:
+        individus[index_family] = algorithm.create_individu(
+            worker.modelisation, algorithm.individual_list[index_family],
+            index_family)
+    individu = individus[index_family]
+    individu.model_value = individu.modelisation.parameter.layout.point(
+        model_value)
+    individu.restoring_model_values(solver)
+    individu.obj = obj
+    individu.active = active
+
+    solver.random_generationMulti.seed(seeds[0])
+    solver.random_generationPert.seed(seeds[1])
+    solver.active_generationMulti = True
+    solver.active_generationPert = True
+    algorithm.evolve_population(individu, k_iterations)
+    derivated_individu = algorithm.population_altered.pop()
+
+    return (derivated_individu.model_value.values, derivated_individu.obj,
+            derivated_individu.active, solver.statistics(stats))
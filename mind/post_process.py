@@ -5,7 +5,6 @@ import os
 
 from pyomo.core.expr.visitor import evaluate_expression
 import pyomo.environ as pe
-import matplotlib.pyplot as plt
 
 # logging variable
 logger = logging.getLogger(__name__)
@@ -135,6 +134,8 @@ class PostProcess():
         Returns:
             plot the opex histogram.
         """
+        import matplotlib.pyplot as plt
+
         plt.clf()
         # TODO: print plot by max to min value
         ec =  [evaluate_expression(obj_object.ec)]
@@ -234,6 +235,8 @@ class PostProcess():
         Returns:
             plot the capex histogram.
         """
+        import matplotlib.pyplot as plt
+
         plt.clf()
         # TODO: print plot by max to min value
         x1 =  evaluate_expression(obj_object.ims)
@@ -1,11 +1,9 @@
 """Output printing functions.
 
-Printing functions are described in this module.
+Printing functions are described in this module (`matplotlib` is only
+imported when plotting).
 """
 
-import matplotlib.pyplot as plt
-import matplotlib.patches as patches
-
 
 def print_model_solution(model, outfile, parameter, behavior, flows=False):
     """ Print in outfile, the feasible solution obtained.
@@ -121,6 +119,9 @@ def plotting_solution(model, parameter, plt_show=True):
         plt_show (bool) : `True` if plotting in screen
         `Else` save figure (`plotting.png`).
     """
+    import matplotlib.pyplot as plt
+    import matplotlib.patches as patches
+
     area = []
     if plt_show:
         fontSize = 8
@@ -4,12 +4,14 @@ This module contain callback functions used to generate starting point, to
 perturb a feasible one.
 """
 
-import os
-import sys
 import logging
+import weakref
+from collections import OrderedDict
 
+import numpy as np
 import pyomo.environ as pe
 
+from mind.collocation import collocation_scheme
 from mind.optmodel_utilities import initZero
 from mind.fixing import fixing_method, remove_var_initialisations
 
@@ -23,11 +25,16 @@ formatter = logging.Formatter(fmt='[%(asctime)s] %(levelname)s : %(message)s',
                               datefmt='%a, %d %b %Y %H:%M:%S')
 handler.setFormatter(formatter)
 
+# vectorized samplers by model's instance (see `independent_sampler`)
+_samplers = weakref.WeakKeyDictionary()
+# cells variables by model's instance (see `cell_profile`)
+_cell_profiles = weakref.WeakKeyDictionary()
 
-# Some variables can be initialize to try to have a almost
-# feasible-starting point
-def initFlows(model, random_generation, parameter):
-    """Initialise flows variables.
+
+def random_generation(model, random_generation, parameter, behavior,
+                      fname_mask):
+    """Generate random values for independants variables of the optimization
+    model. Its correspond to all variables, expect cells variables.
 
     Args:
         model (`mind.system.MembranesDesignModel`): design process 's model
@@ -35,855 +42,1037 @@ def initFlows(model, random_generation, parameter):
         random_generation (`Random`): Random object.
 
         parameter (`mind.builder.Configuration`) : design process configuration
+
+        behavior (`mind.membranes.MembranesTypes`): desing process membrane's description
     """
-    for s in model.states:
-        # at least the quantity of FEED
-        var_init = parameter.init_status[parameter.labels[model.Feed_mem[s]]]
-        if not model.Feed_mem[s].fixed and not var_init:
-            model.Feed_mem[s] = model.splitFEED[s].value
-
-        for j in model.components:
-            # same composition as FEED
-            var_init = parameter.init_status[parameter.labels[model.XIN_mem[s,
-                                                                            j]]]
-            if not model.XIN_mem[s, j].fixed and not var_init:
-                model.XIN_mem[s, j] = model.XIN[j]
-
-    # TODO: relation in the outlet of the membrane
-    # Can we determine a guess of permeated using permeability and pressures?
-    for s in model.states:
-        var_init = parameter.init_status[parameter.labels[
-            model.Flux_PERM_mem[s]]]
-        if not model.Flux_PERM_mem[s].fixed and not var_init:
-            model.Flux_PERM_mem[s] = (random_generation.uniform(0, 1) *
-                                      model.Feed_mem[s].value)
-
-        var_init = parameter.init_status[parameter.labels[
-            model.Flux_RET_mem[s]]]
-        if not model.Flux_RET_mem[s].fixed and not var_init:
-            model.Flux_RET_mem[s] = (model.Feed_mem[s].value -
-                                     model.Flux_PERM_mem[s].value)
-
-    for s in model.states:
-        var_init = parameter.init_status[parameter.labels[model.splitOutRET[s]]]
-        if not model.splitOutRET[s].fixed and not var_init:
-            model.splitOutRET[s] = (model.splitOutRET_frac[s].value *
-                                    model.Flux_RET_mem[s].value)
-
-        var_init = parameter.init_status[parameter.labels[
-            model.splitOutPERM[s]]]
-        if not model.splitOutPERM[s].fixed and not var_init:
-            model.splitOutPERM[s] = (model.splitOutPERM_frac[s].value *
-                                     model.Flux_PERM_mem[s].value)
-
-        for j in model.states:
-            var_init = parameter.init_status[parameter.labels[model.splitRET[
-                s, j]]]
-            if not model.splitRET[s, j].fixed and not var_init:
-                model.splitRET[s, j] = (model.splitRET_frac[s, j].value *
-                                        model.Flux_RET_mem[s].value)
-
-            var_init = parameter.init_status[parameter.labels[model.splitPERM[
-                s, j]]]
-            if not model.splitPERM[s, j].fixed and not var_init:
-                model.splitPERM[s, j] = (model.splitPERM_frac[s, j].value *
-                                         model.Flux_PERM_mem[s].value)
-
-
-def generate_area(model, random_generation, parameter):
-    """Generate random values for cell area variable.
+    sampler = independent_sampler(model, parameter)
+    sampler.init_zero()
+    remove_var_initialisations(parameter)
+    logger.info('Random generation OK')
+    if parameter.fixing_var:
+        fixing_method(fname_mask, model, parameter)
 
-    Args:
-        model (`mind.system.MembranesDesignModel`): design process 's model
+    logger.info("Random generation method")
 
-        random_generation (`Random`): Random object.
+    # TODO: Can not fix this element
+    if parameter.variable_perm:
+        behavior.mem_type_element_generation(model, parameter,
+                                             random_generation)
 
-        parameter (`mind.builder.Configuration`) : design process configuration
-    """
-    for s in model.states:
-        var_init = parameter.init_status[parameter.labels[model.area[s]]]
-        if not model.area[s].fixed and not var_init:
-            model.area[s] = random_generation.uniform(model.lb_area[s].value,
-                                                      model.ub_area[s].value)
+    # areas, pressures, splits (FEED and Ret/Perm flows) and flows
+    # (see `IndependentSampler.generate`)
+    rng = numpy_generator(random_generation)
+    sampler.write(sampler.generate(rng)[0])
+
+
+# epsilon is a dictionary to keep the different values of perturbation
+# for different variables
+# eps_At => epsilon['At']
+# eps_press_up_f => epsilon['press_up_f']
+# eps_press_down_f => epsilon['press_down_f']
+# eps_feed => epsilon['feed']
 
 
-def generate_pressure(model, parameter, random_generation):
-    """Generate random values for pressures variables.
-    Pressure_up and pressure_down variables.
+def Perturbation_membranes(model, center, random_generationPert, parameter,
+                           behavior, fname_mask):
+    """Perturb slightly a feasible solution of the model. The feasible
+    solution is also overwrite by the obtained solution (perturbated one).
 
     Args:
         model (`mind.system.MembranesDesignModel`): design process 's model
 
-        random_generation (`Random`): Random object.
+        random_generationPert (`Random`): Random object.
 
         parameter (`mind.builder.Configuration`) : design process configuration
+
+        center (`DICT`): copy of a model's instance solution
+
+        behavior (`mind.membranes.MembranesTypes`): desing process membrane 's description.
+
+        fname_mask (`str`) : path to file containing information about fixed variables
     """
-    if parameter.uniform_pup:
-        var_init = parameter.init_status[parameter.labels[model.pressure_up]]
-        if not model.pressure_up.fixed and not var_init:
-            ub_fixed_pressure_down = model.lb_press_up.value
-            if True in [model.pressure_down[s].fixed for s in model.states]:
-                # there are at least one pressure_down fixed
-                ub_fixed_pressure_down = max(
-                    [model.pressure_down[s].value for s in model.states])
-            if ub_fixed_pressure_down > model.ub_press_up.value:
-                logger.exception('Fixed pressure_down \'s value > ub_press_up')
-                raise ValueError('Fixed pressure_down \'s value > ub_press_up')
-            model.pressure_up = random_generation.uniform(
-                max(ub_fixed_pressure_down, model.lb_press_up.value),
-                model.ub_press_up.value)
 
-    else:
-        for s in model.states:
-            var_init = parameter.init_status[parameter.labels[
-                model.pressure_up[s]]]
-            if not model.pressure_up[s].fixed and not var_init:
-                ub_fixed_pressure_down = model.lb_press_up.value
-                if True in [model.pressure_down[s].fixed for s in model.states]:
-                    # there are at least one pressure_down fixed
-                    ub_fixed_pressure_down = max(
-                        [model.pressure_down[s].value for s in model.states])
-                if ub_fixed_pressure_down > model.ub_press_up.value:
-                    logger.exception(
-                        'Fixed pressure_down \'s value > ub_press_up')
-                    raise ValueError(
-                        'Fixed pressure_down \'s value > ub_press_up')
-
-                if s == 1:
-                    model.pressure_up[s] = random_generation.uniform(
-                        max(ub_fixed_pressure_down, model.lb_press_up.value),
-                        model.ub_press_up.value)
-                else:
-                    model.pressure_up[s] = random_generation.uniform(
-                        max(ub_fixed_pressure_down,
-                            model.pressure_up[s - 1].value),
-                        model.ub_press_up.value)
-
-    for s in model.states:
-        var_init = parameter.init_status[parameter.labels[
-            model.pressure_down[s]]]
-        if not model.pressure_down[s].fixed and not var_init:
-            if parameter.uniform_pup:
-                model.pressure_down[s] = max(
-                    model.lb_press_down.value,
-                    min((model.pressure_up.value * parameter.pressure_ratio),
-                        model.ub_press_down.value))
-            else:
-                model.pressure_down[s] = max(
-                    model.lb_press_down.value,
-                    min((model.pressure_up[model.states.last()].value *
-                         parameter.pressure_ratio), model.ub_press_down.value))
+    sampler = independent_sampler(model, parameter)
+    sampler.init_zero()
+    remove_var_initialisations(parameter)
+    if parameter.fixing_var:
+        fixing_method(fname_mask, model, parameter)
 
+    logger.info("Perturabation method")
 
-def generate_splitFeed(model, random_generation, parameter):
-    """Generate random values for splitFEED variables.
-    The Feed is splitted in the input of the global system.
+    if parameter.variable_perm:
+        behavior.mem_type_element_perturbation(model, parameter, center,
+                                               random_generationPert)
 
-    Args:
-        model (`mind.system.MembranesDesignModel`): design process 's model
+    # areas, pressures, splits and flows (see `IndependentSampler.perturb`)
+    rng = numpy_generator(random_generationPert)
+    sampler.write(sampler.perturb(rng, center)[0])
 
-        random_generation (`Random`): Random object.
 
-        parameter (`mind.builder.Configuration`) : design process configuration
+def initCells(model, parameter):
+    """Intialise variables related to cells level.
+
+    Args:
+        model (`pyomo.concreteModel`): design process constructed model.
+
+        parameter (`mind.builder.Configuration`): process Design configuration.
     """
-    tmp = sum(model.splitFEED_frac[s].value for s in model.states)
-    if tmp > 1:
-        logger.exception('sum of splitFEED_frac \'s fixed values > 1')
-        raise ValueError('splitFEED_frac \'s fixed values')
+    cell_profile(model, parameter).initialise()
 
-    states_fixed_bool = [model.splitFEED_frac[s].fixed for s in model.states]
-    nb_free_elem = len([1 for elem in states_fixed_bool if elem is False])
 
-    if nb_free_elem == 0 and tmp < 1:
-        logger.exception('sum of splitFEED_frac \'s fixed values < 1')
-        raise ValueError('splitFEED_frac \'s fixed values')
+def numpy_generator(random_generation):
+    """`numpy` random generator seeded by a `Random` object.
 
-    not_fixed = []
-    for s in model.states:
-        init_var = parameter.init_status[parameter.labels[
-            model.splitFEED_frac[s]]]
-        if not (model.splitFEED_frac[s].fixed or init_var):
-            not_fixed.append('FEED_frac{}'.format(s))
-            model.splitFEED_frac[s] = random_generation.uniform(0, 1 - tmp)
-            tmp += model.splitFEED_frac[s].value
+    Sequences of generated values stay reproducible under the seed of
+    `random_generation`.
 
-    if not_fixed:
-        s = int((not_fixed[0])[9])
-        model.splitFEED_frac[s] = (model.splitFEED_frac[s].value + (1 - tmp))
+    Args:
+        random_generation (`Random`): Random object.
 
-    for s in model.states:
-        model.splitFEED[s] = model.splitFEED_frac[s].value * model.FEED
+    Returns:
+        `numpy.random.Generator`
+    """
+    return np.random.default_rng(random_generation.getrandbits(64))
 
 
-def generate_splitRet(model, random_generation, parameter):
-    """Generate random values for splitRET variables.
-    The output RET is also splitted (see mathematic model for more details).
+def independent_sampler(model, parameter):
+    """Vectorized sampler of a model's instance (created once per instance).
 
     Args:
         model (`mind.system.MembranesDesignModel`): design process 's model
 
-        random_generation (`Random`): Random object.
-
         parameter (`mind.builder.Configuration`) : design process configuration
+
+    Returns:
+        `mind.random_initialisation.IndependentSampler`
     """
+    sampler = _samplers.get(model)
+    if (sampler is None or sampler.parameter is not parameter or
+            sampler.labels_map is not parameter.labels):
+        sampler = IndependentSampler(model, parameter)
+        _samplers[model] = sampler
+    return sampler
 
-    for s in model.states:
-        tmp = (sum(model.splitRET_frac[s, s1].value for s1 in model.states) +
-               model.splitOutRET_frac[s].value)
-        if tmp > 1:
-            logger.exception('sum of splitRET_frac \'s fixed values > 1 '
-                             'when states = {}'.format(s))
-            raise ValueError('splitRET_frac \'s fixed values')
-
-        states_fixed_bool = ([
-            model.splitRET_frac[s, s1].fixed or
-            parameter.init_status[parameter.labels[model.splitRET_frac[s, s1]]]
-            for s1 in model.states
-        ] + [
-            model.splitOutRET_frac[s].fixed or
-            parameter.init_status[parameter.labels[model.splitOutRET_frac[s]]]
-        ])
 
-        nb_free_elem = len([1 for elem in states_fixed_bool if elem is False])
-
-        if nb_free_elem == 0 and tmp < 1:
-            logger.exception('sum of splitRET_frac \'s fixed values < 1')
-            raise ValueError('splitRET_frac \'s fixed values')
-
-        not_fixed = []
-        for s1 in model.states:
-            init_var = parameter.init_status[parameter.labels[
-                model.splitRET_frac[s, s1]]]
-            if not (model.splitRET_frac[s, s1].fixed or init_var):
-                not_fixed.append('RET_frac{}, {}'.format(s, s1))
-                model.splitRET_frac[s, s1] = random_generation.uniform(
-                    max(0, model.lb_splitRET_frac[s, s1].value),
-                    min(1 - tmp, model.ub_splitRET_frac[s, s1].value))
-                tmp += model.splitRET_frac[s, s1].value
-
-        init_var = parameter.init_status[parameter.labels[
-            model.splitOutRET_frac[s]]]
-        if not (model.splitOutRET_frac[s].fixed or init_var):
-            not_fixed.append('OutRET_frac{}'.format(s))
-            model.splitOutRET_frac[s] = random_generation.uniform(0, 1 - tmp)
-            tmp += model.splitOutRET_frac[s].value
-
-        if not_fixed:
-            if (not_fixed[0])[0:8] == "RET_frac":
-                s = int((not_fixed[0])[8])
-                s1 = int((not_fixed[0])[11])
-                model.splitRET_frac[s, s1] = (model.splitRET_frac[s, s1].value +
-                                              (1 - tmp))
-            elif (not_fixed[0])[0:11] == "OutRET_frac":
-                s = int((not_fixed[0])[11])
-                model.splitOutRET_frac[s] = (model.splitOutRET_frac[s].value +
-                                             (1 - tmp))
-            else:
-                raise ValueError('Error in splitRET generation')
+class IndependentSampler:
+    """Vectorized generation and perturbation of independent variables.
 
+    Areas, pressures, splits (and flows deduced from splits) of one or
+    a batch of starting points are drawn with `numpy`. Bounds, fixed
+    variables and split-sum constraints are applied as array operations
+    (batch and states dimensions) and values are written back in bulk.
 
-def generate_splitPerm(model, random_generation, parameter):
-    """Generate random values for splitPERM variables.
-    The output PERM is also splitted (see mathematic model for more details).
+    Attributes:
 
-    Args:
         model (`mind.system.MembranesDesignModel`): design process 's model
 
-        random_generation (`Random`): Random object.
-
         parameter (`mind.builder.Configuration`) : design process configuration
+
+        shapes (`OrderedDict`) : shape of each block of variables (ex: `area`)
+
+        variables (`List`) : variables of all blocks (blocks order)
+
+        labels (`List[str]`) : labels of `variables`
     """
 
-    for s in model.states:
-        tmp = (sum(model.splitPERM_frac[s, s1].value for s1 in model.states) +
-               model.splitOutPERM_frac[s].value)
-        if tmp > 1:
-            logger.exception('sum of splitPERM_frac \'s fixed values > 1 '
-                             'when states = {}'.format(s))
-            raise ValueError('splitPERM_frac \'s fixed values')
-
-        states_fixed_bool = ([
-            model.splitPERM_frac[s, s1].fixed or
-            parameter.init_status[parameter.labels[model.splitPERM_frac[s, s1]]]
-            for s1 in model.states
-        ] + [
-            model.splitOutPERM_frac[s].fixed or
-            parameter.init_status[parameter.labels[model.splitOutPERM_frac[s]]]
+    def __init__(self, model, parameter):
+        self.model = model
+        self.parameter = parameter
+        states = list(model.states)
+        components = list(model.components)
+        nb_states = len(states)
+        nb_comp = len(components)
+
+        if parameter.uniform_pup:
+            pressure_up = [model.pressure_up]
+        else:
+            pressure_up = [model.pressure_up[s] for s in states]
+
+        blocks = [
+            ('area', (nb_states,), [model.area[s] for s in states]),
+            ('pressure_up', (len(pressure_up),), pressure_up),
+            ('pressure_down', (nb_states,),
+             [model.pressure_down[s] for s in states]),
+            ('feed_frac', (nb_states,),
+             [model.splitFEED_frac[s] for s in states]),
+            ('feed', (nb_states,), [model.splitFEED[s] for s in states]),
+            ('ret_frac', (nb_states, nb_states + 1),
+             [var for s in states for var in
+              [model.splitRET_frac[s, s1] for s1 in states] +
+              [model.splitOutRET_frac[s]]]),
+            ('perm_frac', (nb_states, nb_states + 1),
+             [var for s in states for var in
+              [model.splitPERM_frac[s, s1] for s1 in states] +
+              [model.splitOutPERM_frac[s]]]),
+            # flows deduced from splits
+            ('feed_mem', (nb_states,), [model.Feed_mem[s] for s in states]),
+            ('xin_mem', (nb_states, nb_comp),
+             [model.XIN_mem[s, j] for s in states for j in components]),
+            ('perm_mem', (nb_states,),
+             [model.Flux_PERM_mem[s] for s in states]),
+            ('ret_mem', (nb_states,), [model.Flux_RET_mem[s] for s in states]),
+            ('out_ret', (nb_states,), [model.splitOutRET[s] for s in states]),
+            ('out_perm', (nb_states,),
+             [model.splitOutPERM[s] for s in states]),
+            ('split_ret', (nb_states, nb_states),
+             [model.splitRET[s, s1] for s in states for s1 in states]),
+            ('split_perm', (nb_states, nb_states),
+             [model.splitPERM[s, s1] for s in states for s1 in states]),
+        ]
+
+        self.shapes = OrderedDict()
+        self.slices = {}
+        self.variables = []
+        for name, shape, variables in blocks:
+            self.shapes[name] = shape
+            self.slices[name] = slice(len(self.variables),
+                                      len(self.variables) + len(variables))
+            self.variables.extend(variables)
+        self.labels_map = parameter.labels
+        self.labels = [parameter.labels[var] for var in self.variables]
+
+        self.states = states
+        self.components = components
+
+    def parameters(self):
+        """Current values of the model 's bounds parameters (bounds of
+        splits can be updated between two generations, see `mind.gas`).
+
+        Returns:
+            `DICT` of `numpy.ndarray`
+        """
+        model = self.model
+        states = self.states
+        return {
+            'lb_area': np.array([model.lb_area[s].value for s in states]),
+            'ub_area': np.array([model.ub_area[s].value for s in states]),
+            'lb_ret_frac': np.array([[
+                model.lb_splitRET_frac[s, s1].value for s1 in states
+            ] for s in states]),
+            'ub_ret_frac': np.array([[
+                model.ub_splitRET_frac[s, s1].value for s1 in states
+            ] for s in states]),
+            'lb_perm_frac': np.array([[
+                model.lb_splitPERM_frac[s, s1].value for s1 in states
+            ] for s in states]),
+            'ub_perm_frac': np.array([[
+                model.ub_splitPERM_frac[s, s1].value for s1 in states
+            ] for s in states]),
+            'feed': pe.value(model.FEED),
+            'xin': np.array([pe.value(model.XIN[j]) for j in self.components])
+        }
+
+    def current(self):
+        """Current values and fixed masks of the blocks.
+
+        A variable initialized by users (`init_status`) is handled as a
+        fixed one.
+
+        Returns:
+            tuple of `DICT` (values, fixed) of `numpy.ndarray` by block
+        """
+        init_status = self.parameter.init_status
+        values = np.array([
+            np.nan if var.value is None else var.value
+            for var in self.variables
+        ])
+        fixed = np.array([
+            var.fixed or init_status.get(label, False)
+            for var, label in zip(self.variables, self.labels)
         ])
+        blocks = {}
+        masks = {}
+        for name, shape in self.shapes.items():
+            blocks[name] = values[self.slices[name]].reshape(shape)
+            masks[name] = fixed[self.slices[name]].reshape(shape)
+        return blocks, masks
 
-        nb_free_elem = len([1 for elem in states_fixed_bool if elem is False])
-
-        if nb_free_elem == 0 and tmp < 1:
-            logger.exception('sum of splitPERM_frac \'s fixed values < 1')
-            raise ValueError('splitPERM_frac \'s fixed values')
-
-        not_fixed = []
-        for s1 in model.states:
-            init_var = parameter.init_status[parameter.labels[
-                model.splitPERM_frac[s, s1]]]
-            if not (model.splitPERM_frac[s, s1].fixed or init_var):
-                not_fixed.append('PERM_frac{}, {}'.format(s, s1))
-                model.splitPERM_frac[s, s1] = random_generation.uniform(
-                    max(0, model.lb_splitPERM_frac[s, s1].value),
-                    min(1 - tmp, model.ub_splitPERM_frac[s, s1].value))
-                tmp += model.splitPERM_frac[s, s1].value
-
-        init_var = parameter.init_status[parameter.labels[
-            model.splitOutPERM_frac[s]]]
-        if not (model.splitOutPERM_frac[s].fixed or init_var):
-            not_fixed.append('OutPERM_frac{}'.format(s))
-            model.splitOutPERM_frac[s] = random_generation.uniform(0, 1 - tmp)
-            tmp += model.splitOutPERM_frac[s].value
-
-        if not_fixed:
-            if (not_fixed[0])[0:9] == "PERM_frac":
-                s = int((not_fixed[0])[9])
-                s1 = int((not_fixed[0])[12])
-                model.splitPERM_frac[s, s1] = (model.splitPERM_frac[s, s1].value +
-                                               (1 - tmp))
-            elif (not_fixed[0])[0:12] == "OutPERM_frac":
-                s = int((not_fixed[0])[12])
-                model.splitOutPERM_frac[s] = (model.splitOutPERM_frac[s].value +
-                                              (1 - tmp))
-            else:
-                raise ValueError('Error in splitPERM generation')
+    def assemble(self, blocks, size):
+        """Concatenate blocks of a batch.
 
+        Args:
 
-def random_generation(model, random_generation, parameter, behavior,
-                      fname_mask):
-    """Generate random values for independants variables of the optimization
-    model. Its correspond to all variables, expect cells variables.
+            blocks (`DICT`) : arrays of shape (size,) + block's shape
 
-    Args:
-        model (`mind.system.MembranesDesignModel`): design process 's model
+            size (`Int`) : size of the batch
 
-        random_generation (`Random`): Random object.
+        Returns:
+            `numpy.ndarray` of shape (size, number of variables)
+        """
+        return np.concatenate([
+            np.broadcast_to(blocks[name], (size,) + shape).reshape(size, -1)
+            for name, shape in self.shapes.items()
+        ],
+                              axis=1)
 
-        parameter (`mind.builder.Configuration`) : design process configuration
+    def write(self, values):
+        """Set variables to a point of the batch (bulk assignment).
 
-        behavior (`mind.membranes.MembranesTypes`): desing process membrane's description
-    """
-    initZero(model)
-    remove_var_initialisations(parameter)
-    logger.info('Random generation OK')
-    if parameter.fixing_var:
-        fixing_method(fname_mask, model, parameter)
+        Args:
+            values (`numpy.ndarray`) : values of `variables`
+        """
+        for var, value in zip(self.variables, values.tolist()):
+            var.set_value(None if value != value else value, True)
+
+    def init_zero(self):
+        """Vectorized `initZero` : unfixed variables are set to their lower
+        bound (or zero)."""
+        layout = self.parameter.layout
+        if layout is None or layout.model is not self.model:
+            initZero(self.model)
+            return
+        values = np.fromiter(
+            ((np.nan if var.value is None else var.value) if var.fixed else
+             (var.lb or 0.0) for var in layout.variables),
+            dtype=float,
+            count=len(layout))
+        layout.restore(values)
+
+    def check_splits(self, values, name, has_free):
+        """Check fixed values of split fractions.
 
-    logger.info("Random generation method")
+        Args:
 
-    generate_area(model, random_generation, parameter)
-    generate_pressure(model, parameter, random_generation)
+            values (`numpy.ndarray`) : current fractions (states, elements)
 
-    # generate_permeability(model, parameter, random_generation)
-    # # TODO: Can not fix this element
-    if parameter.variable_perm:
-        behavior.mem_type_element_generation(model, parameter,
-                                             random_generation)
-    # Generation of variables related to interconnection between membranes
-    # There are different splits: FEED and Ret/Perm flows
-    generate_splitFeed(model, random_generation, parameter)
-    # random generation for split fractions of RET/PERM: values in (lb,ub)
-    generate_splitRet(model, random_generation, parameter)
-    # perm random generation
-    generate_splitPerm(model, random_generation, parameter)
+            name (`str`) : name of fractions (ex: `splitRET_frac`)
 
-    # Out=1-sum(all other splits)
-    # # # OPTIMIZE: by using sum , difference (list) : built-in function
-    # # TODO: Can not fix this element
+            has_free (`numpy.ndarray`) : `True` for states with free fractions
 
-    initFlows(model, random_generation, parameter)
+        Returns:
+            `numpy.ndarray` of fractions sums by state
+        """
+        total = values.sum(axis=-1)
+        for s, (tmp, free) in enumerate(zip(np.atleast_1d(total),
+                                             np.atleast_1d(has_free))):
+            if tmp > 1:
+                if values.ndim > 1:
+                    logger.exception('sum of {} \'s fixed values > 1 '
+                                     'when states = {}'.format(name, s + 1))
+                else:
+                    logger.exception(
+                        'sum of {} \'s fixed values > 1'.format(name))
+                raise ValueError('{} \'s fixed values'.format(name))
+            if not free and tmp < 1:
+                logger.exception('sum of {} \'s fixed values < 1'.format(name))
+                raise ValueError('{} \'s fixed values'.format(name))
+        return total
 
+    def generate(self, rng, size=1):
+        """Random values of independent variables (and flows).
 
-# epsilon is a dictionary to keep the different values of perturbation
-# for different variables
-# eps_At => epsilon['At']
-# eps_press_up_f => epsilon['press_up_f']
-# eps_press_down_f => epsilon['press_down_f']
-# eps_feed => epsilon['feed']
+        Args:
 
+            rng (`numpy.random.Generator`) : random generator
+
+            size (`Int`) : number of starting points (`default = 1`)
+
+        Returns:
+            `numpy.ndarray` of shape (size, number of variables)
+        """
+        model = self.model
+        bounds = self.parameters()
+        current, fixed = self.current()
+        blocks = {
+            name: np.tile(values, (size,) + (1,) * values.ndim)
+            for name, values in current.items()
+        }
+
+        # areas
+        free = ~fixed['area']
+        draw = bounds['lb_area'] + (bounds['ub_area'] - bounds['lb_area']) * rng.random(
+            (size, len(bounds['lb_area'])))
+        blocks['area'] = np.where(free, draw, blocks['area'])
+
+        # pressures
+        lb_up = model.lb_press_up.value
+        ub_up = model.ub_press_up.value
+        ub_fixed_pressure_down = lb_up
+        if fixed['pressure_down'].any():
+            # there are at least one pressure_down fixed
+            ub_fixed_pressure_down = current['pressure_down'].max()
+        pressure_up = blocks['pressure_up']
+        for k, free in enumerate(~fixed['pressure_up']):
+            if not free:
+                continue
+            if ub_fixed_pressure_down > ub_up:
+                logger.exception('Fixed pressure_down \'s value > ub_press_up')
+                raise ValueError('Fixed pressure_down \'s value > ub_press_up')
+            if k == 0:
+                low = max(ub_fixed_pressure_down, lb_up)
+            else:
+                low = np.maximum(ub_fixed_pressure_down, pressure_up[:, k - 1])
+            pressure_up[:, k] = low + (ub_up - low) * rng.random(size)
+
+        pressure_down = np.maximum(
+            model.lb_press_down.value,
+            np.minimum(pressure_up[:, -1] * self.parameter.pressure_ratio,
+                       model.ub_press_down.value))
+        blocks['pressure_down'] = np.where(~fixed['pressure_down'],
+                                           pressure_down[:, None],
+                                           blocks['pressure_down'])
+
+        # splits : each draw is uniform in (lb, min(ub, 1 - sum of
+        # previous fractions)), the first free fraction closing the sum
+        free = ~fixed['feed_frac']
+        total = self.check_splits(current['feed_frac'], 'splitFEED_frac',
+                                  free.any())
+        tmp = np.full(size, total)
+        frac = blocks['feed_frac']
+        for k in np.flatnonzero(free):
+            frac[:, k] = (1 - tmp) * rng.random(size)
+            tmp = tmp + frac[:, k]
+        if free.any():
+            frac[:, np.argmax(free)] += 1 - tmp
+        blocks['feed'] = frac * bounds['feed']
+
+        for name, label in (('ret_frac', 'splitRET_frac'),
+                            ('perm_frac', 'splitPERM_frac')):
+            free = ~fixed[name]
+            total = self.check_splits(current[name], label, free.any(axis=1))
+            tmp = np.tile(total, (size, 1))
+            frac = blocks[name]
+            nb_states = frac.shape[1]
+            for k in range(nb_states + 1):
+                if not free[:, k].any():
+                    continue
+                if k < nb_states:
+                    low = np.maximum(0, bounds['lb_' + name][:, k])
+                    high = np.minimum(1 - tmp, bounds['ub_' + name][:, k])
+                else:
+                    low = 0
+                    high = 1 - tmp
+                draw = low + (high - low) * rng.random((size, nb_states))
+                frac[:, :, k] = np.where(free[:, k], draw, frac[:, :, k])
+                tmp = np.where(free[:, k], tmp + draw, tmp)
+            self.close_splits(frac, free, tmp)
 
-def perturb_area(model, random_generationPert, parameter, center):
-    """Perturb slightly model area values.
+        self.generate_flows(rng, blocks, fixed, bounds['xin'])
+        return self.assemble(blocks, size)
+
+    def perturb(self, rng, center, size=1):
+        """Perturbed values of independent variables (and flows) around
+        `center`.
 
         Args:
-            model (`mind.system.MembranesDesignModel`): design process 's model
 
-            random_generationPert (`Random`): Random object.
+            rng (`numpy.random.Generator`) : random generator
+
+            center (`mind.snapshot.Point`): copy of a model's instance solution
+
+            size (`Int`) : number of perturbed points (`default = 1`)
+
+        Returns:
+            `numpy.ndarray` of shape (size, number of variables)
+        """
+        model = self.model
+        epsilon = self.parameter.epsilon
+        bounds = self.parameters()
+        current, fixed = self.current()
+        blocks = {
+            name: np.tile(values, (size,) + (1,) * values.ndim)
+            for name, values in current.items()
+        }
+        center_values = np.array(
+            [center.get(label) for label in self.labels], dtype=float)
+        centers = {
+            name: center_values[self.slices[name]].reshape(shape)
+            for name, shape in self.shapes.items()
+        }
+
+        # areas
+        free = ~fixed['area']
+        area_eps = (epsilon.get('At') * (bounds['ub_area'] - bounds['lb_area']) *
+                    rng.random((size, len(bounds['lb_area']))))
+        area = np.maximum(
+            bounds['lb_area'],
+            np.minimum(centers['area'] + area_eps, bounds['ub_area']))
+        blocks['area'] = np.where(free, area, blocks['area'])
+
+        # pressures (fixed status is not considered)
+        lb_up = model.lb_press_up.value
+        ub_up = model.ub_press_up.value
+        eps_press = (epsilon.get('press_up_f') * (ub_up - lb_up) *
+                     rng.random(size))
+        pressure_up = blocks['pressure_up']
+        for k in range(pressure_up.shape[1]):
+            high = ub_up if k == 0 else pressure_up[:, k - 1]
+            pressure_up[:, k] = np.maximum(
+                lb_up, np.minimum(centers['pressure_up'][k] + eps_press, high))
+
+        lb_down = model.lb_press_down.value
+        ub_down = model.ub_press_down.value
+        eps_press = (epsilon.get('press_down_f') * (ub_down - lb_down) *
+                     rng.random(blocks['pressure_down'].shape))
+        blocks['pressure_down'] = np.maximum(
+            lb_down,
+            np.minimum(
+                centers['pressure_down'] + eps_press,
+                np.minimum(ub_down, pressure_up[:, -1])[:, None]))
+
+        # splits
+        eps_feed = epsilon.get('feed')
+        free = ~fixed['feed_frac']
+        total = self.check_splits(current['feed_frac'], 'splitFEED_frac',
+                                  free.any())
+        tmp = np.full(size, total)
+        frac = blocks['feed_frac']
+        for k in np.flatnonzero(free):
+            split_eps = eps_feed * (2 * rng.random(size) - 1)
+            frac[:, k] = self.project_split(rng,
+                                            centers['feed_frac'][k] + split_eps,
+                                            tmp)
+            tmp = tmp + frac[:, k]
+        if free.any():
+            frac[:, np.argmax(free)] += 1 - tmp
+        blocks['feed'] = frac * bounds['feed']
+
+        for name, label in (('ret_frac', 'splitRET_frac'),
+                            ('perm_frac', 'splitPERM_frac')):
+            free = ~fixed[name]
+            total = self.check_splits(current[name], label, free.any(axis=1))
+            tmp = np.tile(total, (size, 1))
+            frac = blocks[name]
+            nb_states = frac.shape[1]
+            split_eps = eps_feed * (2 * rng.random((size, nb_states, nb_states))
+                                    - 1)
+            for k in range(nb_states + 1):
+                if not free[:, k].any():
+                    continue
+                if k < nb_states:
+                    eps = split_eps[:, :, k]
+                else:
+                    # outlet fraction reuses the last drawn perturbation
+                    eps = self.last_split_eps(split_eps, free[:, :nb_states])
+                value = self.project_split(rng, centers[name][:, k] + eps, tmp)
+                frac[:, :, k] = np.where(free[:, k], value, frac[:, :, k])
+                tmp = np.where(free[:, k], tmp + value, tmp)
+            self.close_splits(frac, free, tmp)
 
-            parameter (`mind.builder.Configuration`) : design process configuration
+        self.generate_flows(rng, blocks, fixed, bounds['xin'])
+        return self.assemble(blocks, size)
 
-            center (`DICT`): copy of a model's instance solution
-    """
-    for s in model.states:
-        var_init = parameter.init_status[parameter.labels[model.area[s]]]
-        if not model.area[s].fixed and not var_init:
-            area_eps = random_generationPert.uniform(
-                0, (parameter.epsilon.get('At') *
-                    (model.ub_area[s].value - model.lb_area[s].value)))
+    @staticmethod
+    def project_split(rng, value, tmp):
+        """Bring back perturbed fractions inside (0, 1 - tmp) by a random
+        reflection.
 
-            center_value = center.get(parameter.labels[model.area[s]])
-            model.area[s] = max(
-                model.lb_area[s].value,
-                min(center_value + area_eps, model.ub_area[s].value))
+        Args:
 
+            rng (`numpy.random.Generator`) : random generator
 
-def perturb_pressure(model, random_generationPert, parameter, center):
-    """ perturb slightly model pressures values (pressure_up & pressure_down).
+            value (`numpy.ndarray`) : perturbed fractions
 
-    Args:
-        model (`mind.system.MembranesDesignModel`): design process 's model
+            tmp (`numpy.ndarray`) : sum of previous fractions
 
-        random_generationPert (`Random`): Random object.
+        Returns:
+            `numpy.ndarray` of fractions
+        """
+        draw = rng.random(np.shape(value))
+        upper = 1 - tmp
+        return np.where(
+            value < 0, -value * (1 - draw),
+            np.where(value > upper, (value - upper) * draw, value))
 
-        parameter (`mind.builder.Configuration`) : design process configuration
+    @staticmethod
+    def last_split_eps(split_eps, free):
+        """Last perturbation drawn for each state's split fractions
+        (previous state's one if none was drawn for this state).
 
-        center (`DICT`): copy of a model's instance solution
-    """
-    eps_press = random_generationPert.uniform(
-        0,
-        parameter.epsilon.get('press_up_f') *
-        (model.ub_press_up.value - model.lb_press_up.value))
-
-    if parameter.uniform_pup:
-        center_value = center.get(parameter.labels[model.pressure_up])
-        tmp = min(center_value + eps_press, model.ub_press_up.value)
-        model.pressure_up = max(model.lb_press_up.value, tmp)
-    else:
-        for s in model.states:
-            if (s == 1):
-                # model.pressure_up[s] = random_generation.uniform(
-                # model.lb_press_up.value,
-                # model.ub_press_up.value)
-
-                center_value = center.get(
-                    parameter.labels[model.pressure_up[s]])
-                tmp = min(center_value + eps_press, model.ub_press_up.value)
-                model.pressure_up[s] = max(model.lb_press_up.value, tmp)
-            else:
-                # model.pressure_up[s] =
-                # random_generation.uniform(model.lb_press_up.value,
-                # value(model.pressure_up[s-1]))
-
-                center_value = center.get(
-                    parameter.labels[model.pressure_up[s]])
-                tmp = min(center_value + eps_press,
-                          pe.value(model.pressure_up[s - 1]))
-                model.pressure_up[s] = max(model.lb_press_up.value, tmp)
-
-    # Pressure_down
-    for s in model.states:
-        eps_press = random_generationPert.uniform(
-            0,
-            parameter.epsilon.get('press_down_f') *
-            (model.ub_press_down.value - model.lb_press_down.value))
-
-        center_value = center.get(parameter.labels[model.pressure_down[s]])
-        if (parameter.uniform_pup):
-            model.pressure_down[s] = max(
-                model.lb_press_down.value,
-                min(center_value + eps_press,
-                    min(model.ub_press_down.value, model.pressure_up.value)))
+        Args:
 
-        else:
-            model.pressure_down[s] = max(
-                model.lb_press_down.value,
-                min(
-                    center_value + eps_press,
-                    min(model.ub_press_down.value,
-                        model.pressure_up[model.states.last()].value)))
+            split_eps (`numpy.ndarray`) : perturbations (size, states, states)
+
+            free (`numpy.ndarray`) : free fractions (states, states)
+
+        Returns:
+            `numpy.ndarray` of shape (size, states)
+        """
+        last = None
+        eps = np.empty(split_eps.shape[:2])
+        for s in range(free.shape[0]):
+            columns = np.flatnonzero(free[s])
+            if columns.size:
+                last = split_eps[:, s, columns[-1]]
+            if last is None:
+                logger.exception('No perturbation drawn for outlet fraction')
+                raise ValueError('Error in split perturbation')
+            eps[:, s] = last
+        return eps
+
+    @staticmethod
+    def close_splits(frac, free, tmp):
+        """Add the remaining fraction to the first free fraction of each state.
 
+        Args:
 
-def perturb_splitFeed(model, random_generationPert, parameter, center):
-    """Perturb slightly model splitFEED variable values.
+            frac (`numpy.ndarray`) : fractions (size, states, elements)
 
-    Args:
-        model (`mind.system.MembranesDesignModel`): design process 's model
+            free (`numpy.ndarray`) : free fractions (states, elements)
 
-        random_generationPert (`Random`): Random object.
+            tmp (`numpy.ndarray`) : sum of fractions (size, states)
+        """
+        for s in np.flatnonzero(free.any(axis=1)):
+            k = np.argmax(free[s])
+            frac[:, s, k] += 1 - tmp[:, s]
 
-        parameter (`mind.builder.Configuration`) : design process configuration
+    @staticmethod
+    def generate_flows(rng, blocks, fixed, xin):
+        """Flows deduced from splits.
 
-        center (`DICT`): copy of a model's instance solution
-    """
-    tmp = sum(model.splitFEED_frac[s].value for s in model.states)
-    if tmp > 1:
-        logger.exception('sum of splitFEED_frac \'s fixed values > 1')
-        raise ValueError('splitFEED_frac \'s fixed values')
-
-    states_fixed_bool = [model.splitFEED_frac[s].fixed for s in model.states]
-    nb_free_elem = len([1 for elem in states_fixed_bool if elem is False])
-
-    if nb_free_elem == 0 and tmp < 1:
-        logger.exception('sum of splitFEED_frac \'s fixed values < 1')
-        raise ValueError('splitFEED_frac \'s fixed values')
-
-    not_fixed = []
-    for s in model.states:
-        init_var = parameter.init_status[parameter.labels[
-            model.splitFEED_frac[s]]]
-        if not (model.splitFEED_frac[s].fixed or init_var):
-            not_fixed.append('FEED_frac{}'.format(s))
-            split_eps = random_generationPert.uniform(
-                -1. * parameter.epsilon.get('feed'),
-                parameter.epsilon.get('feed'))
-            center_value = center.get(parameter.labels[model.splitFEED_frac[s]])
-            generated_value = center_value + split_eps
-            # if 0 <= generated_value <= 1-tmp then keep generated_value
-            if generated_value < 0:
-                generated_value = random_generationPert.uniform(
-                    0 - generated_value, 0)
-            elif generated_value > 1 - tmp:
-                generated_value = random_generationPert.uniform((1 - tmp),
-                                                                generated_value)
-                generated_value = generated_value - (1 - tmp)
-            # generated_value = max(0, generated_value)
-            # generated_value = min(1-tmp, generated_value)
-            model.splitFEED_frac[s] = generated_value
-            tmp += generated_value
-
-    if not_fixed:
-        s = int((not_fixed[0])[9])
-        model.splitFEED_frac[s] = (model.splitFEED_frac[s].value + (1 - tmp))
-
-    for s in model.states:
-        model.splitFEED[s] = model.splitFEED_frac[s].value * model.FEED
-
-    # print(sum(model.splitFEED_frac[s].value for s in model.states))
-    # print()
-
-
-def perturb_splitRet(model, random_generationPert, parameter, center):
-    """Perturb slightly model splitRET variable values for a given membrane.
+        Args:
 
-    Args:
-        model (`mind.system.MembranesDesignModel`): design process 's model
+            rng (`numpy.random.Generator`) : random generator
 
-        random_generationPert (`Random`): Random object.
+            blocks (`DICT`) : arrays of the batch (updated)
 
-        parameter (`mind.builder.Configuration`) : design process configuration
+            fixed (`DICT`) : fixed masks of blocks
 
-        center (`DICT`): copy of a model's instance solution
-    """
-    for s in model.states:
-        tmp = (sum(model.splitRET_frac[s, s1].value for s1 in model.states) +
-               model.splitOutRET_frac[s].value)
-        if tmp > 1:
-            logger.exception('sum of splitRET_frac \'s fixed values > 1 '
-                             'when states = {}'.format(s))
-            raise ValueError('splitRET_frac \'s fixed values')
-
-        states_fixed_bool = ([
-            model.splitRET_frac[s, s1].fixed or
-            parameter.init_status[parameter.labels[model.splitRET_frac[s, s1]]]
-            for s1 in model.states
-        ] + [
-            model.splitOutRET_frac[s].fixed or
-            parameter.init_status[parameter.labels[model.splitOutRET_frac[s]]]
-        ])
+            xin (`numpy.ndarray`) : composition of FEED
+        """
+        feed_mem = np.where(fixed['feed_mem'], blocks['feed_mem'],
+                            blocks['feed'])
+        blocks['feed_mem'] = feed_mem
+        blocks['xin_mem'] = np.where(fixed['xin_mem'], blocks['xin_mem'],
+                                     xin)
 
-        nb_free_elem = len([1 for elem in states_fixed_bool if elem is False])
-
-        if nb_free_elem == 0 and tmp < 1:
-            logger.exception('sum of splitRET_frac \'s fixed values < 1')
-            raise ValueError('splitRET_frac \'s fixed values')
-
-        not_fixed = []
-        for s1 in model.states:
-            init_var = parameter.init_status[parameter.labels[
-                model.splitRET_frac[s, s1]]]
-            if not (model.splitRET_frac[s, s1].fixed or init_var):
-                not_fixed.append('RET_frac{}, {}'.format(s, s1))
-                split_eps = random_generationPert.uniform(
-                    -parameter.epsilon.get('feed'),
-                    parameter.epsilon.get('feed'))
-                center_value = center.get(
-                    parameter.labels[model.splitRET_frac[s, s1]])
-                generated_value = center_value + split_eps
-                # if 0 <= generated_value <= 1-tmp then keep generated_value
-                if generated_value < 0:
-                    generated_value = random_generationPert.uniform(
-                        0 - generated_value, 0)
-                elif generated_value > 1 - tmp:
-                    generated_value = random_generationPert.uniform(
-                        (1 - tmp), generated_value)
-                    generated_value = generated_value - (1 - tmp)
-                # generated_value = max(0, generated_value)
-                # generated_value = min(1-tmp, generated_value)
-                model.splitRET_frac[s, s1] = generated_value
-                tmp += generated_value
-
-        init_var = parameter.init_status[parameter.labels[
-            model.splitOutRET_frac[s]]]
-        if not (model.splitOutRET_frac[s].fixed or init_var):
-            not_fixed.append('OutRET_frac{}'.format(s))
-            center_value = center.get(
-                parameter.labels[model.splitOutRET_frac[s]])
-            generated_value = center_value + split_eps
-            # if 0 <= generated_value <= 1-tmp then keep generated_value
-            if generated_value < 0:
-                generated_value = random_generationPert.uniform(
-                    0 - generated_value, 0)
-            elif generated_value > 1 - tmp:
-                generated_value = random_generationPert.uniform((1 - tmp),
-                                                                generated_value)
-                generated_value = generated_value - (1 - tmp)
-            # generated_value = max(0, generated_value)
-            # generated_value = min(1-tmp, generated_value)
-            model.splitOutRET_frac[s] = generated_value
-            tmp += generated_value
-
-        if (not_fixed[0])[0:8] == "RET_frac":
-            s = int((not_fixed[0])[8])
-            s1 = int((not_fixed[0])[11])
-            model.splitRET_frac[s, s1] = (model.splitRET_frac[s, s1].value +
-                                          (1 - tmp))
-        elif (not_fixed[0])[0:11] == "OutRET_frac":
-            s = int((not_fixed[0])[11])
-            model.splitOutRET_frac[s] = (model.splitOutRET_frac[s].value +
-                                         (1 - tmp))
-        else:
-            raise ValueError('Error in splitRET generation')
+        perm_mem = np.where(fixed['perm_mem'], blocks['perm_mem'],
+                            rng.random(feed_mem.shape) * feed_mem)
+        ret_mem = np.where(fixed['ret_mem'], blocks['ret_mem'],
+                           feed_mem - perm_mem)
+        blocks['perm_mem'] = perm_mem
+        blocks['ret_mem'] = ret_mem
 
-        # print(
-        #     sum(model.splitRET_frac[s, s1].value for s1 in model.states)
-        #     + model.splitOutRET_frac[s].value
-        # )
-        #
-        # print()
+        ret_frac = blocks['ret_frac']
+        perm_frac = blocks['perm_frac']
+        blocks['out_ret'] = np.where(fixed['out_ret'], blocks['out_ret'],
+                                     ret_frac[:, :, -1] * ret_mem)
+        blocks['out_perm'] = np.where(fixed['out_perm'], blocks['out_perm'],
+                                      perm_frac[:, :, -1] * perm_mem)
+        blocks['split_ret'] = np.where(fixed['split_ret'], blocks['split_ret'],
+                                       ret_frac[:, :, :-1] * ret_mem[:, :, None])
+        blocks['split_perm'] = np.where(
+            fixed['split_perm'], blocks['split_perm'],
+            perm_frac[:, :, :-1] * perm_mem[:, :, None])
 
 
-def perturb_splitPerm(model, random_generationPert, parameter, center):
-    """Perturb slightly model splitPERM variable values for a given membrane.
+def cell_profile(model, parameter):
+    """Cells variables of a model's instance (gathered once per instance
+    and discretisation).
 
     Args:
-        model (`mind.system.MembranesDesignModel`): design process 's model
+        model (`pyomo.concreteModel`): design process constructed model.
 
-        random_generationPert (`Random`): Random object.
+        parameter (`mind.builder.Configuration`): process Design configuration.
 
-        parameter (`mind.builder.Configuration`) : design process configuration
+    Returns:
+        `mind.random_initialisation.CellProfile`
+    """
+    profile = _cell_profiles.get(model)
+    if (profile is None or
+            profile.discretisation != list(parameter.discretisation)):
+        profile = CellProfile(model, parameter)
+        _cell_profiles[model] = profile
+    return profile
 
-        center (`DICT`): copy of a model's instance solution
+
+class CellProfile:
+    """Vectorized initialisation of cells variables (`initCells`).
+
+    For each membrane, flows and retentate compositions are supposed
+    linear along cells, between membrane 's feed and retentate. Profiles
+    of all cells are computed as arrays (cells, components) and assigned
+    in bulk.
+
+    Attributes:
+
+        model (`pyomo.concreteModel`): design process constructed model.
+
+        parameter (`mind.builder.Configuration`): process Design configuration.
+
+        discretisation (`List[Int]`) : number of cells of each membrane
+
+        component_flows (`Bool`) : `True` if cells variables are component
+        flows (`Configuration.component_flows`)
+
+        binary_mixture (`Bool`) : `True` if only fractions of the first
+        component are variables (`Configuration.binary_mixture`)
+
+        collocation (`mind.collocation.RadauCollocation`) : collocation
+        scheme of membranes (`None` for equal cells)
+
+        cells (`DICT`) : variables of cells by membrane, lists of variables
+        by cell for flows and by (cell, component) for compositions and
+        component flows (empty for inputs of cells when they are aliased)
     """
-    for s in model.states:
-        tmp = (sum(model.splitPERM_frac[s, s1].value for s1 in model.states) +
-               model.splitOutPERM_frac[s].value)
-        if tmp > 1:
-            logger.exception('sum of splitPERM_frac \'s fixed values > 1 '
-                             'when states = {}'.format(s))
-            raise ValueError('splitPERM_frac \'s fixed values')
-
-        states_fixed_bool = ([
-            model.splitPERM_frac[s, s1].fixed or
-            parameter.init_status[parameter.labels[model.splitPERM_frac[s, s1]]]
-            for s1 in model.states
-        ] + [
-            model.splitOutPERM_frac[s].fixed or
-            parameter.init_status[parameter.labels[model.splitOutPERM_frac[s]]]
-        ])
 
-        nb_free_elem = len([1 for elem in states_fixed_bool if elem is False])
-
-        if nb_free_elem == 0 and tmp < 1:
-            logger.exception('sum of splitPERM_frac \'s fixed values < 1')
-            raise ValueError('splitPERM_frac \'s fixed values')
-
-        not_fixed = []
-        for s1 in model.states:
-            init_var = parameter.init_status[parameter.labels[
-                model.splitPERM_frac[s, s1]]]
-            if not (model.splitPERM_frac[s, s1].fixed or init_var):
-                not_fixed.append('PERM_frac{}, {}'.format(s, s1))
-                split_eps = random_generationPert.uniform(
-                    -parameter.epsilon.get('feed'),
-                    parameter.epsilon.get('feed'))
-                center_value = center.get(
-                    parameter.labels[model.splitPERM_frac[s, s1]])
-                generated_value = center_value + split_eps
-                # if 0 <= generated_value <= 1-tmp then keep generated_value
-                if generated_value < 0:
-                    generated_value = random_generationPert.uniform(
-                        0 - generated_value, 0)
-                elif generated_value > 1 - tmp:
-                    generated_value = random_generationPert.uniform(
-                        (1 - tmp), generated_value)
-                    generated_value = generated_value - (1 - tmp)
-                # generated_value = max(0, generated_value)
-                # generated_value = min(1-tmp, generated_value)
-                model.splitPERM_frac[s, s1] = generated_value
-                tmp += generated_value
-
-        init_var = parameter.init_status[parameter.labels[
-            model.splitOutPERM_frac[s]]]
-        if not (model.splitOutPERM_frac[s].fixed or init_var):
-            not_fixed.append('OutPERM_frac{}'.format(s))
-            center_value = center.get(
-                parameter.labels[model.splitOutPERM_frac[s]])
-            generated_value = center_value + split_eps
-            # if 0 <= generated_value <= 1-tmp then keep generated_value
-            if generated_value < 0:
-                generated_value = random_generationPert.uniform(
-                    0 - generated_value, 0)
-            elif generated_value > 1 - tmp:
-                generated_value = random_generationPert.uniform((1 - tmp),
-                                                                generated_value)
-                generated_value = generated_value - (1 - tmp)
-            # generated_value = max(0, generated_value)
-            # generated_value = min(1-tmp, generated_value)
-            model.splitOutPERM_frac[s] = generated_value
-            tmp += generated_value
-
-        if (not_fixed[0])[0:9] == "PERM_frac":
-            s = int((not_fixed[0])[9])
-            s1 = int((not_fixed[0])[12])
-            model.splitPERM_frac[s, s1] = (model.splitPERM_frac[s, s1].value +
-                                           (1 - tmp))
-        elif (not_fixed[0])[0:12] == "OutPERM_frac":
-            s = int((not_fixed[0])[12])
-            model.splitOutPERM_frac[s] = (model.splitOutPERM_frac[s].value +
-                                          (1 - tmp))
+    def __init__(self, model, parameter):
+        self.model = model
+        self.parameter = parameter
+        self.discretisation = list(parameter.discretisation)
+        self.components = list(model.components)
+        self.component_flows = parameter.component_flows
+        self.binary_mixture = parameter.binary_mixture
+        self.collocation = collocation_scheme(parameter)
+        self.cells = {}
+        # aliased inputs of cells are expressions (nothing to assign)
+        aliased = parameter.alias_cells
+        for s in model.states:
+            cells = range(1, self.discretisation[s - 1] + 1)
+            if self.component_flows:
+                self.cells[s] = {
+                    'feed_comp': [] if aliased else [[
+                        model.Feed_comp_cell[s, j, i] for j in self.components
+                    ] for i in cells],
+                    'ret_comp': [[
+                        model.Flux_RET_comp_cell[s, j, i]
+                        for j in self.components
+                    ] for i in cells],
+                    'perm_comp': [[
+                        model.Flux_PERM_comp_cell[s, j, i]
+                        for j in self.components
+                    ] for i in cells],
+                    'x_perm': [[
+                        model.X_PERM_cell[s, j, i] for j in self.components
+                    ] for i in cells]
+                }
+                continue
+            if self.binary_mixture:
+                # fraction of the first component only
+                self.cells[s] = {
+                    'xin': [] if aliased else
+                           [[model.XIN_cell_ref[s, i]] for i in cells],
+                    'x_ret': [[model.X_RET_cell_ref[s, i]] for i in cells],
+                    'x_perm': [[model.X_PERM_cell_ref[s, i]] for i in cells]
+                }
+            else:
+                self.cells[s] = {
+                    'xin': [] if aliased else [[model.XIN_cell[s, j, i]
+                                                for j in self.components]
+                                               for i in cells],
+                    'x_ret': [[model.X_RET_cell[s, j, i]
+                               for j in self.components]
+                              for i in cells],
+                    'x_perm': [[model.X_PERM_cell[s, j, i]
+                                for j in self.components]
+                               for i in cells]
+                }
+            self.cells[s].update({
+                'feed': [] if aliased else
+                        [model.Feed_cell[s, i] for i in cells],
+                'ret': [model.Flux_RET_cell[s, i] for i in cells],
+                'perm': [model.Flux_PERM_cell[s, i] for i in cells]
+            })
+
+    @staticmethod
+    def write(variables, values):
+        """Set variables to values (bulk assignment).
+
+        Args:
+
+            variables (`List`) : variables (nested as `values`)
+
+            values (`numpy.ndarray`) : values of `variables`
+        """
+        if values.ndim > 1:
+            variables = [var for row in variables for var in row]
+        for var, value in zip(variables, values.ravel().tolist()):
+            var.set_value(value, True)
+
+    def initialise(self):
+        """Initialise cells variables of all membranes from membranes 's
+        variables values."""
+        for s in self.model.states:
+            self.initialise_membrane(s)
+
+    def initialise_membrane(self, s):
+        """Initialise cells variables of a membrane.
+
+        Args:
+            s (`Int`) : membrane 's index
+        """
+        model = self.model
+        parameter = self.parameter
+        last_cell_index = self.discretisation[s - 1]
+        nb_comp = len(self.components)
+
+        feed = model.Feed_mem[s].value
+        ret = model.Flux_RET_mem[s].value
+        xin = np.array([model.XIN_mem[s, j].value for j in self.components])
+        x_ret = np.array(
+            [model.X_RET_mem[s, j].value for j in self.components])
+
+        # flows supposing linearity along cells, RET of a cell is the
+        # input of the next one
+        delta = (feed - ret) / last_cell_index
+        if self.collocation is None:
+            index = np.arange(1, last_cell_index)
         else:
-            raise ValueError('Error in splitPERM generation')
+            # positions of collocation points (in number of cells)
+            index = self.collocation.positions()[:-1] * last_cell_index
+        flux_ret = np.empty(last_cell_index)
+        flux_ret[:-1] = feed - index * delta
+        flux_ret[-1] = ret
+        feed_cell = np.empty(last_cell_index)
+        feed_cell[0] = feed
+        feed_cell[1:] = flux_ret[:-1]
+        flux_perm = feed_cell - flux_ret
+
+        # compositions (inputs of cells are not normalized)
+        x_ret_cell = np.empty((last_cell_index, nb_comp))
+        x_ret_cell[:-1] = (xin - index[:, None] * (xin - x_ret) /
+                           last_cell_index)
+        x_ret_cell[-1] = x_ret
+        xin_cell = np.empty((last_cell_index, nb_comp))
+        xin_cell[0] = xin
+        xin_cell[1:] = x_ret_cell[:-1]
 
-        # print(
-        #     sum(model.splitPERM_frac[s, s1].value for s1 in model.states)
-        #     + model.splitOutPERM_frac[s].value
-        # )
-        # print()
+        # normalizing to 1
+        total = self.total(x_ret_cell)
+        positive = total > 0
+        x_ret_cell[positive] = x_ret_cell[positive] / total[positive, None]
+
+        # permeated compositions of cells with a significant PERM flow
+        # TODO:   numerical value to handle
+        active = np.flatnonzero(flux_perm >= 1.e-3)
+        x_perm = self.profiles(s)[2]
+        x_perm_cell = x_perm[active]
+        if parameter.uniform_pup:
+            pressure_up = model.pressure_up.value
+        else:
+            pressure_up = model.pressure_up[s].value
+        pressure_down = model.pressure_down[s].value
+        if self.collocation is None:
+            area = model.area[s].value / parameter.discretisation[s - 1]
+        else:
+            area = model.area[s].value * np.array([
+                self.collocation.weight(i + 1) for i in active
+            ])
+        for k, j in enumerate(self.components):
+            tmp1 = area * model.Permeability[j, s].value
+            tmp2 = pressure_up * x_ret_cell[active, k]
+            tmp3 = pressure_down * x_perm_cell[:, k]
+            tmp4 = tmp1 * (tmp2 - tmp3) / flux_perm[active]
+            # min(1, max(0, tmp4))
+            tmp4 = np.where(tmp4 > 0, tmp4, 0.)
+            x_perm_cell[:, k] = np.where(tmp4 < 1, tmp4, 1.)
+            # normalized mixture is set to an uniform one
+            # (just to avoid all init to zero)
+            positive = self.total(x_perm_cell) > 0
+            x_perm_cell[positive] = 1 / nb_comp
+
+        x_perm[active] = x_perm_cell
+        self.store(s, feed_cell, flux_ret, flux_perm, xin_cell, x_ret_cell,
+                   x_perm, active)
+
+    def interpolate(self, source):
+        """Initialise cells variables by interpolating the cells profiles of
+        another discretisation (ex: solution of a coarse model).
+
+        Membranes variables values (`Feed_mem`, `Flux_RET_mem`, ...) must
+        be set before.
 
+        Args:
+            source (`mind.random_initialisation.CellProfile`) : cells
+            variables of the other model's instance
+        """
+        for s in self.model.states:
+            self.interpolate_membrane(s, source)
 
-def Perturbation_membranes(model, center, random_generationPert, parameter,
-                           behavior, fname_mask):
-    """Perturb slightly a feasible solution of the model. The feasible
-    solution is also overwrite by the obtained solution (perturbated one).
+    def interpolate_membrane(self, s, source):
+        """Initialise cells variables of a membrane by interpolation.
 
-    Args:
-        model (`mind.system.MembranesDesignModel`): design process 's model
+        Retentate flows and compositions are interpolated at cells outlets,
+        permeated compositions at cells middles.
 
-        random_generationPert (`Random`): Random object.
+        Args:
 
-        parameter (`mind.builder.Configuration`) : design process configuration
+            s (`Int`) : membrane 's index
+
+            source (`mind.random_initialisation.CellProfile`) : cells
+            variables of the other model's instance
+        """
+        model = self.model
+        source_ret, source_x_ret, source_x_perm = source.profiles(s)
+        nb_comp = len(self.components)
+
+        feed = model.Feed_mem[s].value
+        ret = model.Flux_RET_mem[s].value
+        xin = np.array([model.XIN_mem[s, j].value for j in self.components])
+        x_ret = np.array(
+            [model.X_RET_mem[s, j].value for j in self.components])
+
+        # membrane inlet then cells outlets
+        source_position = np.concatenate(([0.], source.outlets(s)))
+        position = self.outlets(s)
+        flux_ret = np.interp(
+            position, source_position,
+            np.concatenate(([feed], source_ret)))
+        flux_ret[-1] = ret
+        feed_cell = np.concatenate(([feed], flux_ret[:-1]))
+        flux_perm = feed_cell - flux_ret
+
+        source_x_ret = np.vstack((xin, source_x_ret))
+        x_ret_cell = np.column_stack([
+            np.interp(position, source_position, source_x_ret[:, k])
+            for k in range(nb_comp)
+        ])
+        x_ret_cell[-1] = x_ret
+        xin_cell = np.vstack((xin, x_ret_cell[:-1]))
+
+        # cells middles
+        source_middle = source.middles(s)
+        middle = self.middles(s)
+        x_perm_cell = np.column_stack([
+            np.interp(middle, source_middle, source_x_perm[:, k])
+            for k in range(nb_comp)
+        ])
 
-        center (`DICT`): copy of a model's instance solution
+        self.store(s, feed_cell, flux_ret, flux_perm, xin_cell, x_ret_cell,
+                   x_perm_cell)
 
-        behavior (`mind.membranes.MembranesTypes`): desing process membrane 's description.
+    def outlets(self, s):
+        """Positions of cells outlets along a membrane (collocation points).
 
-        fname_mask (`str`) : path to file containing information about fixed variables
-    """
+        Args:
+            s (`Int`) : membrane 's index
 
-    initZero(model)
-    remove_var_initialisations(parameter)
-    if parameter.fixing_var:
-        fixing_method(fname_mask, model, parameter)
+        Returns:
+            `numpy.ndarray`
+        """
+        if self.collocation is not None:
+            return self.collocation.positions()
+        last_cell_index = self.discretisation[s - 1]
+        return np.arange(1, last_cell_index + 1) / last_cell_index
 
-    logger.info("Perturabation method")
+    def middles(self, s):
+        """Positions of cells middles along a membrane, where permeated
+        compositions are located (collocation points).
 
-    # area perturbation
-    perturb_area(model, random_generationPert, parameter, center)
-    # Pressures perturbation
-    perturb_pressure(model, random_generationPert, parameter, center)
+        Args:
+            s (`Int`) : membrane 's index
 
-    if parameter.variable_perm:
-        behavior.mem_type_element_perturbation(model, parameter, center,
-                                               random_generationPert)
+        Returns:
+            `numpy.ndarray`
+        """
+        if self.collocation is not None:
+            return self.collocation.positions()
+        last_cell_index = self.discretisation[s - 1]
+        return (np.arange(last_cell_index) + 0.5) / last_cell_index
 
-    perturb_splitFeed(model, random_generationPert, parameter, center)
-    perturb_splitRet(model, random_generationPert, parameter, center)
-    perturb_splitPerm(model, random_generationPert, parameter, center)
+    def store(self, s, feed, flux_ret, flux_perm, xin, x_ret, x_perm,
+              active=None):
+        """Set cells variables of a membrane from flows (cells) and
+        compositions (cells, components) profiles.
 
-    initFlows(model, random_generationPert, parameter)
+        Args:
 
+            s (`Int`) : membrane 's index
 
-def initCells(model, parameter):
-    """Intialise variables related to cells level.
+            feed, flux_ret, flux_perm (`numpy.ndarray`) : flows of cells
 
-    Args:
-        model (`pyomo.concreteModel`): design process constructed model.
+            xin, x_ret, x_perm (`numpy.ndarray`) : compositions of cells
 
-        parameter (`mind.builder.Configuration`): process Design configuration.
-    """
+            active (`numpy.ndarray`) : cells whose permeated compositions
+            are set (`default = None`, all cells)
+        """
+        cells = self.cells[s]
+        if self.component_flows:
+            self.write(cells['feed_comp'], feed[:, None] * xin)
+            self.write(cells['ret_comp'], flux_ret[:, None] * x_ret)
+            self.write(cells['perm_comp'], flux_perm[:, None] * x_perm)
+            if active is None:
+                self.write(cells['x_perm'], x_perm)
+            else:
+                self.write([cells['x_perm'][i] for i in active],
+                           x_perm[active])
+            return
+
+        if self.binary_mixture:
+            xin, x_ret, x_perm = xin[:, :1], x_ret[:, :1], x_perm[:, :1]
+        self.write(cells['feed'], feed)
+        self.write(cells['ret'], flux_ret)
+        self.write(cells['perm'], flux_perm)
+        self.write(cells['xin'], xin)
+        self.write(cells['x_ret'], x_ret)
+        if active is None:
+            self.write(cells['x_perm'], x_perm)
+        else:
+            self.write([cells['x_perm'][i] for i in active], x_perm[active])
 
-    for s in model.states:
-        last_cell_index = parameter.discretisation[s - 1]
-        # first cell Feed
-        model.Feed_cell[s, 1] = model.Feed_mem[s].value
-        for j in model.components:
-            model.XIN_cell[s, j, 1] = model.XIN_mem[s, j].value
-
-        delta = model.Feed_mem[s].value - model.Flux_RET_mem[s].value
-        delta = delta / last_cell_index
-
-        # all cells except last
-        for i in range(1, last_cell_index):
-            # calculate RET for current cell supposing linearity along cells
-            model.Flux_RET_cell[s, i] = model.Feed_mem[s].value - i * delta
-
-            # calculate PERM for current cell
-            model.Flux_PERM_cell[s, i] = (model.Feed_cell[s, i].value -
-                                          model.Flux_RET_cell[s, i].value)
-            # input next cell update
-            model.Feed_cell[s, i + 1] = model.Flux_RET_cell[s, i].value
-
-            for j in model.components:
-                model.X_RET_cell[s, j, i] = (
-                    model.XIN_mem[s, j].value - i *
-                    (model.XIN_mem[s, j].value - model.X_RET_mem[s, j].value) /
-                    last_cell_index)
-
-            for j in model.components:
-                model.XIN_cell[s, j, i + 1] = (model.X_RET_cell[s, j, i].value)
-
-        # last (and output) cell
-        model.Flux_RET_cell[s, last_cell_index] = (model.Flux_RET_mem[s].value)
-        for j in model.components:
-            model.X_RET_cell[s, j, last_cell_index] = (model.X_RET_mem[s,
-                                                                       j].value)
-
-        # calculate PERM
-        model.Flux_PERM_cell[s, last_cell_index] = (
-            model.Feed_cell[s, last_cell_index].value -
-            model.Flux_RET_cell[s, last_cell_index].value)
+    def profiles(self, s):
+        """Current retentate flows, retentate and permeated compositions of
+        cells of a membrane.
 
-        # normalizing to 1
-        for i in range(1, last_cell_index + 1):
-            total = sum(
-                model.X_RET_cell[s, j, i].value for j in model.components)
-            if total > 0:
-                for j in model.components:
-                    model.X_RET_cell[s, j,
-                                     i] = (model.X_RET_cell[s, j, i].value /
-                                           total)
-
-            # TODO:   numerical value to handle
-            if model.Flux_PERM_cell[s, i].value >= 1.e-3:
-                # TODO: ask bernardetta why we don't divise tmp1 by thickness
-                # TODO: delete .value
-                for j in model.components:
-                    tmp1 = ((model.area[s].value /
-                             parameter.discretisation[s - 1]) *
-                            model.Permeability[j, s].value)
-
-                    if (parameter.uniform_pup):
-                        tmp2 = (model.pressure_up.value *
-                                model.X_RET_cell[s, j, i].value)
-                    else:
-                        tmp2 = (model.pressure_up[s].value *
-                                model.X_RET_cell[s, j, i].value)
-                    # print(model.pressure_down[s].value)
-                    # print(model.X_PERM_cell[s, j, i].value)
-                    tmp3 = (model.pressure_down[s].value *
-                            model.X_PERM_cell[s, j, i].value)
-                    tmp4 = (tmp1 * (tmp2 - tmp3) /
-                            model.Flux_PERM_cell[s, i].value)
-                    model.X_PERM_cell[s, j, i] = min(1, max(0, tmp4))
-                    # normalizing to 1 the mixture
-                    total = sum(model.X_PERM_cell[s, j, i].value
-                                for j in model.components)
-                    if total > 0:
-                        for j in model.components:
-                            model.X_PERM_cell[s, j, i] = (
-                                model.X_PERM_cell[s, j, i].value / total)
-                        else:
-                            # just to avoid all init to zero
-                            for j in model.components:
-                                model.X_PERM_cell[s, j, i] = (
-                                    1 / len(model.components))
+        Args:
+            s (`Int`) : membrane 's index
+
+        Returns:
+            `Tuple` of `numpy.ndarray` (cells), (cells, components),
+            (cells, components)
+        """
+        cells = self.cells[s]
+        if self.binary_mixture:
+            x_ret = self.read(cells['x_ret'])[:, 0]
+            x_perm = self.read(cells['x_perm'])[:, 0]
+            return (self.read(cells['ret']),
+                    np.column_stack((x_ret, 1 - x_ret)),
+                    np.column_stack((x_perm, 1 - x_perm)))
+        if not self.component_flows:
+            return (self.read(cells['ret']), self.read(cells['x_ret']),
+                    self.read(cells['x_perm']))
+        ret_comp = self.read(cells['ret_comp'])
+        perm_comp = self.read(cells['perm_comp'])
+        return (self.total(ret_comp), self.fractions(ret_comp),
+                self.fractions(perm_comp))
+
+    def fractions(self, values):
+        """Compositions of cells from component flows (zero for cells
+        without flow).
+
+        Args:
+            values (`numpy.ndarray`) : component flows (cells, components)
+
+        Returns:
+            `numpy.ndarray` of the same shape
+        """
+        total = self.total(values)
+        return np.divide(values,
+                         total[:, None],
+                         out=np.zeros_like(values),
+                         where=total[:, None] > 0)
+
+    @staticmethod
+    def read(variables):
+        """Values of variables (`nan` if a value is `None`).
+
+        Args:
+            variables (`List`) : variables (or lists of variables)
+
+        Returns:
+            `numpy.ndarray` of the same shape
+        """
+        if variables and isinstance(variables[0], list):
+            return np.array([[
+                np.nan if var.value is None else var.value for var in row
+            ] for row in variables],
+                            dtype=float)
+        return np.array(
+            [np.nan if var.value is None else var.value for var in variables],
+            dtype=float)
+
+    @staticmethod
+    def total(values):
+        """Sums of compositions of cells (components summed in order, as
+        `sum`).
+
+        Args:
+            values (`numpy.ndarray`) : compositions (cells, components)
+
+        Returns:
+            `numpy.ndarray` of shape (cells,)
+        """
+        total = np.zeros(values.shape[0])
+        for k in range(values.shape[1]):
+            total = total + values[:, k]
+        return total
@@ -48,6 +48,69 @@ def get_last_value_file_line(file):
     return float(line[-1])
 
 
+def set_cells_value_file_line(file, var, index, values):
+    """Set the value of a cell variable from a reading file line.
+
+    The file stores `n` cells for each membrane, while the instance only
+    has the cells of the membrane's discretisation (surplus lines are
+    skipped).
+
+    Args:
+        file (`_io.TextIOWrapper`) : opened file descriptor
+
+        var (`pyomo.core.base.var.IndexedVar`) : cells variable
+
+        index (`tuple`) : index of the variable in `var`
+
+        values (`DICT`) : read values by (variable's name, index)
+    """
+    value = get_last_value_file_line(file)
+    values[var.local_name, index] = value
+    # aliased cells inputs are expressions (see `Configuration.alias_cells`)
+    if isinstance(var, pe.Var) and index in var:
+        var[index].value = value
+
+
+def set_component_flows(model, values):
+    """Set component flows of cells from flows and fractions read in a file
+    (see `Configuration.component_flows`).
+
+    Args:
+        model (`pyomo.environ.ConcreteModel`) : model's instance
+
+        values (`DICT`) : read values by (variable's name, index)
+    """
+    for (mem, j, i) in model.component_cells:
+        if isinstance(model.Feed_comp_cell, pe.Var):
+            model.Feed_comp_cell[mem, j, i].value = (
+                values['Feed_cell', (mem, i)] *
+                values['XIN_cell', (mem, j, i)])
+        model.Flux_RET_comp_cell[mem, j, i].value = (
+            values['Flux_RET_cell', (mem, i)] *
+            values['X_RET_cell', (mem, j, i)])
+        model.Flux_PERM_comp_cell[mem, j, i].value = (
+            values['Flux_PERM_cell', (mem, i)] *
+            values['X_PERM_cell', (mem, j, i)])
+
+
+def set_binary_fractions(model, values):
+    """Set fractions of the first component of cells from fractions read in
+    a file (see `Configuration.binary_mixture`).
+
+    Args:
+        model (`pyomo.environ.ConcreteModel`) : model's instance
+
+        values (`DICT`) : read values by (variable's name, index)
+    """
+    first = model.components.first()
+    for name in ('XIN_cell', 'X_RET_cell', 'X_PERM_cell'):
+        var = getattr(model, name + '_ref', None)
+        if var is None:
+            continue
+        for (mem, i) in model.cells:
+            var[mem, i].value = values[name, (mem, first, i)]
+
+
 def load_generated_ampl(filename,
                         model,
                         parameter,
@@ -169,46 +232,53 @@ def load_generated_ampl(filename,
         # updated format
         file.readline()  # read BlankLine
         file.readline()  # read text (Feed cell)
+        cells_values = {}
 
         for mem in model.states:
-            for i in model.N:
-                model.Feed_cell[mem, i].value = get_last_value_file_line(file)
+            for i in range(1, pe.value(model.n) + 1):
+                set_cells_value_file_line(file, model.Feed_cell, (mem, i),
+                                          cells_values)
 
         file.readline()  # read BlankLine
         file.readline()  # read text (Flux RET cell)
         for mem in model.states:
-            for i in model.N:
-                model.Flux_RET_cell[mem,
-                                    i].value = get_last_value_file_line(file)
+            for i in range(1, pe.value(model.n) + 1):
+                set_cells_value_file_line(file, model.Flux_RET_cell, (mem, i),
+                                          cells_values)
 
         file.readline()  # read BlankLine
         file.readline()  # read text (Flux PERM cell)
         for mem in model.states:
-            for i in model.N:
-                model.Flux_PERM_cell[mem,
-                                     i].value = get_last_value_file_line(file)
+            for i in range(1, pe.value(model.n) + 1):
+                set_cells_value_file_line(file, model.Flux_PERM_cell, (mem, i),
+                                          cells_values)
 
         file.readline()  # read BlankLine
         file.readline()  # read text (Xin_cell)
         for mem in model.states:
             for j in model.components:
-                for i in model.N:
-                    model.XIN_cell[mem, j,
-                                   i].value = get_last_value_file_line(file)
+                for i in range(1, pe.value(model.n) + 1):
+                    set_cells_value_file_line(file, model.XIN_cell,
+                                              (mem, j, i), cells_values)
 
         file.readline()  # read text (X_RET_cell)
         for mem in model.states:
             for j in model.components:
-                for i in model.N:
-                    model.X_RET_cell[mem, j,
-                                     i].value = get_last_value_file_line(file)
+                for i in range(1, pe.value(model.n) + 1):
+                    set_cells_value_file_line(file, model.X_RET_cell,
+                                              (mem, j, i), cells_values)
 
         file.readline()  # read text (X_PERM_cell)
         for mem in model.states:
             for j in model.components:
-                for i in model.N:
-                    model.X_PERM_cell[mem, j,
-                                      i].value = get_last_value_file_line(file)
+                for i in range(1, pe.value(model.n) + 1):
+                    set_cells_value_file_line(file, model.X_PERM_cell,
+                                              (mem, j, i), cells_values)
+
+        if parameter.component_flows:
+            set_component_flows(model, cells_values)
+        elif parameter.binary_mixture:
+            set_binary_fractions(model, cells_values)
 
         file.readline()  # read BlankLine
         file.readline()  # read text (Feed mem)
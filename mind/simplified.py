@@ -0,0 +1,123 @@
+"""Compact simplified model of membrane design process.
+
+The simplified model (total area of a membrane handled like a single large
+cell) only involves membranes level variables : splits, membranes flows and
+compositions, areas and pressures. Instead of deactivating cells
+constraints and fixing cells variables of the full model's instance before
+each simplified solve (then restoring it), a `SimplifiedModel` is a
+separate small `PYOMO` model built once, with its own variables. Values,
+bounds and fixed status are exchanged with the full model's instance
+through an explicit mapping of variables.
+"""
+
+import logging
+
+import pyomo.environ as pe
+from pyomo.core.expr.visitor import identify_variables, replace_expressions
+
+# logging variable
+logger = logging.getLogger(__name__)
+logger.setLevel(level=logging.DEBUG)
+handler = logging.StreamHandler()
+# handler = logging.FileHandler(filename)
+logger.addHandler(handler)
+formatter = logging.Formatter(fmt='[%(asctime)s] %(levelname)s : %(message)s',
+                              datefmt='%a, %d %b %Y %H:%M:%S')
+handler.setFormatter(formatter)
+
+
+class SimplifiedModel:
+    """Membranes level model equivalent to the simplified state of the full
+    model's instance.
+
+    Constraints and objective active in the simplified state (see
+    `mind.gas.MembranesDesignGas.simplified_model`) are copied once, their
+    variables being substituted by variables of the compact model. Mutable
+    parameters are shared with the full model's instance.
+
+    Attributes:
+
+        instance (`pyomo.environ.ConcreteModel`) : full model's instance
+
+        model (`pyomo.environ.ConcreteModel`) : compact simplified model
+
+        full_variables (`List`) : variables of the full instance used by the
+        simplified model
+
+        variables (`List`) : corresponding variables of `model`
+
+        always_fixed (`set`) : ids of full instance's variables fixed during
+        simplified solves (ex: permeability)
+    """
+
+    def __init__(self, modelisation):
+        instance = modelisation.instance
+        self.instance = instance
+
+        # active components of the simplified state
+        modelisation.simplified_model()
+        try:
+            constraints = list(
+                instance.component_data_objects(pe.Constraint, active=True))
+            objectives = list(
+                instance.component_data_objects(pe.Objective, active=True))
+            self.always_fixed = {
+                id(var)
+                for var in instance.component_data_objects(pe.Var)
+                if var.fixed
+            }
+        finally:
+            modelisation.restore_original_model()
+
+        self.full_variables = []
+        seen = set()
+        for data in constraints + objectives:
+            for var in identify_variables(data.expr, include_fixed=True):
+                if id(var) not in seen:
+                    seen.add(id(var))
+                    self.full_variables.append(var)
+        self.always_fixed = {
+            id(var) for var in self.full_variables
+            if id(var) in self.always_fixed and not var.fixed
+        }
+
+        model = pe.ConcreteModel(name='simplified')
+        model.x = pe.Var(range(len(self.full_variables)), dense=True)
+        self.variables = [model.x[k] for k in range(len(self.full_variables))]
+        substitution = {}
+        for var, compact_var in zip(self.full_variables, self.variables):
+            compact_var.domain = var.domain
+            substitution[id(var)] = compact_var
+
+        model.constraints = pe.ConstraintList()
+        for data in constraints:
+            model.constraints.add(replace_expressions(data.expr, substitution))
+        objective = objectives[0]
+        model.obj = pe.Objective(expr=replace_expressions(
+            objective.expr, substitution),
+                                 sense=objective.sense)
+        self.model = model
+
+        logger.info(
+            "Simplified model : %d variables, %d constraints (full instance : "
+            "%d variables)", len(self.variables), len(constraints),
+            len(list(instance.component_data_objects(pe.Var))))
+
+    def load_from_instance(self):
+        """Set values, bounds and fixed status of simplified model's variables
+        from the full instance."""
+        for var, compact_var in zip(self.full_variables, self.variables):
+            compact_var.setlb(var.lb)
+            compact_var.setub(var.ub)
+            compact_var.set_value(var.value, True)
+            if var.fixed or id(var) in self.always_fixed:
+                compact_var.fix()
+            else:
+                compact_var.unfix()
+
+    def store_to_instance(self):
+        """Set values of the free variables of the full instance from the
+        simplified model."""
+        for var, compact_var in zip(self.full_variables, self.variables):
+            if not compact_var.fixed:
+                var.set_value(compact_var.value, True)
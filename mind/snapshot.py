@@ -0,0 +1,239 @@
+"""Snapshots of variables values of a model's instance.
+
+A `VariableLayout` fixes once the order of the variables of a model's
+instance, a `Point` keeps their values in a `numpy` array following this
+order. Storing and restoring a point are then bulk operations, without
+parsing any `ComponentUID` string.
+
+Points still behave as the previous (read-only) dictionaries of values
+indexed by variables labels (ex: `point['OUT_prod']`). Labels are generated
+lazily (`VariableLabels`) : most of the variables (cells) are never looked
+up by label, so large instances don't pay for all of their labels.
+"""
+
+import logging
+from collections import deque
+from itertools import repeat
+
+import numpy as np
+import pyomo.environ as pe
+from pyomo.common.collections import ComponentMap
+from pyomo.core.base.componentuid import ComponentUID
+from pyomo.core.staleflag import StaleFlagManager
+
+# logging variable
+logger = logging.getLogger(__name__)
+logger.setLevel(level=logging.DEBUG)
+handler = logging.StreamHandler()
+# handler = logging.FileHandler(filename)
+logger.addHandler(handler)
+formatter = logging.Formatter(fmt='[%(asctime)s] %(levelname)s : %(message)s',
+                              datefmt='%a, %d %b %Y %H:%M:%S')
+handler.setFormatter(formatter)
+
+
+class VariableLabels:
+    """`ComponentUID` labels of the variables of a model's instance,
+    generated when looked up (same labels as
+    `ComponentUID.generate_cuid_string_map`).
+
+    Attributes:
+
+        model (`pyomo.environ.ConcreteModel`) : model's instance
+
+        labels (`pyomo.common.collections.ComponentMap`) : labels generated
+        so far by variable
+
+        complete (`Bool`) : `True` if labels of all variables are generated
+    """
+
+    def __init__(self, model):
+        self.model = model
+        self.labels = ComponentMap()
+        self.complete = False
+
+    def __getitem__(self, var):
+        label = self.labels.get(var)
+        if label is None:
+            label = str(ComponentUID(var))
+            self.labels[var] = label
+        return label
+
+    def generate(self):
+        """Generate labels of all variables at once (faster than one by
+        one)."""
+        if not self.complete:
+            self.labels = ComponentUID.generate_cuid_string_map(self.model,
+                                                                ctype=pe.Var)
+            self.complete = True
+
+
+class VariableLayout:
+    """Fixed order of the variables of a model's instance.
+
+    Two instances built from the same configuration and datafiles have the
+    same layout, so values captured in one of them (ex: in a worker
+    process) can be restored in the other one.
+
+    Attributes:
+
+        model (`pyomo.environ.ConcreteModel`) : model's instance
+
+        variables (`List`) : variables of the model's instance
+
+        variable_labels (`mind.snapshot.VariableLabels`) : labels of the
+        model's variables
+
+        positions (`DICT`) : position of each variable (by `id`) in
+        `variables`
+
+        index (`DICT`) : position of each label looked up so far
+    """
+
+    def __init__(self, model, labels):
+        self.model = model
+        self.variables = list(model.component_data_objects(pe.Var))
+        self.variable_labels = labels
+        self.positions = {id(var): i for i, var in enumerate(self.variables)}
+        self.index = {}
+
+    @property
+    def labels(self):
+        """`ComponentUID` labels of `variables` (`List[str]`)."""
+        self.variable_labels.generate()
+        return [self.variable_labels[var] for var in self.variables]
+
+    def position(self, label):
+        """Position of a variable in `variables`, given its label.
+
+        Args:
+            label (`str`) : `ComponentUID` label of the variable
+
+        Returns:
+            `Int` (`None` if not a variable of the model's instance)
+        """
+        if label not in self.index:
+            try:
+                var = ComponentUID(label).find_component_on(self.model)
+            except Exception:
+                var = None
+            self.index[label] = self.positions.get(id(var))
+        return self.index[label]
+
+    def __len__(self):
+        return len(self.variables)
+
+    def capture(self):
+        """Current values of the variables (`nan` if a value is `None`).
+
+        Returns:
+            `mind.snapshot.Point`
+        """
+        values = np.fromiter(
+            (np.nan if var.value is None else var.value
+             for var in self.variables),
+            dtype=float,
+            count=len(self.variables))
+        return Point(self, values)
+
+    def restore(self, values):
+        """Set variables to `values` (`None` for `nan`).
+
+        Values come from this layout : they are stored directly in the
+        variables (without domain validation), as `PYOMO` loads solutions.
+
+        Args:
+            values (`numpy.ndarray`) : values in layout's order
+        """
+        missing = np.isnan(values)
+        restored = values.astype(object)
+        restored[missing] = None
+
+        StaleFlagManager.mark_all_as_stale()
+        # variables without value are stale
+        stale = np.where(missing, 0, StaleFlagManager.get_flag(0))
+        deque(map(setattr, self.variables, repeat('_value'),
+                  restored.tolist()),
+              maxlen=0)
+        deque(map(setattr, self.variables, repeat('_stale'), stale.tolist()),
+              maxlen=0)
+        StaleFlagManager.mark_all_as_stale(delayed=True)
+
+    def point(self, values):
+        """Point of `values` (ex: array received from a worker process).
+
+        Args:
+            values (`numpy.ndarray`) : values in layout's order
+
+        Returns:
+            `mind.snapshot.Point`
+        """
+        try:
+            assert len(values) == len(self.variables)
+        except AssertionError:
+            logger.exception("Point of %d values for a layout of %d variables",
+                             len(values), len(self.variables))
+            raise ValueError("Point does not match model's variables")
+        return Point(self, np.asarray(values, dtype=float))
+
+
+class Point:
+    """Values of the variables of a model's instance.
+
+    Attributes:
+
+        layout (`mind.snapshot.VariableLayout`) : variables order
+
+        values (`numpy.ndarray`) : values of the variables (layout's order)
+    """
+
+    def __init__(self, layout, values):
+        self.layout = layout
+        self.values = values
+
+    def __len__(self):
+        return len(self.values)
+
+    def __contains__(self, label):
+        return self.layout.position(label) is not None
+
+    def __getitem__(self, label):
+        position = self.layout.position(label)
+        if position is None:
+            raise KeyError(label)
+        value = self.values[position]
+        return None if np.isnan(value) else float(value)
+
+    def get(self, label, default=None):
+        """Value of variable `label` (`default` if unknown)."""
+        if label not in self:
+            return default
+        return self[label]
+
+    def keys(self):
+        """Labels of the variables."""
+        return iter(self.layout.labels)
+
+    def items(self):
+        """Pairs (label, value) of the variables."""
+        return ((label, None if value != value else value)
+                for label, value in zip(self.layout.labels,
+                                        self.values.tolist()))
+
+    def copy(self):
+        """Copy of the point (same layout)."""
+        return Point(self.layout, self.values.copy())
+
+    def restore(self, model=None):
+        """Set the variables of `model` to this point.
+
+        Args:
+            model (`pyomo.environ.ConcreteModel`) : model's instance
+            (`default = None`, the layout's one)
+        """
+        if model is None or model is self.layout.model:
+            self.layout.restore(self.values)
+        else:
+            # another instance : variables are found by their labels
+            for label, value in self.items():
+                model.find_component(label).value = value
@@ -5,15 +5,20 @@ import time
 import os
 import logging
 import copy
+import shutil
+import asyncio
+import multiprocessing
+from concurrent.futures import as_completed, ThreadPoolExecutor
 
 import pyomo.environ as pe
 from pyomo.opt import SolverStatus, TerminationCondition
 import pyutilib.subprocess.GlobalData as GlobalData
 
 from mind.builder import build_model
-from mind.genetic import Population
+from mind.multiresolution import build_coarse_model, ResolutionTransfer
+from mind.parallel import create_pool, multistart_task, mbh_chain_task
 from mind.printing import print_model_solution, plotting_solution
-from mind.population import PopAlgortihm
+from mind.snapshot import Point
 from mind.random_initialisation import random_generation, \
     Perturbation_membranes, initCells
 from datetime import datetime
@@ -86,13 +91,32 @@ class GlobalOptimisation:
 
         feasible (`Bool`) : `True` if design process's solver find a feasible solution
 
-        Z_point (`DICT`): data structure used to store association of variables and values
+        Z_point (`mind.snapshot.Point`): data structure used to store association of variables and values
 
-        putative_solution (`Float`): data structure used to store best solution obtained
+        putative_solution (`mind.snapshot.Point`): data structure used to store best solution obtained
 
         keep_sols (`Bool`) : list used to keep trace of feasible solution
 
         evolutionary_algorithm (`Bool`): `True` if evolutionary algorithm's used.
+
+        nb_workers (`Int`): number of worker processes used by parallel
+        algorithms (`default = 1`, sequential execution)
+
+        incumbent (`multiprocessing.Value`): best objective function value
+        shared between processes (`None` when executed sequentially)
+
+        nb_solver_processes (`Int`): maximal number of solver's processes
+        running at the same time in `pipelined_multistart` (`default = 1`,
+        no pipeline)
+
+        coarse_cells (`Int`): maximal number of cells of each membrane during
+        exploration (`default = 0`, exploration at target discretisation)
+
+        nb_refined (`Int`): number of best coarse solutions refined at
+        target discretisation (`default = 3`)
+
+        candidates (`List`): best solutions kept for refinement, pairs of
+        objective function value and `mind.snapshot.Point`
     """
 
     def __init__(self,
@@ -100,7 +124,11 @@ class GlobalOptimisation:
                  log_dir,
                  debug=False,
                  starting_point=True,
-                 simplified_model=True):
+                 simplified_model=True,
+                 workers=1,
+                 solver_processes=1,
+                 coarse_cells=0,
+                 refined_candidates=3):
         """Initializing solver resolution caller object."""
         logger.info(
             'Creation of an instance of solver class, module for optimization')
@@ -148,6 +176,17 @@ class GlobalOptimisation:
         # population component
         self.evolutionary_algorithm = None
 
+        # worker processes (parallel algorithms)
+        self.nb_workers = max(1, int(workers))
+        self.incumbent = None
+        # solver's processes (pipelined multistart)
+        self.nb_solver_processes = max(1, int(solver_processes))
+
+        # coarse-to-fine discretisation
+        self.coarse_cells = max(0, int(coarse_cells))
+        self.nb_refined = max(1, int(refined_candidates))
+        self.candidates = None
+
     def init_independant_variables(self, modelisation):
         """Generate random values for independant variables in the model.
 
@@ -180,8 +219,11 @@ class GlobalOptimisation:
 
         """
         logger.info('Launching Simplified model')
-        my_model = modelisation.instance
-        modelisation.simplified_model()
+        compact_model = modelisation.simplified_instance()
+        # putting some bounds on flows frac variables before solve simpl
+        modelisation.simplified_split_flows_bound()
+        compact_model.load_from_instance()
+        my_model = compact_model.model
         # then solve this model
         if self.debug_mode:
             results = self.optsolver.call_solver(my_model,
@@ -205,6 +247,7 @@ class GlobalOptimisation:
             # Solution is optimal
             self.nloc_simpl += 1
             my_model.solutions.load_from(results)
+            compact_model.store_to_instance()
             logger.info('Get Optimal solution when running simplified model')
             self.solver_result_simpl = "LS_simpl OPT"
         else:
@@ -218,8 +261,8 @@ class GlobalOptimisation:
                 str(results.solver.termination_condition),
                 results.solver.termination_condition)
 
-        # Restore the original method
-        modelisation.restore_original_model()
+        # Restore the original bounds
+        modelisation.reset_split_flows_bound()
 
     def deduce_dependant_variables(self, my_model, my_param):
         """Deduce some values (random) to dependent varaibles.
@@ -283,12 +326,32 @@ class GlobalOptimisation:
 
         logger.info("LocalSearch time = {}".format(t_e - t_i))
 
+        return self.load_local_search(my_model, results)
+
+    def load_local_search(self, my_model, results, solver_log=None):
+        """Check local search's results and load its solution if feasible.
+
+        Args:
+
+            my_model (`mind.system.MembranesDesignModel`) : desing process model's instance
+
+            results (`Pyomo 's results instance`) : results's object of solver
+
+            solver_log (`str`) : path to solver's log file of this local
+            search (`default = None`, log file of `optsolver`)
+
+        Returns:
+                bool: True if feasible point obtained, False otherwise.
+        """
         # check alway solutions (solver status) befoore loading it
         self.nloc += 1
 
         file_path = (self.log_dir + "solver" + os.path.sep + "nloc_" +
                      str(self.nloc) + ".log")
-        self.optsolver.print_log_to_file(file_path)
+        if solver_log is None:
+            self.optsolver.print_log_to_file(file_path)
+        elif os.path.exists(solver_log):
+            shutil.copyfile(solver_log, file_path)
 
         if self.optsolver.check_solve_status(results):
             # Load solution into results object
@@ -336,7 +399,7 @@ class GlobalOptimisation:
         # my_model will be perturbed
         self.store_model_to_point(my_model, my_param)
         # then keep or save the values of actual model in a dict
-        saved_model_value = dict(self.Z_point)
+        saved_model_value = self.Z_point.copy()
         # TODO: handle case with mutltiple membranes
         Perturbation_membranes(my_model, saved_model_value,
                                self.random_generationPert, my_param,
@@ -363,6 +426,9 @@ class GlobalOptimisation:
         """
         f_current = modelisation.instance.obj()
         self.feasible = True
+        # coarse solutions (see `coarse_to_fine`) are only candidates : they
+        # are neither counted nor stored with solutions of the target model
+        exploring = self.candidates is not None
 
         # Variable stating if improving or not
         improving = False
@@ -372,27 +438,55 @@ class GlobalOptimisation:
             self.no_improve = self.no_improve + 1 if mbh_function else self.no_improve
         else:
             # New solution found
-            self.nb_point += 1
+            if not exploring:
+                self.nb_point += 1
             logger.info("New point obtained")
             self.keep_sols.append(f_current)
+            self.keep_candidate(modelisation, f_current)
+            self.synchronise_putative()
 
             # Check improvement on objective function value
             if f_current < (self.fputative - self.tol):
                 logger.info("Improvement on putative")
                 improving = True
                 self.update_putative(modelisation, f_current)
-                self.store_solution(modelisation, f_current, self.bestfile,
-                                    algo_identifier_str, mbh_function,
-                                    improving)
+                if not exploring:
+                    self.store_solution(modelisation, f_current,
+                                        self.bestfile, algo_identifier_str,
+                                        mbh_function, improving)
 
                 self.no_improve = 0 if mbh_function else self.no_improve
 
+        if exploring:
+            logger.info("obtained coarse solution, kept as candidate")
+            return
+
         # save solution in stationaryfile file
         self.store_solution(modelisation, f_current, self.stationaryfile,
                             algo_identifier_str, mbh_function, improving)
 
         logger.info("obtained solution, saved in stationaryfile")
 
+    def keep_candidate(self, modelisation, f_current):
+        """Keep the current solution if it is one of the `nb_refined` best
+        ones (only during coarse exploration, see `coarse_to_fine`).
+
+        Args:
+
+            modelisation (`mind.system.MembranesDesignModel`) : desing process model
+
+            f_current (`Float`) : value of the current objective function
+        """
+        if self.candidates is None:
+            return
+        if (len(self.candidates) == self.nb_refined and
+                f_current >= self.candidates[-1][0]):
+            return
+        self.candidates.append(
+            (f_current, modelisation.parameter.layout.capture()))
+        self.candidates.sort(key=lambda candidate: candidate[0])
+        del self.candidates[self.nb_refined:]
+
     def find_starting_solution(self,
                                modelisation,
                                max_trials_starting_points=1):
@@ -443,16 +537,23 @@ class GlobalOptimisation:
         # pre-condition : there are no solution in the model yet
         # post-condition : function return true if feasible solution found
 
-        # add an default argument which will take acount if pre-condition
-        # TODO: parallel multistart : in this case, you must remove
-        # construction method and simplified model
-
         my_model = modelisation.instance
         my_param = modelisation.parameter
         if not self.active_generationMulti:
             self.random_generationMulti.seed(seed)
             self.active_generationMulti = True
 
+        if self.nb_workers > 1:
+            return self.parallel_multistart(modelisation,
+                                            nb_points_randomized)
+
+        if self.nb_solver_processes > 1:
+            if self.optsolver.pipeline_available():
+                return self.pipelined_multistart(modelisation,
+                                                 nb_points_randomized)
+            logger.warning("No solver's executable to pipeline local "
+                           "searches : sequential multistart")
+
         # Multistart
         for i in range(1, nb_points_randomized + 1):
             # TODO: while feas trials
@@ -474,6 +575,217 @@ class GlobalOptimisation:
         # return random_generationMulti.getstate()
         return self.feasible
 
+    def parallel_multistart(self, modelisation, nb_points_randomized):
+        """Multistart whose iterations are executed by `nb_workers` processes.
+
+        Each worker process builds its own model and runs
+        `construct_starting_point` and `run_local_search` with its own seed
+        (drawn from `random_generationMulti`). Feasible points are sent back
+        and saved here, this object keeping `fputative`, `keep_sols` and
+        the best/stationary files.
+
+        Args:
+
+            modelisation (`mind.system.MembranesDesignModel`) : desing process model
+
+            nb_points_randomized (`Int`): number of starting points to generate
+
+        Returns:
+                bool: `True` if feasible point found during iterations,
+                    False otherwise.
+        """
+        my_model = modelisation.instance
+        seeds = [
+            self.random_generationMulti.randrange(2**31)
+            for _ in range(nb_points_randomized)
+        ]
+
+        with create_pool(self, modelisation, self.nb_workers) as executor:
+            futures = [executor.submit(multistart_task, seed) for seed in seeds]
+            for i, future in enumerate(as_completed(futures), start=1):
+                logger.info('')
+                logger.info("Multistart iteration {} (parallel)".format(i))
+                feasible, objective, point, stats = future.result()
+                self.add_statistics(stats)
+
+                if feasible:
+                    self.Z_point = modelisation.parameter.layout.point(point)
+                    self.restore_model_from_point(my_model)
+                    self.save_solution(modelisation,
+                                       algo_identifier_str="Multistart")
+
+        # Restore the best solution found, function 'll return with this contex
+        self.restore_model_from_point(my_model, putative=True)
+        return self.feasible
+
+    def pipelined_multistart(self, modelisation, nb_points_randomized):
+        """Multistart overlapping starting points' construction and local
+        searches.
+
+        While up to `nb_solver_processes` solver's executables (asyncio
+        subprocesses) run local searches, the next starting point is
+        constructed and its `NL` file written. Results are loaded and saved
+        in completion order.
+
+        The model's instance is only accessed by one thread (starting
+        points, `NL` files and results), the event loop spawns and waits for
+        solver's processes meanwhile.
+
+        Args:
+
+            modelisation (`mind.system.MembranesDesignModel`) : desing process model
+
+            nb_points_randomized (`Int`): number of starting points to generate
+
+        Returns:
+                bool: `True` if feasible point found during iterations,
+                    False otherwise.
+        """
+        asyncio.run(self.multistart_pipeline(modelisation,
+                                             nb_points_randomized))
+        # Restore the best solution found, function 'll return with this contex
+        self.restore_model_from_point(modelisation.instance)
+        return self.feasible
+
+    async def multistart_pipeline(self, modelisation, nb_points_randomized):
+        """Coroutine of `pipelined_multistart`.
+
+        Args:
+
+            modelisation (`mind.system.MembranesDesignModel`) : desing process model
+
+            nb_points_randomized (`Int`): number of starting points to generate
+        """
+        loop = asyncio.get_running_loop()
+        solver_processes = asyncio.Semaphore(self.nb_solver_processes)
+        local_searches = []
+        with ThreadPoolExecutor(max_workers=1) as model_thread:
+            for i in range(1, nb_points_randomized + 1):
+                logger.info('')
+                logger.info("Multistart iteration {} (pipeline)".format(i))
+                local_search = await loop.run_in_executor(
+                    model_thread, self.next_local_search, modelisation, i)
+
+                # waiting for a free solver's process (finished local
+                # searches are loaded and saved meanwhile)
+                await solver_processes.acquire()
+                local_searches.append(
+                    asyncio.ensure_future(
+                        self.pipelined_local_search(modelisation,
+                                                    local_search,
+                                                    solver_processes,
+                                                    model_thread)))
+
+            await asyncio.gather(*local_searches)
+
+    def next_local_search(self, modelisation, index):
+        """Construct a starting point and prepare its pipelined local search.
+
+        Args:
+
+            modelisation (`mind.system.MembranesDesignModel`) : desing process model
+
+            index (`Int`) : index of the local search
+
+        Returns:
+            `DICT` describing the local search (see `prepare_local_search`)
+        """
+        self.construct_starting_point(modelisation)
+        return self.prepare_local_search(modelisation.instance, index)
+
+    def prepare_local_search(self, my_model, index):
+        """Write the current point of the model in the `NL` file of a
+        pipelined local search.
+
+        Args:
+
+            my_model (`mind.system.MembranesDesignModel`) : desing process model's instance
+
+            index (`Int`) : index of the local search
+
+        Returns:
+            `DICT` describing the local search (directory, command,
+            environment, solution and log files, symbol map)
+        """
+        directory = (self.log_dir + "pipeline" + os.path.sep + "start_" +
+                     str(index) + os.path.sep)
+        os.makedirs(directory, exist_ok=True)
+        nl_file = directory + "start.nl"
+        log_file = directory + "solver.log"
+
+        symbol_map = self.optsolver.write_problem(my_model, nl_file)
+        command, env = self.optsolver.solver_command(nl_file, log_file)
+        return {
+            'directory': directory,
+            'command': command,
+            'env': env,
+            'sol_file': directory + "start.sol",
+            'log_file': log_file,
+            'symbol_map': symbol_map
+        }
+
+    async def pipelined_local_search(self, modelisation, local_search,
+                                     solver_processes, model_thread):
+        """Run solver's executable on a prepared local search, then load
+        and save its solution (in `model_thread`).
+
+        Args:
+
+            modelisation (`mind.system.MembranesDesignModel`) : desing process model
+
+            local_search (`DICT`) : local search returned by `prepare_local_search`
+
+            solver_processes (`asyncio.Semaphore`) : solver's processes
+            slots (released when the solver's process ends)
+
+            model_thread (`concurrent.futures.ThreadPoolExecutor`) : executor
+            accessing the model's instance
+        """
+        directory = local_search['directory']
+        t_i = time.time()
+        try:
+            with open(local_search['log_file'], 'w') as log:
+                process = await asyncio.create_subprocess_exec(
+                    *local_search['command'],
+                    cwd=directory,
+                    env=local_search['env'],
+                    stdout=log,
+                    stderr=asyncio.subprocess.STDOUT)
+                await process.wait()
+        finally:
+            solver_processes.release()
+        t_e = time.time()
+        logger.info("LocalSearch time = {} (pipeline)".format(t_e - t_i))
+
+        await asyncio.get_running_loop().run_in_executor(
+            model_thread, self.finish_local_search, modelisation,
+            local_search)
+
+    def finish_local_search(self, modelisation, local_search):
+        """Load and save the solution of a pipelined local search.
+
+        Args:
+
+            modelisation (`mind.system.MembranesDesignModel`) : desing process model
+
+            local_search (`DICT`) : local search returned by `prepare_local_search`
+        """
+        directory = local_search['directory']
+        results = self.optsolver.read_solution(local_search['sol_file'],
+                                               local_search['symbol_map'])
+        # knitro writes its own log in its working directory
+        solver_log = directory + "knitro.log"
+        if not os.path.exists(solver_log):
+            solver_log = local_search['log_file']
+
+        feasible = self.load_local_search(modelisation.instance, results,
+                                          solver_log)
+        if feasible:
+            self.save_solution(modelisation, algo_identifier_str="Multistart")
+
+        if not self.debug_mode:
+            shutil.rmtree(directory, ignore_errors=True)
+
     def mbh(self,
             modelisation,
             max_trials_starting_points,
@@ -615,6 +927,11 @@ class GlobalOptimisation:
             self.random_generationPert.seed(seed2)
             self.active_generationPert = True
 
+        if self.nb_workers > 1:
+            return self.parallel_global_optimisation(
+                modelisation, max_trials_starting_points, max_no_improve,
+                nb_points_randomized)
+
         # Multistart
         for t in range(1, nb_points_randomized + 1):
             print("-------------------------------------")
@@ -643,6 +960,147 @@ class GlobalOptimisation:
         # return random_generationMulti.getstate()
         return self.feasible
 
+    def parallel_global_optimisation(self, modelisation,
+                                     max_trials_starting_points,
+                                     max_no_improve, nb_points_randomized):
+        """`global_optimisation_algorithm` whose chains (starting point
+        followed by `mbh`) are executed by `nb_workers` processes.
+
+        A new chain is started as soon as a process is free. The best
+        objective function value is shared between processes, so the
+        improvement test of every chain is done against the global best.
+
+        Args:
+            modelisation (`mind.system.MembranesDesignModel`) : desing process model
+
+            max_trials_starting_points (`Int`): maximal number of trials
+
+            max_no_improve (`Int`): Terminaison condition of `mbh`
+
+            nb_points_randomized (`Int`): number of chains
+
+        Returns:
+                bool: `True` if feasible point found during iterations,
+                    False otherwise.
+        """
+        my_model = modelisation.instance
+        seeds = [(self.random_generationMulti.randrange(2**31),
+                  self.random_generationPert.randrange(2**31))
+                 for _ in range(nb_points_randomized)]
+        incumbent = multiprocessing.Value('d', self.fputative)
+
+        with create_pool(self, modelisation, self.nb_workers,
+                         incumbent) as executor:
+            futures = [
+                executor.submit(mbh_chain_task, seed1, seed2,
+                                max_trials_starting_points, max_no_improve)
+                for seed1, seed2 in seeds
+            ]
+            for t, future in enumerate(as_completed(futures), start=1):
+                print("-------------------------------------")
+                logger.info("Global optimization chain {} done".format(t))
+                print("-------------------------------------")
+                feasible, objective, point, objectives, stats = future.result()
+                self.add_statistics(stats)
+
+                if point is not None:
+                    self.Z_point = modelisation.parameter.layout.point(point)
+                    self.restore_model_from_point(my_model)
+                    self.save_solution(modelisation, "IMP MBH", True)
+                elif not feasible:
+                    logger.info("No feasible starting point obtained")
+
+                # solutions only kept by the worker's stationary file
+                for f_current in objectives:
+                    if f_current not in self.keep_sols:
+                        self.feasible = True
+                        if self.candidates is None:
+                            self.nb_point += 1
+                        self.keep_sols.append(f_current)
+
+        # Restore the best solution found, function 'll return with this contex
+        self.restore_model_from_point(my_model, putative=True)
+        return self.feasible
+
+    def run_algorithm(self, algorithm, modelisation, *args):
+        """Execute an algorithm, on a coarse model first if `coarse_cells`
+        is set.
+
+        Args:
+
+            algorithm (`callable`) : algorithm method (ex: `self.multistart`)
+
+            modelisation (`mind.system.MembranesDesignModel`) : desing process model
+
+            args : others arguments of `algorithm`
+
+        Returns:
+                bool: `True` if feasible point found, False otherwise.
+        """
+        if self.coarse_cells:
+            return self.coarse_to_fine(algorithm, modelisation, *args)
+        return algorithm(modelisation, *args)
+
+    def coarse_to_fine(self, algorithm, modelisation, *args):
+        """Explore with `algorithm` on a coarse discretisation of membranes,
+        then refine the `nb_refined` best solutions found.
+
+        Each refined solution is interpolated on the target discretisation
+        (`mind.multiresolution.ResolutionTransfer`) and used as starting
+        point of a local search on `modelisation`. Only refined solutions
+        are counted, stored in solutions files and kept as putative
+        solutions.
+
+        Args:
+
+            algorithm (`callable`) : exploration algorithm (ex: `self.multistart`)
+
+            modelisation (`mind.system.MembranesDesignModel`) : desing process model
+
+            args : others arguments of `algorithm`
+
+        Returns:
+                bool: `True` if feasible point found at target
+                discretisation, False otherwise.
+        """
+        coarse = build_coarse_model(modelisation, self.coarse_cells)
+        if coarse is None:
+            logger.info("Discretisation already coarse : no refinement")
+            return algorithm(modelisation, *args)
+
+        # exploration
+        self.candidates = []
+        try:
+            algorithm(coarse, *args)
+        finally:
+            candidates = self.candidates
+            self.candidates = None
+        logger.info("Coarse exploration : %d candidates to refine",
+                    len(candidates))
+
+        # coarse solutions are not solutions of the target model
+        self.feasible = False
+        self.fputative = 10e6
+        self.putative_solution = {}
+        self.keep_sols = []
+
+        transfer = ResolutionTransfer(coarse, modelisation)
+        for rank, (f_coarse, point) in enumerate(candidates, start=1):
+            logger.info('')
+            logger.info("Refinement {} (coarse obj = {})".format(
+                rank, f_coarse))
+            point.restore()
+            transfer.apply()
+            feasible = self.run_local_search(modelisation.instance)
+            if feasible:
+                self.save_solution(modelisation,
+                                   algo_identifier_str="Refinement")
+
+        if self.putative_solution:
+            self.restore_model_from_point(modelisation.instance,
+                                          putative=True)
+        return self.feasible
+
     def store_model_to_point(self, model, parameter):
         """Store the current model.
 
@@ -654,6 +1112,10 @@ class GlobalOptimisation:
 
             parameter (`mind.builder.Configuration`) : design process configuration
         """
+        if parameter.layout is not None and parameter.layout.model is model:
+            self.Z_point = parameter.layout.capture()
+            return
+
         self.Z_point = {}
         for var in model.component_data_objects(pe.Var):
             # logger.info('variable %s', var)
@@ -672,7 +1134,10 @@ class GlobalOptimisation:
         try:
             """ Loading the solution keeped.
             from attribute z.point to the model."""
-            if putative:
+            point = self.putative_solution if putative else self.Z_point
+            if isinstance(point, Point):
+                point.restore(model)
+            elif putative:
                 for cuid, val in self.putative_solution.items():
                     model.find_component(cuid).value = val
             else:
@@ -710,6 +1175,39 @@ class GlobalOptimisation:
                 self.n_unfeas_simpl))
         logger.info("Number of unfeasible solution:  {}".format(self.n_unfeas))
 
+    def statistics(self, since=None):
+        """Local search counters of this solver.
+
+        Args:
+
+            since (`DICT`) : counters previously returned, if given the
+            difference with it is returned (`default = None`)
+
+        Returns:
+            dict of `nloc`, `nloc_simpl`, `n_unfeas` and `n_unfeas_simpl`
+        """
+        stats = {
+            'nloc': self.nloc,
+            'nloc_simpl': self.nloc_simpl,
+            'n_unfeas': self.n_unfeas,
+            'n_unfeas_simpl': self.n_unfeas_simpl
+        }
+        if since:
+            stats = {key: value - since[key] for key, value in stats.items()}
+        return stats
+
+    def add_statistics(self, stats):
+        """Add local search counters (ex: obtained by worker processes).
+
+        Args:
+
+            stats (`DICT`) : counters returned by `statistics`
+        """
+        self.nloc += stats['nloc']
+        self.nloc_simpl += stats['nloc_simpl']
+        self.n_unfeas += stats['n_unfeas']
+        self.n_unfeas_simpl += stats['n_unfeas_simpl']
+
     def update_putative(self, modelisation, f_current):
         """Update the value of best know objective function.
 
@@ -724,9 +1222,23 @@ class GlobalOptimisation:
             self.fputative, f_current))
 
         self.fputative = f_current
+        if self.incumbent is not None:
+            with self.incumbent.get_lock():
+                if f_current < self.incumbent.value:
+                    self.incumbent.value = f_current
         # We get a new centrer point, then store it
         self.store_model_to_point(modelisation.instance, modelisation.parameter)
-        self.putative_solution = dict(self.Z_point)
+        self.putative_solution = self.Z_point.copy()
+
+    def synchronise_putative(self):
+        """Get the best objective function value found by other processes.
+
+        Nothing is done when `incumbent` is not shared.
+        """
+        if self.incumbent is not None:
+            with self.incumbent.get_lock():
+                if self.incumbent.value < self.fputative:
+                    self.fputative = self.incumbent.value
 
     def store_solution(self,
                        modelisation,
@@ -883,6 +1395,9 @@ class GlobalOptimisation:
             generations (`Int`) : number of generations to create
         """
 
+        # genetic algorithm (clustering) loaded only when used
+        from mind.genetic import Population
+
         if self.evolutionary_algorithm is None:
             self.evolutionary_algorithm = Population(self, modelisation)
         self.evolutionary_algorithm.run(pop_size, generations)
@@ -899,6 +1414,8 @@ class GlobalOptimisation:
 
             n1_element (`Int`) : number of population list handled.
         """
+        from mind.population import PopAlgortihm
+
         if self.evolutionary_algorithm is None:
             self.evolutionary_algorithm = PopAlgortihm(self, instance_file)
         self.evolutionary_algorithm.run(modelisation, n1_element)
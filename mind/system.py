@@ -4,6 +4,7 @@ This module contain common part of model shared by liquid and gas model.
 """
 
 from abc import ABC, abstractmethod
+from collections import defaultdict
 import logging
 from sys import exit
 
@@ -13,7 +14,9 @@ try:
 except Exception:
     exit("Sorry, invalid version of pyomo (>= 5.7.3)")
 
+from mind.datacache import parsed_data
 from mind.optmodel_utilities import initZero
+from mind.snapshot import VariableLabels, VariableLayout
 
 # logging variable
 logger = logging.getLogger(__name__)
@@ -68,10 +71,45 @@ class MembranesDesignModel(ABC):
         self.abstractModel.n = pe.Param(default=200,
                                         initialize=max(
                                             self.parameter.discretisation))
-        # set of pieces of the division of each membrane
-        self.abstractModel.N = pe.RangeSet(self.abstractModel.n)
-        # set of pieces of the division of each membrane except last one
-        self.abstractModel.N_minuslast = pe.RangeSet(self.abstractModel.n - 1)
+        # (membrane, piece) pairs of the division of each membrane
+        # (each membrane has its own number of pieces)
+        def cells_rule(model):
+            return [(s, i)
+                    for s in model.states
+                    for i in range(1, self.parameter.discretisation[s - 1] + 1)]
+
+        self.abstractModel.cells = pe.Set(dimen=2,
+                                          ordered=True,
+                                          initialize=cells_rule)
+
+        # same except last piece of each membrane
+        def cells_minuslast_rule(model):
+            return [(s, i)
+                    for s in model.states
+                    for i in range(1, self.parameter.discretisation[s - 1])]
+
+        self.abstractModel.cells_minuslast = pe.Set(
+            dimen=2, ordered=True, initialize=cells_minuslast_rule)
+
+        # (membrane, component, piece) of the division of each membrane
+        def component_cells_rule(model):
+            return [(s, j, i)
+                    for s in model.states
+                    for j in model.components
+                    for i in range(1, self.parameter.discretisation[s - 1] + 1)]
+
+        self.abstractModel.component_cells = pe.Set(
+            dimen=3, ordered=True, initialize=component_cells_rule)
+
+        # same except last piece of each membrane
+        def component_cells_minuslast_rule(model):
+            return [(s, j, i)
+                    for s in model.states
+                    for j in model.components
+                    for i in range(1, self.parameter.discretisation[s - 1])]
+
+        self.abstractModel.component_cells_minuslast = pe.Set(
+            dimen=3, ordered=True, initialize=component_cells_minuslast_rule)
         # flow rate of a FEED
         self.abstractModel.FEED = pe.Param()
         # fractions of the components in the FEED
@@ -401,47 +439,40 @@ class MembranesDesignModel(ABC):
         self.abstractModel.simplified_obj = pe.Objective(expr=0,
                                                          sense=pe.minimize)
 
-    def __insert_datafile_line(self, fname, insert_position=3):
-        """Insert number of states and mem_types_set necessary to
-        datafile in some position."""
-        f = open(fname, "r")
-        contents = f.readlines()
-        f.close()
+    def load_instance_data(self, fname):
+        """Load the instance datafile (read-only) with generated sets.
 
-        # Insert number of states
-        states = list(range(1, self.parameter.num_membranes + 1))
-        states = ' '.join(str(ind) for ind in states)
-        txt = "set states := " + states + ";\n"
-        # insert txt value in insert_position
-        contents.insert(insert_position, txt)
+        Sets of states (membranes) and of membranes types are not in the
+        datafile : they are added to the loaded data, the datafile is never
+        rewritten, so several models can be built from the same file at the
+        same time. The datafile is parsed once by process (see
+        `mind.datacache`).
 
-        # Insert states and mem_type information
-        type_mem = list(self.permeability_data.keys())
-        type_mem = ' '.join("\"{}\"".format(item) for item in type_mem)
-        txt = "set mem_types_set := " + type_mem + ";\n"
-        # insert txt value in insert_position
-        contents.insert(insert_position, txt)
-
-        f = open(self.filename, "w")
-        contents = ''.join(contents)
-
-        f.write(contents)
-        f.close()
-
-    def __delete_datafile_line(self, delete_position=3):
-        """Insert number of states necessary to datafile in some position."""
-        f = open(self.filename, "r")
-        contents = f.readlines()
-        f.close()
-
-        # Delete two consecutives lines
-        contents = contents[:delete_position] + contents[delete_position + 2:]
+        Args:
+            fname (`str`) : input filename containing instance description
 
-        f = open(self.filename, "w")
-        contents = ''.join(contents)
+        Returns:
+            `dict` of data by namespace (`pyomo.environ.DataPortal` format)
+        """
 
-        f.write(contents)
-        f.close()
+        def parse(filename):
+            data = pe.DataPortal(model=self.abstractModel)
+            data.load(filename=filename)
+            return {
+                namespace: data.data(namespace=namespace)
+                for namespace in data.namespaces()
+            }
+
+        data = parsed_data.load('instance', fname, parse,
+                                self.parameter.pickle_data)
+        generated = data.setdefault(None, {})
+        generated['states'] = {
+            None: list(range(1, self.parameter.num_membranes + 1))
+        }
+        generated['mem_types_set'] = {
+            None: list(self.permeability_data.keys())
+        }
+        return data
 
     def __test_coherence_parameter_data(self):
         if (self.instance.pressure_in.value > self.instance.lb_press_up.value
@@ -552,13 +583,15 @@ class MembranesDesignModel(ABC):
 
     def generate_labels_and_initvars(self):
         """Generation of variables labels and initialization of variables."""
-        # Generate vars_init_status dictionary elements
-        # which tracks variables initialization status
-        self.parameter.labels = ComponentUID.generate_cuid_string_map(
-            self.instance)
+        # labels are generated when looked up (cells variables never are)
+        self.parameter.labels = VariableLabels(self.instance)
+        self.parameter.layout = VariableLayout(self.instance,
+                                               self.parameter.labels)
 
-        for var in self.instance.component_data_objects(pe.Var, active=True):
-            self.parameter.init_status[self.parameter.labels[var]] = False
+        # vars_init_status tracks variables initialization status
+        # (not initialised unless set)
+        self.parameter.init_status = defaultdict(bool,
+                                                 self.parameter.init_status)
 
     def create_process_instance(self, fname):
         """Creation of design process model's instance (`PYOMO construction`).
@@ -567,11 +600,9 @@ class MembranesDesignModel(ABC):
             fname (`str`) : input filename containing instance description
         """
         # assert self.abstractModel is an abstractmodel
-        # update this self.filename with the number of membranes
-        self.__insert_datafile_line(fname, insert_position=3)
-
         try:
-            self.instance = self.abstractModel.create_instance(self.filename)
+            self.instance = self.abstractModel.create_instance(
+                data=self.load_instance_data(fname))
 
         except Exception as e:
             logger.exception('Problem with file format %s', fname)
@@ -600,11 +631,6 @@ class MembranesDesignModel(ABC):
             # deactivate simplified model objective
             self.instance.simplified_obj.deactivate()
 
-
-        finally:
-            # states are already initialized via fname
-            self.__delete_datafile_line(delete_position=3)
-
     def __flow_conservation_overall_sytem_constraint(self):
         """ System flow conservation :
             FEED equals output (RET+PERM). """
@@ -0,0 +1,209 @@
+"""Cells formulations against the baseline model (flows and fractions).
+
+Each formulation is built on a `data/` instance, a profile solving the
+cells equations of each membrane is stored in its cells variables and
+cells constraints (`cells_contraints`) are evaluated : every formulation
+must be satisfied by the baseline's solution.
+"""
+
+import os
+
+import numpy as np
+import pyomo.environ as pe
+import pytest
+from scipy.optimize import brentq
+
+from mind.builder import Configuration, build_model
+from mind.random_initialisation import cell_profile
+
+DATA = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir,
+                    'data')
+INSTANCE = ('N2Capture.dat', 'N2Capture_fix_perm.dat', 'N2Capture_eco.dat')
+# ragged discretisation : 20 and 25 cells
+AREAS = [20, 25]
+
+FORMULATIONS = {
+    'baseline': {},
+    'alias_cells': {'alias_cells': True},
+    'component_flows': {'component_flows': True},
+    'component_flows_alias': {'component_flows': True, 'alias_cells': True},
+    'binary_mixture': {'binary_mixture': True},
+    # one Radau point by element : equations of cells
+    'collocation': {'collocation': 1, 'finite_elements': 20},
+}
+
+
+def build(tmp_path, **options):
+    parameter = Configuration(num_membranes=2,
+                              ub_area=AREAS,
+                              lb_area=[1, 1],
+                              ub_acell=[1, 1],
+                              variable_perm=False,
+                              **options)
+    fname, perm_filename, fname_eco = (os.path.join(DATA, name)
+                                       for name in INSTANCE)
+    return build_model(parameter, fname, perm_filename, fname_eco,
+                       str(tmp_path) + os.path.sep)
+
+
+def solve_cell(feed, xin, coefficients, pressure_up, pressure_down):
+    """Permeated component flows of a cell (cells equations of the
+    baseline model, given its inlet)."""
+
+    def permeated(flux_perm):
+        flux_ret = feed - flux_perm
+        return (coefficients * pressure_up * feed * xin / flux_ret /
+                (1 + coefficients * pressure_up / flux_ret +
+                 coefficients * pressure_down / flux_perm))
+
+    def residual(flux_perm):
+        return permeated(flux_perm).sum() - flux_perm
+
+    # physical root : first sign change from a null permeated flow
+    grid = feed * np.linspace(1e-9, 1 - 1e-9, 2001)
+    values = [residual(flux_perm) for flux_perm in grid]
+    k = next(k for k in range(len(grid) - 1)
+             if values[k] > 0 >= values[k + 1])
+    return permeated(brentq(residual, grid[k], grid[k + 1], xtol=1e-14))
+
+
+def set_solution(modelisation):
+    """Store a solution of cells equations of each membrane (membranes
+    levels values are set in the middle of their bounds)."""
+    instance = modelisation.instance
+    parameter = modelisation.parameter
+    components = list(instance.components)
+    permeance_areas = modelisation.membrane_behavior.permeance_areas(
+        parameter)
+    profile = cell_profile(instance, parameter)
+    xin = np.array([pe.value(instance.XIN[j]) for j in components])
+
+    # uniform pressure up (default configuration)
+    instance.pressure_up.set_value(
+        (instance.pressure_up.lb + instance.pressure_up.ub) / 2)
+    for s in instance.states:
+        instance.area[s].set_value(AREAS[s - 1] / 2)
+        instance.pressure_down[s].set_value(
+            (instance.pressure_down[s].lb + instance.pressure_down[s].ub) / 2)
+        instance.Feed_mem[s].set_value(pe.value(instance.FEED) / s)
+        for k, j in enumerate(components):
+            instance.XIN_mem[s, j].set_value(xin[k])
+
+        type_mem = instance.mem_type[s].value
+        nb_cells = parameter.discretisation[s - 1]
+        cells = range(1, nb_cells + 1)
+        coefficients = np.array([[
+            pe.value(value)
+            for value in permeance_areas(instance, s, j, type_mem, cells)
+        ] for j in components]).T
+
+        feed = np.zeros(nb_cells)
+        flux_ret = np.zeros(nb_cells)
+        flux_perm = np.zeros(nb_cells)
+        x_in = np.zeros((nb_cells, len(components)))
+        x_ret = np.zeros_like(x_in)
+        x_perm = np.zeros_like(x_in)
+        inlet, composition = instance.Feed_mem[s].value, xin
+        for i in range(nb_cells):
+            permeated = solve_cell(inlet, composition, coefficients[i],
+                                   pe.value(instance.pressure_up),
+                                   instance.pressure_down[s].value)
+            feed[i], x_in[i] = inlet, composition
+            flux_perm[i] = permeated.sum()
+            x_perm[i] = permeated / flux_perm[i]
+            flux_ret[i] = inlet - flux_perm[i]
+            x_ret[i] = (inlet * composition - permeated) / flux_ret[i]
+            inlet, composition = flux_ret[i], x_ret[i]
+        profile.store(s, feed, flux_ret, flux_perm, x_in, x_ret, x_perm)
+
+        instance.Flux_RET_mem[s].set_value(flux_ret[-1])
+        instance.Flux_PERM_mem[s].set_value(flux_perm.sum())
+        for k, j in enumerate(components):
+            instance.X_RET_mem[s, j].set_value(x_ret[-1, k])
+            instance.X_PERM_mem[s, j].set_value(
+                (flux_perm * x_perm[:, k]).sum() / flux_perm.sum())
+
+
+def violation(constraint):
+    """Violation of a constraint (data) at the current point."""
+    body = pe.value(constraint.body)
+    lower = pe.value(constraint.lower)
+    upper = pe.value(constraint.upper)
+    return max(0. if lower is None else lower - body,
+               0. if upper is None else body - upper, 0.)
+
+
+def max_violation(constraints):
+    return max(
+        violation(constraint) for component in constraints
+        for constraint in component.values())
+
+
+def size(instance, ctype):
+    """Number of components data of a type (ex: `pe.Var`)."""
+    return sum(1 for _ in instance.component_data_objects(ctype))
+
+
+@pytest.fixture(scope='module')
+def models(tmp_path_factory):
+    tmp_path = tmp_path_factory.mktemp('log')
+    return {
+        name: build(tmp_path, **options)
+        for name, options in FORMULATIONS.items()
+    }
+
+
+def test_ragged_cells(models):
+    instance = models['baseline'].instance
+    assert models['baseline'].parameter.discretisation == AREAS
+    for s, nb_cells in enumerate(AREAS, 1):
+        assert [i for (mem, i) in instance.cells if mem == s] == list(
+            range(1, nb_cells + 1))
+    assert len(instance.component_cells) == (len(instance.components) *
+                                             sum(AREAS))
+
+
+@pytest.mark.parametrize('name', sorted(FORMULATIONS))
+def test_baseline_solution(models, name):
+    modelisation = models[name]
+    set_solution(modelisation)
+    assert max_violation(modelisation.cells_contraints()) < 1e-8
+
+
+def test_aliased_sizes(models):
+    baseline = models['baseline'].instance
+    aliased = models['alias_cells'].instance
+    inputs = len(baseline.Feed_cell) + len(baseline.XIN_cell)
+    connections = sum(
+        len(getattr(baseline, name))
+        for name in ('ConnectionFeeds_cellMem', 'ConnectionPercinsMem',
+                     'connetionFeed_FeedCell', 'xinPercin'))
+    assert size(baseline, pe.Var) - size(aliased, pe.Var) == inputs
+    assert (size(baseline, pe.Constraint) -
+            size(aliased, pe.Constraint)) == connections
+
+
+def test_binary_sizes(models):
+    baseline = models['baseline'].instance
+    binary = models['binary_mixture'].instance
+    # fractions of the second component are expressions
+    fractions = 3 * (len(baseline.component_cells) - len(baseline.cells))
+    assert size(baseline, pe.Var) - size(binary, pe.Var) == fractions
+
+
+def test_component_flows_without_permeation(models):
+    """A cell without permeated flow is not a solution of the permeability
+    equation (retentate of the cell is not at equilibrium)."""
+    modelisation = models['component_flows']
+    instance = modelisation.instance
+    set_solution(modelisation)
+    s, i = 1, 5
+    for j in instance.components:
+        instance.Flux_RET_comp_cell[s, j, i].set_value(
+            pe.value(instance.Feed_comp_cell[s, j, i]))
+        instance.Flux_PERM_comp_cell[s, j, i].set_value(0.)
+        instance.X_PERM_cell[s, j, i].set_value(
+            pe.value(instance.X_RET_cell[s, j, i]))
+    assert max(
+        violation(instance.mainEquationMem[s, j, i])
+        for j in instance.components) > 1e-3